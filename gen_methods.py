@@ -6,13 +6,38 @@ from pysui.generate.generate_api_methods import (
     open_api_data,
     create_file,
 )
-from pysui.generate.template import imports_constants, method_blank
-
+from pysui.generate.generate_models import create_models_file
+from pysui.generate.template import (
+    imports_constants,
+    method_blank,
+    async_imports_constants,
+    async_method_blank,
+    client_imports_constants,
+    client_method_blank,
+    models_imports,
+    model_blank,
+    models_footer,
+)
 
 data_fn = join(json_out, api_data_fn)
 py_fn = join("pysui", "methods", "rpc_methods.py")
+async_py_fn = join("pysui", "methods", "async_rpc_methods.py")
+client_py_fn = join("pysui", "methods", "client_methods.py")
+models_py_fn = join("pysui", "models", "models.py")
 
 # From File (to analyse) or Direct from API (straight create)...
-# data = open_api_data(data_fn)["methods"]
-data = create_api_data(data_fn, api_url)["methods"]
+# api_data = open_api_data(data_fn)
+api_data = create_api_data(data_fn, api_url)
+data = api_data["methods"]
+create_models_file(models_py_fn, api_data, models_imports, model_blank, models_footer)
 create_file(py_fn, data, imports_constants, method_blank)
+create_file(
+    async_py_fn, data, async_imports_constants, async_method_blank, arg_indent=" " * 12
+)
+create_file(
+    client_py_fn,
+    data,
+    client_imports_constants,
+    client_method_blank,
+    arg_indent=" " * 12,
+)
@@ -0,0 +1,173 @@
+import aiohttp
+
+from pysui.client.cache import make_key
+from pysui.client.singleflight import AsyncSingleFlight
+from pysui.methods.async_rpc_methods import AsyncRPCMethods
+from pysui.rpc.async_request import async_rpc_request
+from pysui.rpc.method_kinds import WRITE_METHODS
+from pysui.rpc.request import _default_endpoint, _default_timeout
+from pysui.rpc.retry import RetryPolicy, attempt_timeout
+from pysui.rpc.stream import _default_chunk_size, async_stream_result
+
+_default_pool_maxsize = 100
+_default_keepalive = 30
+
+
+class AsyncSuiClient(AsyncRPCMethods):
+    """
+    asyncio SUI RPC client
+
+    Every SUI RPC method is available as a coroutine, e.g.
+    `await client.get_object(object_id)`. All calls share one aiohttp
+    connection pool so a single event loop can keep many requests in flight.
+
+    Parameters
+    ----------
+    endpoint: :obj:`str`, optional
+        Endpoint to send requests to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    pool_maxsize: :obj:`int`, optional
+        Maximum number of simultaneous connections
+    keepalive: :obj:`int`, optional
+        Seconds an idle connection is kept open for reuse
+    session: :obj:`aiohttp.ClientSession`, optional
+        Use an existing session instead of creating one, it is not closed by the client
+    retry: :obj:`bool` or :obj:`RetryPolicy`, optional
+        Retry transient failures, True uses a default RetryPolicy
+    rate_limit: :obj:`RateLimiter`, optional
+        Client side rate limits per endpoint for reads and writes
+    coalesce: :obj:`bool`, optional
+        Concurrent identical reads (same endpoint, method and params) share
+        one request and receive the same result object
+    models: :obj:`bool`, optional
+        Return results as response models (see pysui.models.models) instead
+        of decoded JSON
+    """
+
+    def __init__(
+        self,
+        endpoint=_default_endpoint,
+        timeout=_default_timeout,
+        pool_maxsize=_default_pool_maxsize,
+        keepalive=_default_keepalive,
+        session=None,
+        retry=False,
+        rate_limit=None,
+        coalesce=True,
+        models=False,
+    ):
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.keepalive = keepalive
+        self._session = session
+        self._owns_session = session is None
+        self.retry = RetryPolicy() if retry is True else retry or None
+        self.rate_limit = rate_limit
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        self.models = models
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Shared session, created on first use inside the running event loop
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_maxsize, keepalive_timeout=self.keepalive
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._owns_session = True
+        return self._session
+
+    async def rpc_request(
+        self, method, params=None, endpoint=None, timeout=None
+    ) -> dict:
+        """
+        RPC request through the shared session
+
+        Parameters
+        ---------
+        method: str
+            RPC Method to call
+        params: :obj:`list`, optional
+            Parameters for the RPC method
+        endpoint: :obj:`str`, optional
+            Override the client endpoint for this call
+        timeout: :obj:`int`, optional
+            Override the client timeout for this call
+
+        Returns
+        -------
+        dict
+            Dictionary representation of RPC response
+
+        See Also
+        --------
+        pysui.rpc.async_request.async_rpc_request
+        """
+
+        endpoint = endpoint or self.endpoint
+
+        async def attempt(remaining=None):
+            if self.rate_limit is not None:
+                await self.rate_limit.acquire_async(endpoint, [method])
+            return await async_rpc_request(
+                self.session,
+                method,
+                params,
+                endpoint=endpoint,
+                timeout=attempt_timeout(timeout or self.timeout, remaining),
+            )
+
+        def request():
+            if self.retry is None:
+                return attempt()
+            return self.retry.call_async(attempt, method)
+
+        if self.single_flight is None or method in WRITE_METHODS:
+            return await request()
+        return await self.single_flight.do(
+            (endpoint, make_key(method, params or [])), request
+        )
+
+    def iter_result(
+        self,
+        method,
+        params=None,
+        endpoint=None,
+        timeout=None,
+        chunk_size=_default_chunk_size,
+    ):
+        """
+        Async generator of the elements of the `result` array of an RPC method,
+        decoded as they arrive, e.g.
+        `async for seq, digest in client.iter_result("sui_getTransactionsInRange", [0, n])`
+
+        See Also
+        --------
+        pysui.rpc.stream.async_stream_result
+        """
+        return async_stream_result(
+            self.session,
+            method,
+            params,
+            endpoint or self.endpoint,
+            timeout or self.timeout,
+            chunk_size,
+        )
+
+    async def close(self) -> None:
+        """
+        Close the underlying session if the client created it
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
@@ -0,0 +1,137 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from os.path import exists
+
+from pysui.tools import file_op
+
+_default_maxsize = 10000
+_default_ttl = 3600
+
+_MISSING = object()
+
+
+def make_key(method: str, params: list) -> str:
+    """
+    Cache key for an RPC call
+    """
+    return f"{method}:{json.dumps(params, sort_keys=True)}"
+
+
+class LRUCache:
+    """
+    Thread safe bounded LRU cache whose entries expire after `ttl` seconds
+
+    Values are copied in and out, so callers may modify what they store or get
+    without changing the cached entry.
+
+    Parameters
+    ----------
+    maxsize: :obj:`int`, optional
+        Maximum number of entries, least recently used entries are evicted first
+    ttl: :obj:`int`, optional
+        Seconds an entry stays valid, None to never expire
+    fn: :obj:`str`, optional
+        JSON file (without extension) to load entries from and `save` them to
+    """
+
+    def __init__(self, maxsize=_default_maxsize, ttl=_default_ttl, fn=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.fn = fn
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if fn is not None and exists(f"{fn}.json"):
+            self.load()
+
+    def get(self, key, default=None):
+        """
+        Return the cached value for `key`, or `default` if missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                value, expires = entry
+                if expires is None or expires > now:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return deepcopy(value)
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl=_MISSING) -> None:
+        """
+        Store `value` under `key`, optionally with a ttl other than the default
+        """
+        ttl = self.ttl if ttl is _MISSING else ttl
+        expires = None if ttl is None else time.time() + ttl
+        value = deepcopy(value)
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        """
+        Returns
+        -------
+        dict
+            size, hits, misses and hit_ratio of the cache
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return dict(
+                size=len(self._data),
+                hits=self.hits,
+                misses=self.misses,
+                hit_ratio=self.hits / lookups if lookups else 0.0,
+            )
+
+    def save(self, fn: str = None) -> None:
+        """
+        Persist unexpired entries to `fn`.json (defaults to the cache file)
+        """
+        fn = fn or self.fn
+        if fn is None:
+            raise ValueError("No file to save cache to")
+        now = time.time()
+        with self._lock:
+            entries = [
+                [key, value, expires]
+                for key, (value, expires) in self._data.items()
+                if expires is None or expires > now
+            ]
+        file_op.save_json(fn, entries)
+
+    def load(self, fn: str = None) -> None:
+        """
+        Load entries from `fn`.json (defaults to the cache file), skipping expired ones
+        """
+        fn = fn or self.fn
+        now = time.time()
+        entries = file_op.open_json(fn)
+        with self._lock:
+            for key, value, expires in entries:
+                if expires is None or expires > now:
+                    self._data[key] = (value, expires)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
@@ -0,0 +1,682 @@
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+from pysui.client.cache import LRUCache, _default_maxsize, _default_ttl, make_key
+from pysui.client.metrics import Metrics
+from pysui.client.object_cache import ObjectCache, _default_latest_ttl
+from pysui.client.pagination import (
+    _default_event_count,
+    _default_event_window,
+    _default_page_size,
+    iter_events,
+    iter_transactions_in_range,
+)
+from pysui.client.singleflight import SingleFlight
+from pysui.exceptions.exceptions import InvalidRPCReplyError
+from pysui.methods.client_methods import RPCMethods
+from pysui.rpc.balancer import (
+    LEAST_LATENCY,
+    EndpointPool,
+    _default_health_interval,
+)
+from pysui.rpc.breaker import CircuitBreakers
+from pysui.rpc.exceptions import (
+    CircuitOpenError,
+    RequestsError,
+    RequestsTimeoutError,
+    RPCError,
+)
+from pysui.rpc.hedging import HedgePolicy
+from pysui.rpc.lazy import LazyResponse, lazy_rpc_request
+from pysui.rpc.method_kinds import (
+    BUILD_METHODS,
+    EXECUTE_METHODS,
+    IMMUTABLE_METHODS,
+    OBJECT_METHODS,
+    WRITE_METHODS,
+)
+from pysui.rpc.request import (
+    _default_batch_size,
+    _default_endpoint,
+    _default_timeout,
+    batch_request,
+    rpc_request,
+)
+from pysui.rpc.retry import RetryPolicy, attempt_timeout
+from pysui.rpc.session import SessionPool
+from pysui.rpc.stream import _default_chunk_size, stream_result
+
+_default_max_workers = 10
+
+
+class SuiClient(RPCMethods):
+    """
+    Stateful SUI RPC client
+
+    Holds the endpoint, timeout, connection pool, caches and metrics once so
+    calls no longer need to thread `endpoint` / `timeout` through, e.g.
+    `client.get_object(object_id)`. Every SUI RPC method is bound to the client.
+
+    Results of immutable, digest keyed methods (see `IMMUTABLE_METHODS`) are
+    served from a bounded LRU cache and get_object / get_raw_object from a
+    version aware ObjectCache that follows the effects of executed
+    transactions, pass `bypass_cache=True` to refetch.
+
+    Given a list of `endpoints`, reads are routed across them by an
+    EndpointPool while state changing methods (see `WRITE_METHODS`) stay
+    pinned to `endpoint`.
+
+    Parameters
+    ----------
+    endpoint: :obj:`str`, optional
+        Endpoint to send requests to, the write endpoint if `endpoints` is given
+    endpoints: :obj:`list`, optional
+        Endpoints to route reads across, defaults to `endpoint` alone
+    strategy: :obj:`str`, optional
+        Read routing strategy, `least_latency` or `least_in_flight`
+    health_interval: :obj:`int`, optional
+        Seconds between endpoint health checks, 0 disables them. A drained
+        endpoint is then only tried again after the EndpointPool cooldown
+    hedge: :obj:`bool` or :obj:`HedgePolicy`, optional
+        Hedge reads across `endpoints`, True uses a default HedgePolicy
+    retry: :obj:`bool` or :obj:`RetryPolicy`, optional
+        Retry transient failures, True uses a default RetryPolicy. With
+        `endpoints`, a retried read goes to an endpoint that has not failed yet
+    breaker: :obj:`bool` or :obj:`CircuitBreakers`, optional
+        Guard every endpoint with a circuit breaker, True uses default
+        CircuitBreakers. Requests to an endpoint with an open breaker fail fast
+        with CircuitOpenError and reads are routed to the other `endpoints`
+    rate_limit: :obj:`RateLimiter`, optional
+        Client side rate limits per endpoint for reads and writes, requests
+        wait for a token instead of being throttled by the node
+    coalesce: :obj:`bool`, optional
+        Concurrent identical reads (same endpoint, method and params) share
+        one request and receive the same result object
+    models: :obj:`bool`, optional
+        Return results as response models (see pysui.models.models) instead
+        of decoded JSON
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+    pool: :obj:`SessionPool`, optional
+        Connection pool, a private pool is created if not given
+    cache_size: :obj:`int`, optional
+        Maximum number of cached immutable results (transactions and events
+        keyed by digest), 0 disables the cache
+    cache_ttl: :obj:`int`, optional
+        Seconds a cached result stays valid, None to never expire
+    cache_fn: :obj:`str`, optional
+        JSON file (without extension) the cache is loaded from and saved to on close
+    object_cache_size: :obj:`int`, optional
+        Maximum number of cached object versions, 0 disables the object cache
+    object_latest_ttl: :obj:`int`, optional
+        Seconds the latest known version of an object is trusted without
+        observing its transaction effects
+    """
+
+    def __init__(
+        self,
+        endpoint=None,
+        timeout=_default_timeout,
+        pool=None,
+        endpoints=None,
+        strategy=LEAST_LATENCY,
+        health_interval=_default_health_interval,
+        hedge=False,
+        retry=False,
+        breaker=False,
+        rate_limit=None,
+        coalesce=True,
+        models=False,
+        cache_size=_default_maxsize,
+        cache_ttl=_default_ttl,
+        cache_fn=None,
+        object_cache_size=_default_maxsize,
+        object_latest_ttl=_default_latest_ttl,
+    ):
+        self.endpoint = endpoint or (endpoints[0] if endpoints else _default_endpoint)
+        self.timeout = timeout
+        self.pool = pool if pool is not None else SessionPool()
+        self.balancer = None
+        if endpoints:
+            self.balancer = EndpointPool(
+                endpoints,
+                write_endpoint=self.endpoint,
+                strategy=strategy,
+                health_interval=health_interval,
+                pool=self.pool,
+            )
+            self.balancer.start()
+        self.hedge = HedgePolicy() if hedge is True else hedge or None
+        self.retry = RetryPolicy() if retry is True else retry or None
+        self.breakers = CircuitBreakers() if breaker is True else breaker or None
+        self.rate_limit = rate_limit
+        self.single_flight = SingleFlight() if coalesce else None
+        self.models = models
+        self.metrics = Metrics()
+        self.cache = (
+            LRUCache(maxsize=cache_size, ttl=cache_ttl, fn=cache_fn)
+            if cache_size
+            else None
+        )
+        self.object_cache = (
+            ObjectCache(maxsize=object_cache_size, latest_ttl=object_latest_ttl)
+            if object_cache_size
+            else None
+        )
+
+    def rpc_request(
+        self, method, params=None, endpoint=None, timeout=None, bypass_cache=False
+    ) -> dict:
+        """
+        RPC request through the client connection pool
+
+        Parameters
+        ---------
+        method: str
+            RPC Method to call
+        params: :obj:`list`, optional
+            Parameters for the RPC method
+        endpoint: :obj:`str`, optional
+            Override the client endpoint for this call
+        timeout: :obj:`int`, optional
+            Override the client timeout for this call
+        bypass_cache: :obj:`bool`, optional
+            Always fetch from the endpoint, the fresh result still updates the cache
+
+        Returns
+        -------
+        dict
+            Dictionary representation of RPC response
+
+        See Also
+        --------
+        pysui.rpc.request.rpc_request
+        """
+        params = params or []
+        if not bypass_cache:
+            resp = self._from_cache(method, params)
+            if resp is not None:
+                return resp
+
+        if self.single_flight is None or method in WRITE_METHODS:
+            resp = self._request(method, params, endpoint, timeout)
+        else:
+            resp = self.single_flight.do(
+                (endpoint, make_key(method, params)),
+                lambda: self._request(method, params, endpoint, timeout),
+            )
+        self._to_cache(method, params, resp)
+        return resp
+
+    def _from_cache(self, method, params) -> dict:
+        if self.cache is not None and method in IMMUTABLE_METHODS:
+            return self.cache.get(make_key(method, params))
+        if self.object_cache is not None and method in OBJECT_METHODS:
+            return self.object_cache.get(method, params[0])
+        return None
+
+    def _to_cache(self, method, params, resp) -> None:
+        if self.cache is not None and method in IMMUTABLE_METHODS:
+            if "result" in resp:
+                self.cache.set(make_key(method, params), resp)
+        elif self.object_cache is not None:
+            if method in OBJECT_METHODS:
+                self.object_cache.put(method, params[0], resp)
+            elif method in EXECUTE_METHODS or method in BUILD_METHODS:
+                self.object_cache.observe(resp.get("result"))
+
+    def _select(self, methods, exclude=()) -> str:
+        if self.balancer is None:
+            return self.endpoint
+        write = any(method in WRITE_METHODS for method in methods)
+        if self.breakers is not None:
+            exclude = (*exclude, *self.breakers.open_endpoints())
+        return self.balancer.select(write=write, exclude=exclude)
+
+    def _guarded(self, endpoint, methods, fn, tokens=1):
+        # fn() sent to `endpoint` through its circuit breaker, rate limit and the balancer
+        # the token is taken first, so a half open trial slot is only claimed
+        # right before the request is sent and always recorded
+        if self.rate_limit is not None:
+            self.rate_limit.acquire(endpoint, methods, tokens)
+        breaker = self.breakers.get(endpoint) if self.breakers is not None else None
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(endpoint)
+        st = time.perf_counter()
+        ok = True
+        try:
+            if self.balancer is None:
+                return fn()
+            with self.balancer.track(endpoint):
+                return fn()
+        except (RequestsError, RequestsTimeoutError):
+            ok = False
+            raise
+        finally:
+            if breaker is not None:
+                breaker.record(time.perf_counter() - st, ok)
+
+    def _guarded_iter(self, endpoint, methods, fn):
+        # _guarded for fn() returning an iterator, yields None once fn() returned
+        # and then its items. The outcome is recorded when the iterator is
+        # exhausted, fails or is closed, the latency when fn() returned
+        if self.rate_limit is not None:
+            self.rate_limit.acquire(endpoint, methods)
+        breaker = self.breakers.get(endpoint) if self.breakers is not None else None
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(endpoint)
+        track = (
+            self.balancer.track(endpoint)
+            if self.balancer is not None
+            else nullcontext(lambda: None)
+        )
+        st = time.perf_counter()
+        opened = None
+        ok = True
+        try:
+            with track as mark:
+                items = fn()
+                opened = time.perf_counter()
+                mark()
+                yield
+                yield from items
+        except (RequestsError, RequestsTimeoutError):
+            ok = False
+            raise
+        finally:
+            if breaker is not None:
+                breaker.record((opened or time.perf_counter()) - st, ok)
+
+    def _send(self, method, params, endpoint, timeout, send=None) -> dict:
+        # `send` performs the request, rpc_request unless given
+        send = send or rpc_request
+        return self._guarded(
+            endpoint,
+            [method],
+            lambda: send(method, params, endpoint, timeout, self.pool),
+        )
+
+    def _attempt(self, method, params, endpoint, timeout, failed, send) -> dict:
+        # one attempt on `endpoint`, or the best endpoint that has not failed yet
+        pinned = endpoint is not None
+        endpoint = endpoint or self._select([method], exclude=failed)
+        try:
+            if (
+                not pinned
+                and self.hedge is not None
+                and self.balancer is not None
+                and method not in WRITE_METHODS
+            ):
+                secondary = self._select([method], exclude=(*failed, endpoint))
+                if secondary != endpoint:
+                    return self.hedge.call(
+                        lambda e: self._send(method, params, e, timeout, send),
+                        endpoint,
+                        secondary,
+                        self.hedge.delay(self.balancer, endpoint),
+                    )
+            return self._send(method, params, endpoint, timeout, send)
+        except (RequestsError, RequestsTimeoutError):
+            failed.append(endpoint)
+            raise
+
+    def _request(self, method, params, endpoint, timeout, send=None) -> dict:
+        timeout = timeout or self.timeout
+        failed = []
+
+        def attempt(remaining=None):
+            return self._attempt(
+                method,
+                params,
+                endpoint,
+                attempt_timeout(timeout, remaining),
+                failed,
+                send,
+            )
+
+        st = time.perf_counter()
+        try:
+            resp = attempt() if self.retry is None else self.retry.call(attempt, method)
+        except Exception:
+            self.metrics.record(method, time.perf_counter() - st, error=True)
+            raise
+        self.metrics.record(method, time.perf_counter() - st)
+        return resp
+
+    def lazy_request(
+        self, method, params=None, endpoint=None, timeout=None
+    ) -> LazyResponse:
+        """
+        RPC request whose response is decoded on demand
+
+        Bypasses the caches, e.g.
+        `client.lazy_request("sui_getTransaction", [digest]).get("/result/effects/status/status")`
+
+        Parameters
+        ---------
+        method: str
+            RPC Method to call
+        params: :obj:`list`, optional
+            Parameters for the RPC method
+        endpoint: :obj:`str`, optional
+            Override the client endpoint for this call
+        timeout: :obj:`int`, optional
+            Override the client timeout for this call
+
+        Returns
+        -------
+        LazyResponse
+
+        See Also
+        --------
+        pysui.rpc.lazy.lazy_rpc_request
+        """
+        return self._request(method, params or [], endpoint, timeout, lazy_rpc_request)
+
+    def iter_result(
+        self,
+        method,
+        params=None,
+        endpoint=None,
+        timeout=None,
+        chunk_size=_default_chunk_size,
+    ):
+        """
+        Yield the elements of the `result` array of an RPC method as they arrive
+
+        Memory stays flat however large the array is. Bypasses the caches, a
+        failure while reading the body is not retried but is recorded by the
+        circuit breaker and the balancer once it is raised.
+
+        Parameters
+        ---------
+        method: str
+            RPC Method to call, e.g. `sui_getTransactionsInRange`
+        params: :obj:`list`, optional
+            Parameters for the RPC method
+        endpoint: :obj:`str`, optional
+            Override the client endpoint for this call
+        timeout: :obj:`int`, optional
+            Override the client timeout for this call
+        chunk_size: :obj:`int`, optional
+            Bytes read from the body at a time
+
+        See Also
+        --------
+        pysui.rpc.stream.stream_result
+        """
+        endpoint = endpoint or self._select([method])
+        items = self._guarded_iter(
+            endpoint,
+            [method],
+            lambda: stream_result(
+                method,
+                params,
+                endpoint,
+                timeout or self.timeout,
+                self.pool,
+                chunk_size,
+            ),
+        )
+        # sends the request
+        next(items)
+        return items
+
+    def batch_request(
+        self, calls, endpoint=None, timeout=None, batch_size=_default_batch_size
+    ) -> list:
+        """
+        JSON-RPC batch request through the client connection pool
+
+        Parameters
+        ---------
+        calls: :obj:`list`
+            List of (method, params) pairs
+        endpoint: :obj:`str`, optional
+            Override the client endpoint for this call
+        timeout: :obj:`int`, optional
+            Override the client timeout for this call
+        batch_size: :obj:`int`, optional
+            Maximum number of calls per HTTP POST
+
+        Returns
+        -------
+        list
+            One response or `RPCError` per call, in input order
+
+        See Also
+        --------
+        pysui.rpc.request.batch_request
+        """
+        calls = list(calls)
+        methods = [method for method, _ in calls]
+        timeout = timeout or self.timeout
+        failed = []
+
+        def attempt(remaining=None):
+            e = endpoint or self._select(methods, exclude=failed)
+            t = attempt_timeout(timeout, remaining)
+            try:
+                return self._guarded(
+                    e,
+                    methods,
+                    lambda: batch_request(calls, e, t, self.pool, batch_size),
+                    tokens=math.ceil(len(calls) / batch_size),
+                )
+            except (RequestsError, RequestsTimeoutError):
+                failed.append(e)
+                raise
+
+        st = time.perf_counter()
+        try:
+            results = (
+                attempt()
+                if self.retry is None or not calls
+                else self.retry.call(attempt, *methods)
+            )
+        except Exception:
+            self.metrics.record("batch", time.perf_counter() - st, error=True)
+            raise
+        self.metrics.record("batch", time.perf_counter() - st)
+        return results
+
+    def multi_get(
+        self,
+        method,
+        keys,
+        batch_size=_default_batch_size,
+        max_workers=_default_max_workers,
+        bypass_cache=False,
+    ) -> list:
+        """
+        Call a single argument RPC method for many keys at once
+
+        Duplicate keys are fetched once and cached results are reused. The rest
+        is sent as JSON-RPC batches, or fanned out over at most `max_workers`
+        threads if the endpoint does not support batches.
+
+        Parameters
+        ---------
+        method: str
+            RPC Method to call, e.g. `sui_getObject`
+        keys: :obj:`list`
+            First (and only) parameter of every call
+        batch_size: :obj:`int`, optional
+            Maximum number of calls per HTTP POST
+        max_workers: :obj:`int`, optional
+            Maximum number of concurrent requests without batch support
+        bypass_cache: :obj:`bool`, optional
+            Always fetch from the endpoint
+
+        Returns
+        -------
+        list
+            The result of every call in input order, or the exception
+            (`RPCError`, `InvalidRPCReplyError`, ...) raised by that call
+        """
+        keys = list(keys)
+        found = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            resp = None if bypass_cache else self._from_cache(method, [key])
+            if resp is None:
+                missing.append(key)
+            else:
+                found[key] = resp
+
+        if missing:
+            calls = [(method, [key]) for key in missing]
+            try:
+                replies = self.batch_request(calls, batch_size=batch_size)
+            except RPCError:
+                # endpoint does not support JSON-RPC batches
+                replies = self._fan_out(calls, max_workers)
+            for key, resp in zip(missing, replies):
+                if not isinstance(resp, Exception):
+                    self._to_cache(method, [key], resp)
+                found[key] = resp
+
+        return [self._unwrap(method, found[key]) for key in keys]
+
+    def _fan_out(self, calls, max_workers) -> list:
+        def call(method_params):
+            try:
+                return self._request(*method_params, None, None)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(call, calls))
+
+    def _unwrap(self, method, resp):
+        if isinstance(resp, Exception):
+            return resp
+        try:
+            result = resp["result"]
+        except KeyError:
+            return InvalidRPCReplyError(method, self.endpoint)
+        return self.decode_result(method, result)
+
+    def get_objects(self, object_ids, **options) -> list:
+        """
+        get_object for many objects at once
+
+        Parameters
+        ----------
+        object_ids: :obj:`list`
+            Object IDs, duplicates are fetched once
+        options: :obj:`dict`, optional
+            Passed to multi_get, e.g. `batch_size`
+
+        Returns
+        -------
+        list
+            GetObjectDataResponse or exception per object, in input order
+        """
+        return self.multi_get("sui_getObject", object_ids, **options)
+
+    def get_transactions(self, digests, **options) -> list:
+        """
+        get_transaction for many digests at once
+
+        Parameters
+        ----------
+        digests: :obj:`list`
+            Transaction digests, duplicates are fetched once
+        options: :obj:`dict`, optional
+            Passed to multi_get, e.g. `batch_size`
+
+        Returns
+        -------
+        list
+            TransactionResponse or exception per digest, in input order
+        """
+        return self.multi_get("sui_getTransaction", digests, **options)
+
+    def iter_transactions_in_range(
+        self, start=0, end=None, page_size=_default_page_size, prefetch=True
+    ):
+        """
+        Lazily yield (seq, digest) for a transaction sequence range of any size
+
+        See Also
+        --------
+        pysui.client.pagination.iter_transactions_in_range
+        """
+        return iter_transactions_in_range(self, start, end, page_size, prefetch)
+
+    def iter_events(
+        self,
+        method,
+        *query,
+        start_time=0,
+        end_time=None,
+        window=_default_event_window,
+        count=_default_event_count,
+        workers=1,
+    ):
+        """
+        Stream the events of a get_events_by_* query over a time range of any size
+
+        e.g. `client.iter_events("sui_getEventsByEventType", event_type, start_time=t)`
+
+        See Also
+        --------
+        pysui.client.pagination.iter_events
+        """
+        return iter_events(
+            self,
+            method,
+            *query,
+            start_time=start_time,
+            end_time=end_time,
+            window=window,
+            count=count,
+            workers=workers,
+        )
+
+    def stats(self) -> dict:
+        """
+        Returns
+        -------
+        dict
+            Connection pool counters and per-method call metrics
+        """
+        return dict(
+            pool=self.pool.stats(),
+            cache=self.cache.stats() if self.cache is not None else None,
+            object_cache=(
+                self.object_cache.stats() if self.object_cache is not None else None
+            ),
+            endpoints=self.balancer.stats() if self.balancer is not None else None,
+            hedge=self.hedge.stats() if self.hedge is not None else None,
+            breakers=self.breakers.stats() if self.breakers is not None else None,
+            single_flight=(
+                self.single_flight.stats() if self.single_flight is not None else None
+            ),
+            rate_limit=(
+                self.rate_limit.stats() if self.rate_limit is not None else None
+            ),
+            methods=self.metrics.snapshot(),
+        )
+
+    def close(self) -> None:
+        """
+        Close every pooled connection, stop the health checks and persist the
+        cache if it has a file
+        """
+        if self.balancer is not None:
+            self.balancer.stop()
+        if self.hedge is not None:
+            self.hedge.shutdown()
+        self.pool.close()
+        if self.cache is not None and self.cache.fn is not None:
+            self.cache.save()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
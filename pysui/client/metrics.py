@@ -0,0 +1,47 @@
+import threading
+from collections import defaultdict
+
+
+class Metrics:
+    """
+    Thread safe per-method call counters and latency totals
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = defaultdict(int)
+        self._errors = defaultdict(int)
+        self._elapsed = defaultdict(float)
+
+    def record(self, method: str, elapsed: float, error: bool = False) -> None:
+        """
+        Record one call of `method` taking `elapsed` seconds
+        """
+        with self._lock:
+            self._calls[method] += 1
+            self._elapsed[method] += elapsed
+            if error:
+                self._errors[method] += 1
+
+    def snapshot(self) -> dict:
+        """
+        Returns
+        -------
+        dict
+            {method: {"calls": int, "errors": int, "avg_latency": float}}
+        """
+        with self._lock:
+            return {
+                method: dict(
+                    calls=calls,
+                    errors=self._errors[method],
+                    avg_latency=self._elapsed[method] / calls if calls else 0.0,
+                )
+                for method, calls in self._calls.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calls.clear()
+            self._errors.clear()
+            self._elapsed.clear()
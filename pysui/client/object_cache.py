@@ -0,0 +1,152 @@
+import threading
+
+from pysui.client.cache import LRUCache, _default_maxsize
+
+_default_latest_ttl = 10
+
+
+def object_reference(resp: dict) -> dict:
+    """
+    Object reference ({objectId, version, digest}) of a get_object / get_raw_object
+    response, None if the object does not exist
+    """
+    result = resp.get("result")
+    if not isinstance(result, dict) or result.get("status") != "Exists":
+        return None
+    return result.get("details", {}).get("reference")
+
+
+def find_effects(result) -> dict:
+    """
+    Transaction effects contained in a transaction / execution result, if any
+    """
+    if not isinstance(result, dict):
+        return None
+    effects = result.get("effects")
+    if isinstance(effects, dict):
+        return effects
+    return find_effects(result.get("EffectResponse"))
+
+
+def _object_ids(value):
+    if isinstance(value, dict):
+        if "objectId" in value:
+            yield value["objectId"]
+        else:
+            for v in value.values():
+                yield from _object_ids(v)
+    elif isinstance(value, list):
+        for v in value:
+            yield from _object_ids(v)
+
+
+class ObjectCache:
+    """
+    Version aware cache of get_object / get_raw_object responses
+
+    Responses are stored under (method, objectId, version), which never changes,
+    next to an index of the latest known version of every object. A read is
+    served from the cache while the latest known version is cached; the index
+    is moved forward by transaction effects and entries expire from it after
+    `latest_ttl` seconds, as other senders may mutate the object.
+
+    Parameters
+    ----------
+    maxsize: :obj:`int`, optional
+        Maximum number of cached object versions
+    latest_ttl: :obj:`int`, optional
+        Seconds a latest known version is trusted without observed effects
+    """
+
+    def __init__(self, maxsize=_default_maxsize, latest_ttl=_default_latest_ttl):
+        self._objects = LRUCache(maxsize=maxsize, ttl=None)
+        self._latest = LRUCache(maxsize=maxsize, ttl=latest_ttl)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, method: str, object_id: str) -> dict:
+        """
+        Cached response of `method` for the latest known version of `object_id`
+        """
+        version = self._latest.get(object_id)
+        resp = None
+        if version is not None:
+            resp = self._objects.get((method, object_id, version))
+        with self._lock:
+            if resp is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return resp
+
+    def put(self, method: str, object_id: str, resp: dict) -> None:
+        """
+        Store the response of `method` for `object_id`
+        """
+        ref = object_reference(resp)
+        if ref is None:
+            self.invalidate(object_id)
+            return
+
+        version = ref["version"]
+        with self._lock:
+            latest = self._latest.get(object_id)
+            if latest is not None and latest > version:
+                # a newer version was already observed, keep the stale read uncached
+                return
+            self._latest.set(object_id, version)
+        self._objects.set((method, object_id, version), resp)
+
+    def invalidate(self, object_id: str) -> None:
+        """
+        Forget the latest known version of `object_id`
+        """
+        self._latest.pop(object_id)
+
+    def observe(self, result) -> None:
+        """
+        Update the cache from a transaction result
+
+        Effects move the latest known version of created, mutated and unwrapped
+        objects forward and drop deleted and wrapped ones. For unexecuted
+        transaction bytes, the gas and input objects are invalidated.
+        """
+        effects = find_effects(result)
+        if effects is None:
+            if isinstance(result, dict):
+                for key in ("gas", "inputObjects"):
+                    for object_id in _object_ids(result.get(key)):
+                        self.invalidate(object_id)
+            return
+
+        owned = list(effects.get("created", []))
+        owned += effects.get("mutated", [])
+        owned += effects.get("unwrapped", [])
+        if effects.get("gasObject"):
+            owned.append(effects["gasObject"])
+        for obj in owned:
+            ref = obj.get("reference", obj)
+            with self._lock:
+                latest = self._latest.get(ref["objectId"])
+                if latest is None or latest < ref["version"]:
+                    self._latest.set(ref["objectId"], ref["version"])
+
+        for ref in effects.get("deleted", []) + effects.get("wrapped", []):
+            self.invalidate(ref["objectId"])
+
+    def stats(self) -> dict:
+        """
+        Returns
+        -------
+        dict
+            size, hits, misses and hit_ratio of the cache
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return dict(
+                size=len(self._objects),
+                hits=self.hits,
+                misses=self.misses,
+                hit_ratio=self.hits / lookups if lookups else 0.0,
+            )
@@ -0,0 +1,196 @@
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from pysui.exceptions.exceptions import InvalidRPCReplyError
+
+_default_page_size = 1000
+_default_event_count = 1000
+_default_event_window = 60 * 60 * 1000
+
+
+def _fetch_window(client, start, end) -> list:
+    # the endpoint may cap the number of transactions per reply, keep asking
+    # for the remainder of the window until it is exhausted
+    page = client.get_transactions_in_range(start, end)
+    while page and page[-1][0] + 1 < end:
+        rest = client.get_transactions_in_range(page[-1][0] + 1, end)
+        if not rest:
+            break
+        page = page + rest
+    return page
+
+
+def iter_transactions_in_range(
+    client, start=0, end=None, page_size=_default_page_size, prefetch=True
+):
+    """
+    Lazily walk an arbitrarily large transaction sequence range
+
+    Parameters
+    ----------
+    client: :obj:`SuiClient`
+        Client to query
+    start: :obj:`int`, optional
+        First sequence number
+    end: :obj:`int`, optional
+        Sequence number to stop before, defaults to the total transaction number
+    page_size: :obj:`int`, optional
+        Number of sequence numbers requested per call
+    prefetch: :obj:`bool`, optional
+        Fetch the next page in the background while the current one is consumed
+
+    Yields
+    ------
+    tuple
+        (seq, digest), at most two pages are held in memory
+    """
+    if page_size < 1:
+        raise ValueError(f"page_size must be positive, got {page_size}")
+    if end is None:
+        end = client.get_total_transaction_number()
+
+    windows = ((s, min(s + page_size, end)) for s in range(start, end, page_size))
+
+    if not prefetch:
+        for s, e in windows:
+            for seq, digest in _fetch_window(client, s, e):
+                yield seq, digest
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        window = next(windows, None)
+        pending = executor.submit(_fetch_window, client, *window) if window else None
+        while pending is not None:
+            page = pending.result()
+            window = next(windows, None)
+            pending = (
+                executor.submit(_fetch_window, client, *window) if window else None
+            )
+            for seq, digest in page:
+                yield seq, digest
+    finally:
+        if pending is not None:
+            pending.cancel()
+        executor.shutdown(wait=False)
+
+
+def _event_key(envelope) -> tuple:
+    return (
+        envelope.get("timestamp"),
+        envelope.get("txDigest"),
+        json.dumps(envelope.get("event"), sort_keys=True),
+    )
+
+
+def _event_page(client, method, query, count, start, end) -> list:
+    params = [*query, count, start, end]
+    try:
+        return client.rpc_request(method, params)["result"]
+    except KeyError as e:
+        raise InvalidRPCReplyError(method, client.endpoint) from e
+
+
+def _iter_event_window(client, method, query, count, start, end):
+    # resume from the last timestamp seen until a page comes back short,
+    # dropping the events of the boundary timestamp already yielded
+    cursor, limit = start, count
+    boundary, seen = None, set()
+    while True:
+        page = _event_page(client, method, query, limit, cursor, end)
+        events = sorted(
+            (e for e in page if start <= e["timestamp"] < end),
+            key=lambda e: e["timestamp"],
+        )
+        for envelope in events:
+            key = _event_key(envelope)
+            if key in seen:
+                continue
+            if envelope["timestamp"] != boundary:
+                boundary, seen = envelope["timestamp"], set()
+            seen.add(key)
+            yield envelope
+
+        if len(page) < limit or not events:
+            return
+        last = events[-1]["timestamp"]
+        if last == cursor:
+            # a full page of a single timestamp, widen it to get past it
+            limit *= 2
+        else:
+            cursor, limit = last, count
+
+
+def iter_events(
+    client,
+    method,
+    *query,
+    start_time=0,
+    end_time=None,
+    window=_default_event_window,
+    count=_default_event_count,
+    workers=1,
+):
+    """
+    Stream the events of a get_events_by_* query over a time range of any size
+
+    The range is split into windows of `window` milliseconds. Each window is
+    read in pages of `count` events, resuming from the last timestamp seen,
+    and events repeated on page or window boundaries are dropped.
+
+    Parameters
+    ----------
+    client: :obj:`SuiClient`
+        Client to query
+    method: str
+        RPC Method to call, e.g. `sui_getEventsByEventType`
+    query: :obj:`tuple`
+        Leading parameters of the method, e.g. the event type or package and module
+    start_time: :obj:`int`, optional
+        Timestamp (ms) of the first event
+    end_time: :obj:`int`, optional
+        Timestamp (ms) to stop before, defaults to now
+    window: :obj:`int`, optional
+        Length of a window in milliseconds
+    count: :obj:`int`, optional
+        Maximum number of events per call
+    workers: :obj:`int`, optional
+        Number of windows fetched in parallel, events are still yielded in order
+
+    Yields
+    ------
+    dict
+        SuiEventEnvelope, in timestamp order
+    """
+    if window < 1 or count < 1:
+        raise ValueError("window and count must be positive")
+    if end_time is None:
+        end_time = int(time.time() * 1000)
+
+    windows = (
+        (s, min(s + window, end_time)) for s in range(start_time, end_time, window)
+    )
+
+    if workers <= 1:
+        for s, e in windows:
+            yield from _iter_event_window(client, method, query, count, s, e)
+        return
+
+    def fetch(s, e):
+        return list(_iter_event_window(client, method, query, count, s, e))
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = deque()
+    try:
+        for s, e in windows:
+            pending.append(executor.submit(fetch, s, e))
+            if len(pending) >= workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """
+    Thread safe request coalescing
+
+    Concurrent calls with the same key share one execution of `fn`: the first
+    caller runs it, the others wait for it and receive the same result (the
+    same object, do not mutate it) or exception.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key, fn):
+        """
+        Return fn(), or the result of the call already in flight for `key`
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return call.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(calls=self.calls, shared=self.shared)
+
+
+class AsyncSingleFlight:
+    """
+    asyncio request coalescing, for use from a single event loop
+
+    The first caller for a key starts `fn()` as a task, concurrent callers
+    await the same task. Cancelling one caller does not cancel the request
+    for the others.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key, fn):
+        """
+        Return await fn(), or the result of the call already in flight for `key`
+        """
+        self.calls += 1
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _done(self, key, task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # retrieve the exception so it is not reported as never retrieved
+            task.exception()
+
+    def stats(self) -> dict:
+        return dict(calls=self.calls, shared=self.shared)
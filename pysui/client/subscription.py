@@ -0,0 +1,378 @@
+import asyncio
+import threading
+
+import websockets
+
+from pysui.includes.config import log
+from pysui.rpc import codec
+from pysui.rpc.exceptions import RPCError
+from pysui.rpc.request import next_request_id
+
+_default_ws_endpoint = "ws://localhost:9001"
+_default_queue_size = 1000
+_default_reconnect_delay = 1
+_default_max_reconnect_delay = 30
+_default_call_timeout = 30
+
+_missing = object()
+
+
+class Subscription:
+    """
+    One event filter subscribed through a subscription manager
+
+    Events are buffered in a bounded queue. Iterate it with `async for` or
+    give the manager a callback, which is called for every event.
+
+    Attributes
+    ----------
+    filter: :obj:`dict`
+        Event filter, see https://docs.sui.io/build/pubsub#event-filters
+    id: :obj:`int`
+        Server side subscription id, changes on reconnect
+    last_timestamp: :obj:`int`
+        Timestamp of the last event received, to backfill gaps after a reconnect
+    drop_oldest: :obj:`bool`
+        When the queue is full drop the oldest buffered event, else the new one
+    max_wait: :obj:`float`
+        Seconds to wait for room in a full queue before dropping, None to
+        wait as long as it takes
+    dropped: :obj:`int`
+        Events dropped because the queue was full
+    """
+
+    def __init__(self, filter, callback, queue_size, drop_oldest=False, max_wait=0):
+        self.filter = filter
+        self.callback = callback
+        self.drop_oldest = drop_oldest
+        self.max_wait = max_wait
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.id = None
+        self.last_timestamp = None
+        self.dropped = 0
+        self._dispatcher = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        return await self.queue.get()
+
+
+class AsyncSubscriptionManager:
+    """
+    Multiplexes many sui_subscribeEvent filters over one WebSocket connection
+
+    The connection is re-established with exponential backoff when it drops
+    and every filter is subscribed again. Events sent while disconnected are
+    not replayed by the node, use `on_reconnect` with
+    `Subscription.last_timestamp` to backfill them (e.g. with iter_events).
+
+    Parameters
+    ----------
+    endpoint: :obj:`str`, optional
+        WebSocket endpoint of the node
+    queue_size: :obj:`int`, optional
+        Maximum number of undelivered events buffered per subscription
+    drop_oldest: :obj:`bool`, optional
+        Default overflow policy of the subscriptions: when a queue is full
+        drop its oldest buffered event, else the new event
+    max_wait: :obj:`float`, optional
+        Default seconds to wait for room in a full queue before dropping. The
+        connection is held back meanwhile, so other subscriptions and the
+        replies to subscribe / unsubscribe wait as well. 0 never waits, None
+        waits as long as the consumer needs and never drops
+    reconnect_delay: :obj:`int`, optional
+        Initial delay in seconds before reconnecting
+    max_reconnect_delay: :obj:`int`, optional
+        Upper bound of the reconnect delay
+    on_reconnect: :obj:`callable`, optional
+        Called as on_reconnect(subscription) for every subscription after a reconnect
+    call_timeout: :obj:`int`, optional
+        Seconds to wait for the reply to a subscribe / unsubscribe request
+    """
+
+    def __init__(
+        self,
+        endpoint=_default_ws_endpoint,
+        queue_size=_default_queue_size,
+        drop_oldest=False,
+        max_wait=0,
+        reconnect_delay=_default_reconnect_delay,
+        max_reconnect_delay=_default_max_reconnect_delay,
+        on_reconnect=None,
+        call_timeout=_default_call_timeout,
+    ):
+        self.endpoint = endpoint
+        self.queue_size = queue_size
+        self.drop_oldest = drop_oldest
+        self.max_wait = max_wait
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.on_reconnect = on_reconnect
+        self.call_timeout = call_timeout
+        self.subscriptions = []
+        self._by_id = {}
+        self._replies = {}
+        self._ws = None
+        self._connected = None
+        self._task = None
+        self._closing = False
+
+    async def connect(self) -> None:
+        """
+        Open the connection and start reading from it
+        """
+        if self._task is None:
+            self._connected = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run())
+        await self._connected.wait()
+
+    async def subscribe(
+        self, filter, callback=None, drop_oldest=None, max_wait=_missing
+    ) -> Subscription:
+        """
+        Subscribe to events matching `filter`
+
+        Parameters
+        ----------
+        filter: :obj:`dict`
+            Event filter
+        callback: :obj:`callable`, optional
+            Called with every event envelope, may be a coroutine function
+        drop_oldest: :obj:`bool`, optional
+            Override the overflow policy of the manager for this subscription
+        max_wait: :obj:`float`, optional
+            Override the wait for room in a full queue for this subscription
+
+        Returns
+        -------
+        Subscription
+        """
+        await self.connect()
+        if drop_oldest is None:
+            drop_oldest = self.drop_oldest
+        if max_wait is _missing:
+            max_wait = self.max_wait
+        sub = Subscription(filter, callback, self.queue_size, drop_oldest, max_wait)
+        if callback is not None:
+            sub._dispatcher = asyncio.ensure_future(self._dispatch(sub))
+        self.subscriptions.append(sub)
+        try:
+            await self._subscribe(sub)
+        except websockets.exceptions.ConnectionClosed:
+            # the connection dropped meanwhile, every subscription is
+            # subscribed again once it is back
+            pass
+        return sub
+
+    async def unsubscribe(self, sub: Subscription) -> None:
+        """
+        Stop receiving events for `sub`
+        """
+        self.subscriptions.remove(sub)
+        self._by_id.pop(sub.id, None)
+        if sub._dispatcher is not None:
+            sub._dispatcher.cancel()
+        if self._ws is not None:
+            try:
+                await self._call("sui_unsubscribeEvent", [sub.id])
+            except (
+                RPCError,
+                asyncio.TimeoutError,
+                websockets.exceptions.ConnectionClosed,
+            ):
+                pass
+
+    async def close(self) -> None:
+        """
+        Close the connection and cancel every subscription
+        """
+        self._closing = True
+        for sub in self.subscriptions:
+            if sub._dispatcher is not None:
+                sub._dispatcher.cancel()
+        ws = self._ws
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        if ws is not None:
+            await ws.close()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _call(self, method, params):
+        ws = self._ws
+        if ws is None:
+            raise websockets.exceptions.ConnectionClosedError(None, None)
+        request_id = next_request_id()
+        reply = self._replies[request_id] = asyncio.get_running_loop().create_future()
+        try:
+            await ws.send(
+                codec.dumps(
+                    {
+                        "id": request_id,
+                        "jsonrpc": "2.0",
+                        "method": method,
+                        "params": params,
+                    }
+                ).decode()
+            )
+            resp = await asyncio.wait_for(reply, self.call_timeout)
+        finally:
+            self._replies.pop(request_id, None)
+        if "error" in resp:
+            raise RPCError(method, self.endpoint, str(resp["error"]))
+        return resp["result"]
+
+    async def _subscribe(self, sub):
+        sub.id = await self._call("sui_subscribeEvent", [sub.filter])
+        self._by_id[sub.id] = sub
+
+    async def _run(self):
+        delay = self.reconnect_delay
+        reconnect = False
+        while not self._closing:
+            reader = None
+            try:
+                self._ws = await websockets.connect(self.endpoint)
+                reader = asyncio.ensure_future(self._read(self._ws))
+                self._by_id.clear()
+                for sub in list(self.subscriptions):
+                    await self._subscribe(sub)
+                    if reconnect and self.on_reconnect is not None:
+                        self.on_reconnect(sub)
+                self._connected.set()
+                delay = self.reconnect_delay
+                await reader
+            except (OSError, RPCError, websockets.exceptions.WebSocketException) as e:
+                log.error(f"Subscription connection to {self.endpoint} lost: {e}")
+            except Exception as e:
+                # anything else must not stop the manager for good
+                log.exception(f"Subscription connection to {self.endpoint} failed: {e}")
+            finally:
+                if reader is not None:
+                    reader.cancel()
+                self._connected.clear()
+                for reply in self._replies.values():
+                    if not reply.done():
+                        reply.set_exception(
+                            websockets.exceptions.ConnectionClosedError(None, None)
+                        )
+                self._ws = None
+            if self._closing:
+                break
+            reconnect = True
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _read(self, ws):
+        async for message in ws:
+            try:
+                msg = codec.loads(message)
+            except ValueError as e:
+                log.warning(f"Invalid message from {self.endpoint}: {e}")
+                continue
+            if not isinstance(msg, dict):
+                continue
+            reply = self._replies.get(msg.get("id"))
+            if reply is not None:
+                if not reply.done():
+                    reply.set_result(msg)
+                continue
+
+            params = msg.get("params") or {}
+            sub = self._by_id.get(params.get("subscription"))
+            if sub is None:
+                continue
+            event = params.get("result")
+            if isinstance(event, dict) and "timestamp" in event:
+                sub.last_timestamp = event["timestamp"]
+            await self._put(sub, event)
+
+    async def _put(self, sub, event):
+        if sub.queue.full() and sub.max_wait != 0:
+            try:
+                await asyncio.wait_for(sub.queue.put(event), sub.max_wait)
+                return
+            except asyncio.TimeoutError:
+                pass
+        if sub.queue.full():
+            sub.dropped += 1
+            if sub.dropped == 1 or sub.dropped % sub.queue.maxsize == 0:
+                log.warning(
+                    f"Subscription {sub.filter} dropped {sub.dropped} events, "
+                    "its queue is full"
+                )
+            if not sub.drop_oldest:
+                return
+            sub.queue.get_nowait()
+        sub.queue.put_nowait(event)
+
+    async def _dispatch(self, sub):
+        while True:
+            event = await sub.queue.get()
+            try:
+                result = sub.callback(event)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                log.error(f"Subscription callback failed for {sub.filter}: {e}")
+
+
+class SubscriptionManager:
+    """
+    Threaded wrapper around AsyncSubscriptionManager
+
+    Runs the connection on an event loop in a background thread, callbacks
+    are called on that thread. Takes the same parameters as
+    AsyncSubscriptionManager.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self.manager = self._submit(self._create(*args, **kwargs))
+
+    async def _create(self, *args, **kwargs):
+        return AsyncSubscriptionManager(*args, **kwargs)
+
+    def _submit(self, coro, timeout=None):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    def subscribe(
+        self, filter, callback, timeout=None, drop_oldest=None, max_wait=_missing
+    ) -> Subscription:
+        """
+        Subscribe to events matching `filter`, calling `callback` with each event
+        """
+        return self._submit(
+            self.manager.subscribe(filter, callback, drop_oldest, max_wait), timeout
+        )
+
+    def unsubscribe(self, sub: Subscription, timeout=None) -> None:
+        self._submit(self.manager.unsubscribe(sub), timeout)
+
+    def close(self, timeout=None) -> None:
+        """
+        Close the connection and stop the background thread
+        """
+        self._submit(self.manager.close(), timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
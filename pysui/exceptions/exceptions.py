@@ -19,3 +19,9 @@ class TxConfirmationTimedoutError(AssertionError):
 
     def __init__(self, msg):
         super().__init__(f"{msg}")
+
+
+class SignerError(RuntimeError):
+    """
+    Exception raised when a transaction could not be signed
+    """
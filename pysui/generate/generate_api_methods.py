@@ -21,11 +21,44 @@ def open_api_data(fn: str, show: bool = False) -> dict:
     return api_data
 
 
+_json_types = {
+    "array": "list",
+    "boolean": "bool",
+    "integer": "int",
+    "null": "None",
+    "number": "float",
+    "object": "dict",
+    "string": "str",
+}
+
+
+def return_type(result: dict) -> str:
+    """
+    Python annotation of the decoded JSON of an RPC method result
+    """
+    schema = result.get("schema") or {}
+    t = schema.get("type")
+    if isinstance(t, str) and t in _json_types:
+        return _json_types[t]
+    if schema:
+        return "dict"
+    # no schema, go by the Rust type name, e.g. Vec<SuiObjectInfo> or u64
+    name = result.get("name", "")
+    if name.startswith("Vec<"):
+        return "list"
+    if name == "()":
+        return "None"
+    if re.fullmatch(r"[ui]\d+", name):
+        return "int"
+    return "dict"
+
+
 def build_method(
     method: dict,
     template: str,
     snake_case: bool = True,
     api_doc_link: str = "https://docs.sui.io/build/json-rpc",
+    arg_indent: str = "\t",
 ) -> str:
     method_name = method.get("name")
     func = (
@@ -43,7 +76,7 @@ def build_method(
     for a in params:
         t = a.get("schema").get("type")
         desc = a.get("description")
-        args_desc += f"\n\t{a['name']}: :obj: {'' if not t else f'`{t}` '} [ {'' if not desc else f'{desc}'} ]"
+        args_desc += f"\n{arg_indent}{a['name']}: :obj: {'' if not t else f'`{t}` '} [ {'' if not desc else f'{desc}'} ]"
     params = [x["name"] for x in params]
     args = params = ", ".join(params)
     if args:
@@ -51,17 +84,29 @@ def build_method(
 
     returns = method.get("result").get("name")
     completed = template.format(
-        func, args, desc, args_desc, returns, api_doc_link, method_name, params
+        func,
+        args,
+        return_type(method.get("result")),
+        desc,
+        args_desc,
+        returns,
+        api_doc_link,
+        method_name,
+        params,
     )
     return completed
 
 
 def create_file(
-    fn: str, methods: list, imports_constants: str, method_blank: str
+    fn: str,
+    methods: list,
+    imports_constants: str,
+    method_blank: str,
+    arg_indent: str = "\t",
 ) -> None:
     _file_str = ""
     _file_str += imports_constants
 
     for x in methods:
-        _file_str += build_method(x, method_blank)
+        _file_str += build_method(x, method_blank, arg_indent=arg_indent)
     file_op.save_file(fn, _file_str)
@@ -0,0 +1,88 @@
+import keyword
+import re
+
+from pysui.tools import file_op
+
+
+def model_attr(key: str) -> str:
+    """
+    Attribute name of a JSON field, e.g. objectId -> object_id
+    """
+    attr = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", key).lower()
+    return f"{attr}_" if keyword.iskeyword(attr) else attr
+
+
+def schema_ref(schema: dict) -> str:
+    """
+    Component referenced by `schema`, looking through arrays and nullable
+    wrappers, None if it does not reference exactly one component
+    """
+    if not isinstance(schema, dict):
+        return None
+    if "$ref" in schema:
+        return schema["$ref"].split("/")[-1]
+    if "items" in schema:
+        return schema_ref(schema["items"])
+    for key in ("allOf", "anyOf", "oneOf"):
+        refs = {schema_ref(s) for s in schema.get(key, [])} - {None}
+        if len(refs) == 1:
+            return refs.pop()
+    return None
+
+
+def model_schemas(schemas: dict) -> dict:
+    """
+    Component schemas that become models, objects with fixed properties
+    """
+    return {
+        name: schema
+        for name, schema in schemas.items()
+        if schema.get("type") == "object" and schema.get("properties")
+    }
+
+
+def build_model(name: str, schema: dict, models: dict, template: str) -> str:
+    slots = []
+    fields = []
+    for key, prop in schema["properties"].items():
+        attr = model_attr(key)
+        nested = schema_ref(prop)
+        nested = f'"{nested}"' if nested in models else None
+        slots.append(f'"{attr}", ')
+        fields.append(f'("{key}", "{attr}", {nested}), ')
+    desc = " ".join((schema.get("description") or name).split())
+    return template.format(name, desc, "".join(slots), "".join(fields))
+
+
+def result_models(methods: list, models: dict) -> dict:
+    """
+    {method: model name} for every method whose result decodes into a model
+    """
+    mapping = {}
+    for method in methods:
+        result = method.get("result", {})
+        ref = schema_ref(result.get("schema"))
+        if ref is None:
+            # no schema, go by the Rust type name, e.g. Vec<SuiObjectInfo>
+            ref = re.sub(r"^Vec<(.*)>$", r"\1", result.get("name", ""))
+        if ref in models:
+            mapping[method["name"]] = ref
+    return mapping
+
+
+def create_models_file(
+    fn: str,
+    api_data: dict,
+    imports: str,
+    model_blank: str,
+    footer: str,
+) -> None:
+    models = model_schemas(api_data.get("components", {}).get("schemas", {}))
+    _file_str = imports
+    for name in sorted(models):
+        _file_str += build_model(name, models[name], models, model_blank)
+    mapping = result_models(api_data["methods"], models)
+    _file_str += footer.format(
+        "".join(f'"{m}": "{mapping[m]}", ' for m in sorted(mapping))
+    )
+    file_op.save_file(fn, _file_str)
@@ -11,7 +11,7 @@ _default_timeout = 30
 """
 
 method_blank = '''
-def {}({} endpoint=_default_endpoint, timeout=_default_timeout) -> list:
+def {}({} endpoint=_default_endpoint, timeout=_default_timeout) -> {}:
     """
     {}
 
@@ -43,3 +43,159 @@ def {}({} endpoint=_default_endpoint, timeout=_default_timeout) -> list:
         raise InvalidRPCReplyError(method, endpoint) from e
 
 '''
+
+async_imports_constants = '''
+from abc import ABC, abstractmethod
+
+from pysui.exceptions.exceptions import InvalidRPCReplyError
+from pysui.models.models import decode_result
+
+
+class AsyncRPCMethods(ABC):
+    """
+    Coroutine for every SUI RPC method
+
+    Mixed into AsyncSuiClient, which provides `endpoint` and `rpc_request`.
+    Results are returned as decoded JSON, or as response models if `models` is set.
+    """
+
+    endpoint = None
+    models = False
+
+    @abstractmethod
+    async def rpc_request(self, method, params=None, **options) -> dict:
+        """
+        Send one RPC request, implemented by AsyncSuiClient
+        """
+
+    def decode_result(self, method, result):
+        return decode_result(method, result) if self.models else result
+
+'''
+
+async_method_blank = '''
+    async def {}(self, {}**options) -> {}:
+        """
+        {}
+
+        Parameters
+        ----------{}
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        {}
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        {}
+        """
+        method = '{}'
+        params = [{}]
+        try:
+            result = (await self.rpc_request(method, params, **options))['result']
+        except KeyError as e:
+            raise InvalidRPCReplyError(method, options.get('endpoint', self.endpoint)) from e
+        return self.decode_result(method, result)
+
+'''
+
+client_imports_constants = '''
+from abc import ABC, abstractmethod
+
+from pysui.exceptions.exceptions import InvalidRPCReplyError
+from pysui.models.models import decode_result
+
+
+class RPCMethods(ABC):
+    """
+    Method for every SUI RPC method
+
+    Mixed into SuiClient, which provides `endpoint` and `rpc_request`.
+    Results are returned as decoded JSON, or as response models if `models` is set.
+    """
+
+    endpoint = None
+    models = False
+
+    @abstractmethod
+    def rpc_request(self, method, params=None, **options) -> dict:
+        """
+        Send one RPC request, implemented by SuiClient
+        """
+
+    def decode_result(self, method, result):
+        return decode_result(method, result) if self.models else result
+
+'''
+
+client_method_blank = '''
+    def {}(self, {}**options) -> {}:
+        """
+        {}
+
+        Parameters
+        ----------{}
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        {}
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        {}
+        """
+        method = '{}'
+        params = [{}]
+        try:
+            result = self.rpc_request(method, params, **options)['result']
+        except KeyError as e:
+            raise InvalidRPCReplyError(method, options.get('endpoint', self.endpoint)) from e
+        return self.decode_result(method, result)
+
+'''
+
+models_imports = """
+# Generated by gen_methods.py from the Sui OpenRPC spec, do not edit.
+
+from pysui.models.base import Model, decode
+
+"""
+
+model_blank = '''
+
+class {}(Model):
+    """
+    {}
+    """
+
+    __slots__ = ({})
+    _fields = ({})
+'''
+
+models_footer = '''
+
+# RPC method -> model of its result
+RESULT_MODELS = {{{}}}
+
+
+def decode_result(method, result):
+    """
+    Decode the `result` of `method` into its response model, if it has one
+    """
+    model = RESULT_MODELS.get(method)
+    return result if model is None else decode(result, model)
+'''
@@ -0,0 +1,1076 @@
+from abc import ABC, abstractmethod
+
+from pysui.exceptions.exceptions import InvalidRPCReplyError
+from pysui.models.models import decode_result
+
+
+class RPCMethods(ABC):
+    """
+    Method for every SUI RPC method
+
+    Mixed into SuiClient, which provides `endpoint` and `rpc_request`.
+    Results are returned as decoded JSON, or as response models if `models` is set.
+    """
+
+    endpoint = None
+    models = False
+
+    @abstractmethod
+    def rpc_request(self, method, params=None, **options) -> dict:
+        """
+        Send one RPC request, implemented by SuiClient
+        """
+
+    def decode_result(self, method, result):
+        return decode_result(method, result) if self.models else result
+
+    def batch_transaction(
+        self, signer, single_transaction_params, gas, gas_budget, **options
+    ) -> dict:
+        """
+        the gas budget, the transaction will fail if the gas cost exceed the budget
+
+        Parameters
+        ----------
+            signer: :obj:  [ the transaction signer's Sui address ]
+            single_transaction_params: :obj: `array`  [ list of transaction request parameters ]
+            gas: :obj:  [ gas object to be used in this transaction, the gateway will pick one from the signer's possession if not provided ]
+            gas_budget: :obj: `integer`  [ the gas budget, the transaction will fail if the gas cost exceed the budget ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        TransactionBytes
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_batchTransaction"
+        params = [signer, single_transaction_params, gas, gas_budget]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def execute_transaction(
+        self, tx_bytes, flag, signature, pub_key, **options
+    ) -> dict:
+        """
+        signer's public key, as base-64 encoded string
+
+        Parameters
+        ----------
+            tx_bytes: :obj:  [ transaction data bytes, as base-64 encoded string ]
+            flag: :obj:  [ Flag of the signature scheme that is used. ]
+            signature: :obj:  [ transaction signature, as base-64 encoded string ]
+            pub_key: :obj:  [ signer's public key, as base-64 encoded string ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        TransactionResponse
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_executeTransaction"
+        params = [tx_bytes, flag, signature, pub_key]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_events_by_event_type(
+        self, event_type, count, start_time, end_time, **options
+    ) -> list:
+        """
+        the matching events' timestamp will be before the specified end time
+
+        Parameters
+        ----------
+            event_type: :obj: `string`  [ the event type, e.g. '0x2::devnet_nft::MintNFTEvent' ]
+            count: :obj: `integer`  [ maximum size of the result ]
+            start_time: :obj: `integer`  [ the matching events' timestamp will be after the specified start time ]
+            end_time: :obj: `integer`  [ the matching events' timestamp will be before the specified end time ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        Vec<SuiEventEnvelope>
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getEventsByEventType"
+        params = [event_type, count, start_time, end_time]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_events_by_module(
+        self, package, module, count, start_time, end_time, **options
+    ) -> list:
+        """
+        the matching events' timestamp will be before the specified end time
+
+        Parameters
+        ----------
+            package: :obj:  [ the Move package ID ]
+            module: :obj: `string`  [ the module name ]
+            count: :obj: `integer`  [ maximum size of the result ]
+            start_time: :obj: `integer`  [ the matching events' timestamp will be after the specified start time ]
+            end_time: :obj: `integer`  [ the matching events' timestamp will be before the specified end time ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        Vec<SuiEventEnvelope>
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getEventsByModule"
+        params = [package, module, count, start_time, end_time]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_events_by_object(
+        self, object, count, start_time, end_time, **options
+    ) -> list:
+        """
+        the matching events' timestamp will be before the specified end time
+
+        Parameters
+        ----------
+            object: :obj:  [ the object ID ]
+            count: :obj: `integer`  [ maximum size of the result ]
+            start_time: :obj: `integer`  [ the matching events' timestamp will be after the specified start time ]
+            end_time: :obj: `integer`  [ the matching events' timestamp will be before the specified end time ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        Vec<SuiEventEnvelope>
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getEventsByObject"
+        params = [object, count, start_time, end_time]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_events_by_owner(
+        self, owner, count, start_time, end_time, **options
+    ) -> list:
+        """
+        the matching events' timestamp will be before the specified end time
+
+        Parameters
+        ----------
+            owner: :obj:  [ the owner's Sui address ]
+            count: :obj: `integer`  [ maximum size of the result ]
+            start_time: :obj: `integer`  [ the matching events' timestamp will be after the specified start time ]
+            end_time: :obj: `integer`  [ the matching events' timestamp will be before the specified end time ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        Vec<SuiEventEnvelope>
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getEventsByOwner"
+        params = [owner, count, start_time, end_time]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_events_by_sender(
+        self, sender, count, start_time, end_time, **options
+    ) -> list:
+        """
+        the matching events' timestamp will be before the specified end time
+
+        Parameters
+        ----------
+            sender: :obj:  [ the sender's Sui address ]
+            count: :obj: `integer`  [ maximum size of the result ]
+            start_time: :obj: `integer`  [ the matching events' timestamp will be after the specified start time ]
+            end_time: :obj: `integer`  [ the matching events' timestamp will be before the specified end time ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        Vec<SuiEventEnvelope>
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getEventsBySender"
+        params = [sender, count, start_time, end_time]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_events_by_transaction(self, digest, **options) -> list:
+        """
+        digest of the transaction, as base-64 encoded string
+
+        Parameters
+        ----------
+            digest: :obj:  [ digest of the transaction, as base-64 encoded string ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        Vec<SuiEventEnvelope>
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getEventsByTransaction"
+        params = [digest]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_object(self, object_id, **options) -> dict:
+        """
+        the ID of the queried object
+
+        Parameters
+        ----------
+            object_id: :obj:  [ the ID of the queried object ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        GetObjectDataResponse
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getObject"
+        params = [object_id]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_objects_owned_by_address(self, address, **options) -> list:
+        """
+        the owner's Sui address
+
+        Parameters
+        ----------
+            address: :obj:  [ the owner's Sui address ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        Vec<SuiObjectInfo>
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getObjectsOwnedByAddress"
+        params = [address]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_objects_owned_by_object(self, object_id, **options) -> list:
+        """
+        the ID of the owner object
+
+        Parameters
+        ----------
+            object_id: :obj:  [ the ID of the owner object ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        Vec<SuiObjectInfo>
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getObjectsOwnedByObject"
+        params = [object_id]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_raw_object(self, object_id, **options) -> dict:
+        """
+        the id of the object
+
+        Parameters
+        ----------
+            object_id: :obj:  [ the id of the object ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        GetRawObjectDataResponse
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getRawObject"
+        params = [object_id]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_recent_transactions(self, count, **options) -> list:
+        """
+        maximum size of the result
+
+        Parameters
+        ----------
+            count: :obj: `integer`  [ maximum size of the result ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        Vec<(GatewayTxSeqNumber,TransactionDigest)>
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getRecentTransactions"
+        params = [count]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_total_transaction_number(self, **options) -> int:
+        """
+        Return the total number of transactions known to the server.
+
+        Parameters
+        ----------
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        u64
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getTotalTransactionNumber"
+        params = []
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_transaction(self, digest, **options) -> dict:
+        """
+        the digest of the queried transaction
+
+        Parameters
+        ----------
+            digest: :obj:  [ the digest of the queried transaction ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        TransactionEffectsResponse
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getTransaction"
+        params = [digest]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_transactions_by_input_object(self, object, **options) -> list:
+        """
+        the ID of the input object
+
+        Parameters
+        ----------
+            object: :obj:  [ the ID of the input object ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        Vec<(GatewayTxSeqNumber,TransactionDigest)>
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getTransactionsByInputObject"
+        params = [object]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_transactions_by_move_function(
+        self, package, module, function, **options
+    ) -> list:
+        """
+        the move function name, e.g. `mint`
+
+        Parameters
+        ----------
+            package: :obj:  [ the Move package ID, e.g. `0x2` ]
+            module: :obj: `string`  [ the Move module name, e.g. `devnet_nft` ]
+            function: :obj: `string`  [ the move function name, e.g. `mint` ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        Vec<(GatewayTxSeqNumber,TransactionDigest)>
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getTransactionsByMoveFunction"
+        params = [package, module, function]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_transactions_by_mutated_object(self, object, **options) -> list:
+        """
+        the ID of the mutated object
+
+        Parameters
+        ----------
+            object: :obj:  [ the ID of the mutated object ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        Vec<(GatewayTxSeqNumber,TransactionDigest)>
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getTransactionsByMutatedObject"
+        params = [object]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_transactions_from_address(self, addr, **options) -> list:
+        """
+        the sender's Sui address
+
+        Parameters
+        ----------
+            addr: :obj:  [ the sender's Sui address ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        Vec<(GatewayTxSeqNumber,TransactionDigest)>
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getTransactionsFromAddress"
+        params = [addr]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_transactions_in_range(self, start, end, **options) -> list:
+        """
+        the matching transactions' sequence number will be less than the ending sequence number
+
+        Parameters
+        ----------
+            start: :obj: `integer`  [ the matching transactions' sequence number will be greater than or equals to the starting sequence number ]
+            end: :obj: `integer`  [ the matching transactions' sequence number will be less than the ending sequence number ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        Vec<(GatewayTxSeqNumber,TransactionDigest)>
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getTransactionsInRange"
+        params = [start, end]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def get_transactions_to_address(self, addr, **options) -> list:
+        """
+        the recipient's Sui address
+
+        Parameters
+        ----------
+            addr: :obj:  [ the recipient's Sui address ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        Vec<(GatewayTxSeqNumber,TransactionDigest)>
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_getTransactionsToAddress"
+        params = [addr]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def merge_coins(
+        self, signer, primary_coin, coin_to_merge, gas, gas_budget, **options
+    ) -> dict:
+        """
+        the gas budget, the transaction will fail if the gas cost exceed the budget
+
+        Parameters
+        ----------
+            signer: :obj:  [ the transaction signer's Sui address ]
+            primary_coin: :obj:  [ the coin object to merge into, this coin will remain after the transaction ]
+            coin_to_merge: :obj:  [ the coin object to be merged, this coin will be destroyed, the balance will be added to `primary_coin` ]
+            gas: :obj:  [ gas object to be used in this transaction, the gateway will pick one from the signer's possession if not provided ]
+            gas_budget: :obj: `integer`  [ the gas budget, the transaction will fail if the gas cost exceed the budget ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        TransactionBytes
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_mergeCoins"
+        params = [signer, primary_coin, coin_to_merge, gas, gas_budget]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def move_call(
+        self,
+        signer,
+        package_object_id,
+        module,
+        function,
+        type_arguments,
+        arguments,
+        gas,
+        gas_budget,
+        **options
+    ) -> dict:
+        """
+        the gas budget, the transaction will fail if the gas cost exceed the budget
+
+        Parameters
+        ----------
+            signer: :obj:  [ the transaction signer's Sui address ]
+            package_object_id: :obj:  [ the Move package ID, e.g. `0x2` ]
+            module: :obj: `string`  [ the Move module name, e.g. `devnet_nft` ]
+            function: :obj: `string`  [ the move function name, e.g. `mint` ]
+            type_arguments: :obj: `array`  [ the type arguments of the Move function ]
+            arguments: :obj: `array`  [ the arguments to be passed into the Move function, in [SuiJson](https://docs.sui.io/build/sui-json) format ]
+            gas: :obj:  [ gas object to be used in this transaction, the gateway will pick one from the signer's possession if not provided ]
+            gas_budget: :obj: `integer`  [ the gas budget, the transaction will fail if the gas cost exceed the budget ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        TransactionBytes
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_moveCall"
+        params = [
+            signer,
+            package_object_id,
+            module,
+            function,
+            type_arguments,
+            arguments,
+            gas,
+            gas_budget,
+        ]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def publish(self, sender, compiled_modules, gas, gas_budget, **options) -> dict:
+        """
+        the gas budget, the transaction will fail if the gas cost exceed the budget
+
+        Parameters
+        ----------
+            sender: :obj:  [ the transaction signer's Sui address ]
+            compiled_modules: :obj: `array`  [ the compiled bytes of a move module, the ]
+            gas: :obj:  [ gas object to be used in this transaction, the gateway will pick one from the signer's possession if not provided ]
+            gas_budget: :obj: `integer`  [ the gas budget, the transaction will fail if the gas cost exceed the budget ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        TransactionBytes
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_publish"
+        params = [sender, compiled_modules, gas, gas_budget]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def split_coin(
+        self, signer, coin_object_id, split_amounts, gas, gas_budget, **options
+    ) -> dict:
+        """
+        the gas budget, the transaction will fail if the gas cost exceed the budget
+
+        Parameters
+        ----------
+            signer: :obj:  [ the transaction signer's Sui address ]
+            coin_object_id: :obj:  [ the coin object to be spilt ]
+            split_amounts: :obj: `array`  [ the amounts to split out from the coin ]
+            gas: :obj:  [ gas object to be used in this transaction, the gateway will pick one from the signer's possession if not provided ]
+            gas_budget: :obj: `integer`  [ the gas budget, the transaction will fail if the gas cost exceed the budget ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        TransactionBytes
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_splitCoin"
+        params = [signer, coin_object_id, split_amounts, gas, gas_budget]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def subscribe_event(self, filter, **options) -> dict:
+        """
+        the filter criteria of the event stream, see the [Sui docs](https://docs.sui.io/build/pubsub#event-filters) for detailed examples.
+
+        Parameters
+        ----------
+            filter: :obj:  [ the filter criteria of the event stream, see the [Sui docs](https://docs.sui.io/build/pubsub#event-filters) for detailed examples. ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        SuiEventEnvelope
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_subscribeEvent"
+        params = [filter]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def sync_account_state(self, address, **options) -> None:
+        """
+        the Sui address to be synchronized
+
+        Parameters
+        ----------
+            address: :obj:  [ the Sui address to be synchronized ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        ()
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_syncAccountState"
+        params = [address]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def transfer_object(
+        self, signer, object_id, gas, gas_budget, recipient, **options
+    ) -> dict:
+        """
+        the recipient's Sui address
+
+        Parameters
+        ----------
+            signer: :obj:  [ the transaction signer's Sui address ]
+            object_id: :obj:  [ the ID of the object to be transferred ]
+            gas: :obj:  [ gas object to be used in this transaction, the gateway will pick one from the signer's possession if not provided ]
+            gas_budget: :obj: `integer`  [ the gas budget, the transaction will fail if the gas cost exceed the budget ]
+            recipient: :obj:  [ the recipient's Sui address ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        TransactionBytes
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_transferObject"
+        params = [signer, object_id, gas, gas_budget, recipient]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
+
+    def transfer_sui(
+        self, signer, sui_object_id, gas_budget, recipient, amount, **options
+    ) -> dict:
+        """
+        gas object to be used in this transaction, the gateway will pick one from the signer's possession if not provided
+
+        Parameters
+        ----------
+            signer: :obj:  [ the transaction signer's Sui address ]
+            sui_object_id: :obj:  [  ]
+            gas_budget: :obj: `integer`  [ the gas budget, the transaction will fail if the gas cost exceed the budget ]
+            recipient: :obj:  [  ]
+            amount: :obj: `integer`  [ gas object to be used in this transaction, the gateway will pick one from the signer's possession if not provided ]
+        options: :obj:`dict`, optional
+            Per-call overrides passed to rpc_request, e.g. `endpoint` or `timeout`
+
+        Returns
+        -------
+        TransactionBytes
+
+        Raises
+        ------
+        InvalidRPCReplyError
+            If received unknown result from endpoint
+
+        API Reference
+        -------------
+        https://docs.sui.io/build/json-rpc
+        """
+        method = "sui_transferSui"
+        params = [signer, sui_object_id, gas_budget, recipient, amount]
+        try:
+            result = self.rpc_request(method, params, **options)["result"]
+        except KeyError as e:
+            raise InvalidRPCReplyError(
+                method, options.get("endpoint", self.endpoint)
+            ) from e
+        return self.decode_result(method, result)
@@ -15,7 +15,7 @@ def batch_transaction(
     gas_budget,
     endpoint=_default_endpoint,
     timeout=_default_timeout,
-) -> list:
+) -> dict:
     """
     the gas budget, the transaction will fail if the gas cost exceed the budget
 
@@ -60,7 +60,7 @@ def execute_transaction(
     pub_key,
     endpoint=_default_endpoint,
     timeout=_default_timeout,
-) -> list:
+) -> dict:
     """
     signer's public key, as base-64 encoded string
 
@@ -362,7 +362,7 @@ def get_events_by_transaction(
         raise InvalidRPCReplyError(method, endpoint) from e
 
 
-def get_object(object_id, endpoint=_default_endpoint, timeout=_default_timeout) -> list:
+def get_object(object_id, endpoint=_default_endpoint, timeout=_default_timeout) -> dict:
     """
     the ID of the queried object
 
@@ -473,7 +473,7 @@ def get_objects_owned_by_object(
 
 def get_raw_object(
     object_id, endpoint=_default_endpoint, timeout=_default_timeout
-) -> list:
+) -> dict:
     """
     the id of the object
 
@@ -547,7 +547,7 @@ def get_recent_transactions(
 
 def get_total_transaction_number(
     endpoint=_default_endpoint, timeout=_default_timeout
-) -> list:
+) -> int:
     """
     Return the total number of transactions known to the server.
 
@@ -583,7 +583,7 @@ def get_total_transaction_number(
 
 def get_transaction(
     digest, endpoint=_default_endpoint, timeout=_default_timeout
-) -> list:
+) -> dict:
     """
     the digest of the queried transaction
 
@@ -851,7 +851,7 @@ def merge_coins(
     gas_budget,
     endpoint=_default_endpoint,
     timeout=_default_timeout,
-) -> list:
+) -> dict:
     """
     the gas budget, the transaction will fail if the gas cost exceed the budget
 
@@ -901,7 +901,7 @@ def move_call(
     gas_budget,
     endpoint=_default_endpoint,
     timeout=_default_timeout,
-) -> list:
+) -> dict:
     """
     the gas budget, the transaction will fail if the gas cost exceed the budget
 
@@ -959,7 +959,7 @@ def publish(
     gas_budget,
     endpoint=_default_endpoint,
     timeout=_default_timeout,
-) -> list:
+) -> dict:
     """
     the gas budget, the transaction will fail if the gas cost exceed the budget
 
@@ -1005,7 +1005,7 @@ def split_coin(
     gas_budget,
     endpoint=_default_endpoint,
     timeout=_default_timeout,
-) -> list:
+) -> dict:
     """
     the gas budget, the transaction will fail if the gas cost exceed the budget
 
@@ -1046,7 +1046,7 @@ def split_coin(
 
 def subscribe_event(
     filter, endpoint=_default_endpoint, timeout=_default_timeout
-) -> list:
+) -> dict:
     """
     the filter criteria of the event stream, see the [Sui docs](https://docs.sui.io/build/pubsub#event-filters) for detailed examples.
 
@@ -1083,7 +1083,7 @@ def subscribe_event(
 
 def sync_account_state(
     address, endpoint=_default_endpoint, timeout=_default_timeout
-) -> list:
+) -> None:
     """
     the Sui address to be synchronized
 
@@ -1126,7 +1126,7 @@ def transfer_object(
     recipient,
     endpoint=_default_endpoint,
     timeout=_default_timeout,
-) -> list:
+) -> dict:
     """
     the recipient's Sui address
 
@@ -1173,7 +1173,7 @@ def transfer_sui(
     amount,
     endpoint=_default_endpoint,
     timeout=_default_timeout,
-) -> list:
+) -> dict:
     """
     gas object to be used in this transaction, the gateway will pick one from the signer's possession if not provided
 
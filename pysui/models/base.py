@@ -0,0 +1,72 @@
+_registry = {}
+
+
+class Model:
+    """
+    Base of the generated response models
+
+    A model is a `__slots__` class, so it holds its fields without a per
+    instance dict. `_fields` lists (json key, attribute, nested model name)
+    for every field, the nested model is None for plain JSON values.
+    Keys not in the schema are dropped when decoding.
+    """
+
+    __slots__ = ()
+    _fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _registry[cls.__name__] = cls
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Model":
+        obj = cls.__new__(cls)
+        for key, attr, model in cls._fields:
+            value = data.get(key)
+            if model is not None and value is not None:
+                value = decode(value, model)
+            setattr(obj, attr, value)
+        return obj
+
+    def as_dict(self) -> dict:
+        """
+        JSON representation of the model, as returned by the RPC API
+        """
+        return {key: _encode(getattr(self, attr)) for key, attr, _ in self._fields}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, a) == getattr(other, a) for _, a, _ in self._fields)
+
+    def __repr__(self):
+        fields = ", ".join(f"{a}={getattr(self, a)!r}" for _, a, _ in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+def decode(value, model):
+    """
+    Decode a JSON object, or a list of them, into `model` (a Model or its name)
+    """
+    if isinstance(model, str):
+        model = _registry[model]
+    if isinstance(value, list):
+        return [decode(v, model) for v in value]
+    if isinstance(value, dict):
+        return model.from_dict(value)
+    return value
+
+
+def plain(value):
+    """
+    JSON form of an RPC result, whether or not the client decodes it into models
+    """
+    return _encode(value)
+
+
+def _encode(value):
+    if isinstance(value, Model):
+        return value.as_dict()
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    return value
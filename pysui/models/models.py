@@ -0,0 +1,278 @@
+# Generated by gen_methods.py from the Sui OpenRPC spec, do not edit.
+
+from pysui.models.base import Model, decode
+
+
+class GetObjectDataResponse(Model):
+    """
+    Object data, or why it is not available
+    """
+
+    __slots__ = (
+        "status",
+        "details",
+    )
+    _fields = (
+        ("status", "status", None),
+        ("details", "details", None),
+    )
+
+
+class GetRawObjectDataResponse(Model):
+    """
+    Object data with BCS encoded contents, or why it is not available
+    """
+
+    __slots__ = (
+        "status",
+        "details",
+    )
+    _fields = (
+        ("status", "status", None),
+        ("details", "details", None),
+    )
+
+
+class OwnedObjectRef(Model):
+    """
+    Object reference together with the owner of the object
+    """
+
+    __slots__ = (
+        "owner",
+        "reference",
+    )
+    _fields = (
+        ("owner", "owner", None),
+        ("reference", "reference", "SuiObjectRef"),
+    )
+
+
+class SuiCertifiedTransaction(Model):
+    """
+    Transaction certified by a quorum of validators
+    """
+
+    __slots__ = (
+        "transaction_digest",
+        "data",
+        "tx_signature",
+        "auth_sign_info",
+    )
+    _fields = (
+        ("transactionDigest", "transaction_digest", None),
+        ("data", "data", "SuiTransactionData"),
+        ("txSignature", "tx_signature", None),
+        ("authSignInfo", "auth_sign_info", None),
+    )
+
+
+class SuiEventEnvelope(Model):
+    """
+    Event emitted by a transaction
+    """
+
+    __slots__ = (
+        "timestamp",
+        "tx_digest",
+        "event",
+    )
+    _fields = (
+        ("timestamp", "timestamp", None),
+        ("txDigest", "tx_digest", None),
+        ("event", "event", None),
+    )
+
+
+class SuiExecutionStatus(Model):
+    """
+    Outcome of a transaction
+    """
+
+    __slots__ = (
+        "status",
+        "error",
+    )
+    _fields = (
+        ("status", "status", None),
+        ("error", "error", None),
+    )
+
+
+class SuiGasCostSummary(Model):
+    """
+    Gas charged by a transaction
+    """
+
+    __slots__ = (
+        "computation_cost",
+        "storage_cost",
+        "storage_rebate",
+    )
+    _fields = (
+        ("computationCost", "computation_cost", None),
+        ("storageCost", "storage_cost", None),
+        ("storageRebate", "storage_rebate", None),
+    )
+
+
+class SuiObjectInfo(Model):
+    """
+    Summary of an object owned by an address or object
+    """
+
+    __slots__ = (
+        "object_id",
+        "version",
+        "digest",
+        "type",
+        "owner",
+        "previous_transaction",
+    )
+    _fields = (
+        ("objectId", "object_id", None),
+        ("version", "version", None),
+        ("digest", "digest", None),
+        ("type", "type", None),
+        ("owner", "owner", None),
+        ("previousTransaction", "previous_transaction", None),
+    )
+
+
+class SuiObjectRef(Model):
+    """
+    Object reference, the ID, version and digest of an object
+    """
+
+    __slots__ = (
+        "object_id",
+        "version",
+        "digest",
+    )
+    _fields = (
+        ("objectId", "object_id", None),
+        ("version", "version", None),
+        ("digest", "digest", None),
+    )
+
+
+class SuiTransactionData(Model):
+    """
+    Data of a signed transaction
+    """
+
+    __slots__ = (
+        "transactions",
+        "sender",
+        "gas_payment",
+        "gas_budget",
+    )
+    _fields = (
+        ("transactions", "transactions", None),
+        ("sender", "sender", None),
+        ("gasPayment", "gas_payment", "SuiObjectRef"),
+        ("gasBudget", "gas_budget", None),
+    )
+
+
+class SuiTransactionEffects(Model):
+    """
+    Effects of an executed transaction
+    """
+
+    __slots__ = (
+        "status",
+        "gas_used",
+        "shared_objects",
+        "transaction_digest",
+        "created",
+        "mutated",
+        "unwrapped",
+        "deleted",
+        "wrapped",
+        "gas_object",
+        "events",
+        "dependencies",
+    )
+    _fields = (
+        ("status", "status", "SuiExecutionStatus"),
+        ("gasUsed", "gas_used", "SuiGasCostSummary"),
+        ("sharedObjects", "shared_objects", "SuiObjectRef"),
+        ("transactionDigest", "transaction_digest", None),
+        ("created", "created", "OwnedObjectRef"),
+        ("mutated", "mutated", "OwnedObjectRef"),
+        ("unwrapped", "unwrapped", "OwnedObjectRef"),
+        ("deleted", "deleted", "SuiObjectRef"),
+        ("wrapped", "wrapped", "SuiObjectRef"),
+        ("gasObject", "gas_object", "OwnedObjectRef"),
+        ("events", "events", None),
+        ("dependencies", "dependencies", None),
+    )
+
+
+class TransactionBytes(Model):
+    """
+    Unsigned transaction data, to be signed and executed
+    """
+
+    __slots__ = (
+        "tx_bytes",
+        "gas",
+        "input_objects",
+    )
+    _fields = (
+        ("txBytes", "tx_bytes", None),
+        ("gas", "gas", "SuiObjectRef"),
+        ("inputObjects", "input_objects", None),
+    )
+
+
+class TransactionEffectsResponse(Model):
+    """
+    Transaction, its effects and the time it was executed
+    """
+
+    __slots__ = (
+        "certificate",
+        "effects",
+        "timestamp_ms",
+        "parsed_data",
+    )
+    _fields = (
+        ("certificate", "certificate", "SuiCertifiedTransaction"),
+        ("effects", "effects", "SuiTransactionEffects"),
+        ("timestamp_ms", "timestamp_ms", None),
+        ("parsed_data", "parsed_data", None),
+    )
+
+
+# RPC method -> model of its result
+RESULT_MODELS = {
+    "sui_batchTransaction": "TransactionBytes",
+    "sui_getEventsByEventType": "SuiEventEnvelope",
+    "sui_getEventsByModule": "SuiEventEnvelope",
+    "sui_getEventsByObject": "SuiEventEnvelope",
+    "sui_getEventsByOwner": "SuiEventEnvelope",
+    "sui_getEventsBySender": "SuiEventEnvelope",
+    "sui_getEventsByTransaction": "SuiEventEnvelope",
+    "sui_getObject": "GetObjectDataResponse",
+    "sui_getObjectsOwnedByAddress": "SuiObjectInfo",
+    "sui_getObjectsOwnedByObject": "SuiObjectInfo",
+    "sui_getRawObject": "GetRawObjectDataResponse",
+    "sui_getTransaction": "TransactionEffectsResponse",
+    "sui_mergeCoins": "TransactionBytes",
+    "sui_moveCall": "TransactionBytes",
+    "sui_publish": "TransactionBytes",
+    "sui_splitCoin": "TransactionBytes",
+    "sui_subscribeEvent": "SuiEventEnvelope",
+    "sui_transferObject": "TransactionBytes",
+    "sui_transferSui": "TransactionBytes",
+}
+
+
+def decode_result(method, result):
+    """
+    Decode the `result` of `method` into its response model, if it has one
+    """
+    model = RESULT_MODELS.get(method)
+    return result if model is None else decode(result, model)
@@ -0,0 +1,134 @@
+import asyncio
+import json
+
+import aiohttp
+
+from . import codec
+from .exceptions import (
+    RequestsError,
+    RequestsStatusError,
+    RequestsTimeoutError,
+    RPCError,
+)
+from .request import (
+    _check_params,
+    _default_endpoint,
+    _default_timeout,
+    _error_code,
+    next_request_id,
+)
+
+
+async def async_base_request(
+    session,
+    method,
+    params=None,
+    endpoint=_default_endpoint,
+    timeout=_default_timeout,
+) -> bytes:
+    """
+    Basic RPC request, asyncio version of base_request
+
+    Parameters
+    ---------
+    session: :obj:`aiohttp.ClientSession`
+        Session (and connection pool) to send the request through
+    method: str
+        RPC Method to call
+    params: :obj:`list`, optional
+        Parameters for the RPC method
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+
+    Returns
+    -------
+    bytes
+        Raw output from the request
+
+    Raises
+    ------
+    TypeError
+        If params is not a list or None
+    RequestsTimeoutError
+        If request timed out
+    RequestsStatusError
+        If the endpoint replied with HTTP 429 or a 5xx status
+    RequestsError
+        If other request error occured
+    """
+    params = _check_params(params)
+    payload = {
+        "id": next_request_id(),
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": params,
+    }
+    return await _async_post(session, payload, endpoint, timeout)
+
+
+async def _async_post(session, payload, endpoint, timeout) -> bytes:
+    try:
+        async with session.post(
+            endpoint,
+            data=codec.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as resp:
+            if resp.status == 429 or resp.status >= 500:
+                raise RequestsStatusError(endpoint, resp.status)
+            return await resp.read()
+    except asyncio.TimeoutError as err:
+        raise RequestsTimeoutError(endpoint) from err
+    except aiohttp.ClientError as err:
+        raise RequestsError(endpoint) from err
+
+
+async def async_rpc_request(
+    session,
+    method,
+    params=None,
+    endpoint=_default_endpoint,
+    timeout=_default_timeout,
+) -> dict:
+    """
+    RPC request, asyncio version of rpc_request
+
+    Parameters
+    ---------
+    session: :obj:`aiohttp.ClientSession`
+        Session (and connection pool) to send the request through
+    method: str
+        RPC Method to call
+    params: :obj:`list`, optional
+        Parameters for the RPC method
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds
+
+    Returns
+    -------
+    dict
+        Returns dictionary representation of RPC response
+
+    Raises
+    ------
+    RPCError
+        If RPC response returned a blockchain error
+
+    See Also
+    --------
+    rpc_request
+    """
+    raw_resp = await async_base_request(session, method, params, endpoint, timeout)
+
+    try:
+        resp = codec.loads(raw_resp)
+        if "error" in resp:
+            error = resp["error"]
+            raise RPCError(method, endpoint, str(error), _error_code(error))
+        return resp
+    except json.decoder.JSONDecodeError as err:
+        raise RPCError(method, endpoint, raw_resp) from err
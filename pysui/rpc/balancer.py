@@ -0,0 +1,257 @@
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from pysui.includes.config import log
+
+from .exceptions import RequestsError, RequestsTimeoutError, RPCError
+from .request import rpc_request
+
+LEAST_LATENCY = "least_latency"
+LEAST_IN_FLIGHT = "least_in_flight"
+
+_default_health_interval = 10
+_default_health_timeout = 5
+_default_cooldown = 30
+_default_alpha = 0.3
+_default_samples = 200
+
+
+class EndpointState:
+    """
+    Rolling health of one endpoint
+
+    Attributes
+    ----------
+    latency: :obj:`float`
+        Exponentially weighted moving average of the request latency in seconds,
+        None until the first request completes
+    in_flight: :obj:`int`
+        Requests currently sent to the endpoint
+    healthy: :obj:`bool`
+        False after a failed health check or request, until one succeeds
+    failed_at: :obj:`float`
+        time.monotonic() of the last failed health check or request
+    samples: :obj:`deque`
+        Latencies of the most recent successful requests
+    """
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.latency = None
+        self.samples = deque(maxlen=_default_samples)
+        self.in_flight = 0
+        self.healthy = True
+        self.failed_at = None
+        self.requests = 0
+        self.errors = 0
+
+    def as_dict(self) -> dict:
+        return dict(
+            latency=self.latency,
+            in_flight=self.in_flight,
+            healthy=self.healthy,
+            requests=self.requests,
+            errors=self.errors,
+        )
+
+
+class EndpointPool:
+    """
+    Routes requests across several endpoints
+
+    Reads go to the healthy endpoint with the lowest latency (`least_latency`)
+    or the fewest requests in flight (`least_in_flight`). Writes always go to
+    the write endpoint. A background thread checks every endpoint with
+    sui_getTotalTransactionNumber, so a failing or slow node is drained
+    automatically and picked up again once it recovers. A drained endpoint
+    is also given requests again `cooldown` seconds after it last failed,
+    so it can recover when health checks are disabled.
+
+    Parameters
+    ----------
+    endpoints: :obj:`list`
+        Endpoints to route reads across
+    write_endpoint: :obj:`str`, optional
+        Endpoint for state changing methods, defaults to the first endpoint
+    strategy: :obj:`str`, optional
+        `least_latency` or `least_in_flight`
+    health_interval: :obj:`int`, optional
+        Seconds between health checks, 0 disables them
+    health_timeout: :obj:`int`, optional
+        Timeout in seconds of a health check
+    cooldown: :obj:`int`, optional
+        Seconds after its last failure a drained endpoint is tried again
+    pool: :obj:`SessionPool`, optional
+        Connection pool used by the health checks
+    """
+
+    def __init__(
+        self,
+        endpoints,
+        write_endpoint=None,
+        strategy=LEAST_LATENCY,
+        health_interval=_default_health_interval,
+        health_timeout=_default_health_timeout,
+        pool=None,
+        cooldown=_default_cooldown,
+    ):
+        if not endpoints:
+            raise ValueError("At least one endpoint is required")
+        if strategy not in (LEAST_LATENCY, LEAST_IN_FLIGHT):
+            raise ValueError(f"Unknown strategy {strategy}")
+
+        self.write_endpoint = write_endpoint or endpoints[0]
+        self.strategy = strategy
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.cooldown = cooldown
+        self.pool = pool
+        self.states = {e: EndpointState(e) for e in endpoints}
+        self.states.setdefault(self.write_endpoint, EndpointState(self.write_endpoint))
+        self.read_endpoints = list(endpoints)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def select(self, write=False, exclude=()) -> str:
+        """
+        Endpoint to send the next request to
+
+        Parameters
+        ----------
+        write: :obj:`bool`, optional
+            Select the write endpoint
+        exclude: :obj:`tuple`, optional
+            Endpoints not to select, e.g. ones that already failed this request
+        """
+        if write:
+            return self.write_endpoint
+
+        with self._lock:
+            candidates = [
+                self.states[e] for e in self.read_endpoints if e not in exclude
+            ]
+            if not candidates:
+                candidates = [self.states[e] for e in self.read_endpoints]
+            retry = time.monotonic() - self.cooldown
+            healthy = [
+                s for s in candidates if s.healthy or s.failed_at <= retry
+            ] or candidates
+
+            if self.strategy == LEAST_IN_FLIGHT:
+                key = lambda s: (s.in_flight, s.latency or 0.0)
+            else:
+                # endpoints without a sample yet are tried first
+                key = lambda s: (s.latency or 0.0, s.in_flight)
+            best = min(key(s) for s in healthy)
+            return random.choice([s for s in healthy if key(s) == best]).endpoint
+
+    def record(self, endpoint, elapsed, ok=True) -> None:
+        """
+        Record the outcome of a request to `endpoint`
+        """
+        with self._lock:
+            state = self.states.get(endpoint)
+            if state is None:
+                return
+            state.requests += 1
+            if not ok:
+                state.errors += 1
+                state.healthy = False
+                state.failed_at = time.monotonic()
+                return
+            state.healthy = True
+            state.samples.append(elapsed)
+            state.latency = (
+                elapsed
+                if state.latency is None
+                else _default_alpha * elapsed + (1 - _default_alpha) * state.latency
+            )
+
+    def percentile(self, endpoint, q) -> float:
+        """
+        q-th percentile of the recent latencies of `endpoint`, None without samples
+        """
+        with self._lock:
+            state = self.states.get(endpoint)
+            samples = sorted(state.samples) if state is not None else []
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * q / 100))]
+
+    @contextmanager
+    def track(self, endpoint):
+        """
+        Context manager counting a request in flight to `endpoint` and recording
+        its latency, or a failure if a transport error is raised
+
+        The latency runs to the end of the block, or to the first call of the
+        function it yields, e.g. once the headers of a streamed body arrived
+        """
+        with self._lock:
+            state = self.states.get(endpoint)
+            if state is not None:
+                state.in_flight += 1
+        st = time.perf_counter()
+        end = []
+        ok = True
+        try:
+            yield lambda: end or end.append(time.perf_counter())
+        except (RequestsError, RequestsTimeoutError, RPCError) as e:
+            # RPC errors reported by a responsive node do not make it unhealthy
+            ok = isinstance(e, RPCError)
+            raise
+        finally:
+            with self._lock:
+                if state is not None:
+                    state.in_flight -= 1
+            self.record(endpoint, (end[0] if end else time.perf_counter()) - st, ok)
+
+    def check(self) -> None:
+        """
+        Run one health check against every endpoint
+        """
+        for endpoint in list(self.states):
+            st = time.perf_counter()
+            try:
+                rpc_request(
+                    "sui_getTotalTransactionNumber",
+                    endpoint=endpoint,
+                    timeout=self.health_timeout,
+                    pool=self.pool,
+                )
+                self.record(endpoint, time.perf_counter() - st)
+            except (RequestsError, RequestsTimeoutError, RPCError):
+                self.record(endpoint, time.perf_counter() - st, ok=False)
+
+    def start(self) -> None:
+        """
+        Start the background health checks
+        """
+        if self._thread is not None or not self.health_interval:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.check()
+            except Exception as e:
+                log.error(f"Endpoint health check failed: {e}")
+            self._stop.wait(self.health_interval)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {e: s.as_dict() for e, s in self.states.items()}
@@ -0,0 +1,186 @@
+import threading
+import time
+from collections import deque
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_default_failure_rate = 0.5
+_default_slow_call_rate = 1.0
+_default_window = 20
+_default_min_calls = 10
+_default_open_timeout = 30
+_default_half_open_calls = 1
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one endpoint
+
+    CLOSED: requests flow, outcomes of the last `window` calls are tracked and
+    the breaker opens once `min_calls` were seen and the failure rate reaches
+    `failure_rate` or the share of calls slower than `slow_call_threshold`
+    reaches `slow_call_rate`.
+    OPEN: requests fail fast for `open_timeout` seconds.
+    HALF_OPEN: up to `half_open_calls` trial requests are let through, the
+    breaker closes if they all succeed and opens again on the first failure.
+
+    Parameters
+    ----------
+    endpoint: :obj:`str`
+        Endpoint guarded by the breaker
+    failure_rate: :obj:`float`, optional
+        Share of failed calls in the window that opens the breaker
+    slow_call_threshold: :obj:`float`, optional
+        Seconds after which a successful call counts as slow, None to ignore latency
+    slow_call_rate: :obj:`float`, optional
+        Share of slow calls in the window that opens the breaker
+    window: :obj:`int`, optional
+        Number of most recent calls the rates are computed over
+    min_calls: :obj:`int`, optional
+        Calls needed in the window before the breaker can open
+    open_timeout: :obj:`float`, optional
+        Seconds the breaker stays open before trial requests
+    half_open_calls: :obj:`int`, optional
+        Trial requests needed to close the breaker again
+    on_state_change: :obj:`callable`, optional
+        Called as on_state_change(endpoint, old_state, new_state)
+    """
+
+    def __init__(
+        self,
+        endpoint,
+        failure_rate=_default_failure_rate,
+        slow_call_threshold=None,
+        slow_call_rate=_default_slow_call_rate,
+        window=_default_window,
+        min_calls=_default_min_calls,
+        open_timeout=_default_open_timeout,
+        half_open_calls=_default_half_open_calls,
+        on_state_change=None,
+    ):
+        self.endpoint = endpoint
+        self.failure_rate = failure_rate
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_call_rate = slow_call_rate
+        self.min_calls = min_calls
+        self.open_timeout = open_timeout
+        self.half_open_calls = half_open_calls
+        self.on_state_change = on_state_change
+        self._calls = deque(maxlen=window)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trials = 0
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self._open_expired():
+                return HALF_OPEN
+            return self._state
+
+    def _open_expired(self) -> bool:
+        return time.monotonic() - self._opened_at >= self.open_timeout
+
+    def _transition(self, new):
+        # called with the lock held, returns the hook call to make once released
+        old, self._state = self._state, new
+        if new == OPEN:
+            self._opened_at = time.monotonic()
+        if new != CLOSED:
+            self._trials = self._successes = 0
+        else:
+            self._calls.clear()
+        if self.on_state_change is None or old == new:
+            return None
+        return lambda: self.on_state_change(self.endpoint, old, new)
+
+    def allow(self) -> bool:
+        """
+        True if a request may be sent now, counts it as a trial when half open
+        """
+        notify = None
+        with self._lock:
+            if self._state == OPEN:
+                if not self._open_expired():
+                    return False
+                notify = self._transition(HALF_OPEN)
+            if self._state == HALF_OPEN:
+                allowed = self._trials < self.half_open_calls
+                if allowed:
+                    self._trials += 1
+            else:
+                allowed = True
+        if notify is not None:
+            notify()
+        return allowed
+
+    def record(self, elapsed, ok=True) -> None:
+        """
+        Record the outcome of a request allowed by the breaker
+        """
+        slow = (
+            ok
+            and self.slow_call_threshold is not None
+            and elapsed > self.slow_call_threshold
+        )
+        notify = None
+        with self._lock:
+            if self._state == HALF_OPEN:
+                if not ok or slow:
+                    notify = self._transition(OPEN)
+                else:
+                    self._successes += 1
+                    if self._successes >= self.half_open_calls:
+                        notify = self._transition(CLOSED)
+            elif self._state == CLOSED:
+                self._calls.append((ok, slow))
+                if len(self._calls) >= self.min_calls:
+                    n = len(self._calls)
+                    failures = sum(1 for o, _ in self._calls if not o)
+                    slows = sum(1 for _, s in self._calls if s)
+                    if (
+                        failures / n >= self.failure_rate
+                        or slows / n >= self.slow_call_rate
+                    ):
+                        notify = self._transition(OPEN)
+        if notify is not None:
+            notify()
+
+
+class CircuitBreakers:
+    """
+    One CircuitBreaker per endpoint, created on first use
+
+    Takes the keyword arguments of CircuitBreaker, which apply to every endpoint.
+    """
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = self._breakers[endpoint] = CircuitBreaker(
+                    endpoint, **self.kwargs
+                )
+            return breaker
+
+    def open_endpoints(self) -> list:
+        """
+        Endpoints whose breaker is open and not yet due for a trial request
+        """
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return [b.endpoint for b in breakers if b.state == OPEN]
+
+    def stats(self) -> dict:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {b.endpoint: b.state for b in breakers}
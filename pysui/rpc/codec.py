@@ -0,0 +1,132 @@
+import importlib
+import json
+import re
+
+_default_backends = ("orjson", "msgspec", "ujson", "json")
+# integers of 19 digits and more may not fit in 64 bits (e.g. u128 balances)
+_long_int = re.compile(rb"\d{19}")
+_long_int_str = re.compile(r"\d{19}")
+
+
+def _stdlib_dumps(obj) -> bytes:
+    return json.dumps(obj).encode()
+
+
+class JSONCodec:
+    """
+    JSON encoder / decoder used for RPC payloads
+
+    `dumps` returns bytes and `loads` accepts the raw response bytes, so
+    backends that parse bytes natively (orjson, msgspec) never build an
+    intermediate str. Input a backend rejects is retried with the stdlib
+    codec, errors are always raised as `json.JSONDecodeError` / `TypeError`
+    like the stdlib codec does. Backends that turn integers beyond 64 bits
+    into floats instead of failing are given `exact_ints=False`, input
+    containing such long numbers is then decoded by the stdlib codec so
+    integers always keep their exact value.
+
+    Attributes
+    ----------
+    name: :obj:`str`
+        Backend module, `orjson`, `msgspec`, `ujson` or `json`
+    """
+
+    def __init__(self, name, dumps, loads, errors=(), exact_ints=True):
+        self.name = name
+        self._dumps = dumps
+        self._loads = loads
+        self._errors = errors
+        self._exact_ints = exact_ints
+
+    def dumps(self, obj) -> bytes:
+        try:
+            return self._dumps(obj)
+        except (TypeError, OverflowError) + self._errors:
+            return _stdlib_dumps(obj)
+
+    def loads(self, data):
+        if not self._exact_ints and _has_long_int(data):
+            return json.loads(data)
+        try:
+            return self._loads(data)
+        except self._errors:
+            return json.loads(data)
+
+
+def _has_long_int(data) -> bool:
+    pattern = _long_int_str if isinstance(data, str) else _long_int
+    return pattern.search(data) is not None
+
+
+def _make(name) -> JSONCodec:
+    module = importlib.import_module(name)
+    if name == "orjson":
+        # orjson parses integers above 64 bits as float
+        return JSONCodec(
+            name,
+            module.dumps,
+            module.loads,
+            (module.JSONDecodeError,),
+            exact_ints=False,
+        )
+    if name == "msgspec":
+        return JSONCodec(
+            name,
+            module.json.Encoder().encode,
+            module.json.Decoder().decode,
+            (module.DecodeError, module.EncodeError),
+            exact_ints=False,
+        )
+    if name == "ujson":
+        return JSONCodec(
+            name, lambda obj: module.dumps(obj).encode(), module.loads, (ValueError,)
+        )
+    if name == "json":
+        return JSONCodec(name, _stdlib_dumps, json.loads)
+    raise ValueError(f"Unknown JSON backend {name}")
+
+
+def get_codec(name=None) -> JSONCodec:
+    """
+    Codec for backend `name`, or the fastest installed backend if None
+
+    Raises
+    ------
+    ImportError
+        If the requested backend is not installed
+    ValueError
+        If the backend is not supported
+    """
+    if name is not None:
+        return _make(name)
+    for backend in _default_backends:
+        try:
+            return _make(backend)
+        except ImportError:
+            continue
+
+
+_codec = get_codec()
+
+
+def set_codec(name=None) -> JSONCodec:
+    """
+    Select the process wide codec used for every RPC request, see get_codec
+    """
+    global _codec
+    _codec = get_codec(name)
+    return _codec
+
+
+def dumps(obj) -> bytes:
+    """
+    Encode `obj` with the selected codec
+    """
+    return _codec.dumps(obj)
+
+
+def loads(data):
+    """
+    Decode `data` (bytes or str) with the selected codec
+    """
+    return _codec.loads(data)
@@ -6,8 +6,9 @@ class RPCError(RuntimeError):
     Exception raised when RPC call returns an error
     """
 
-    def __init__(self, method, endpoint, error):
+    def __init__(self, method, endpoint, error, code=None):
         self.error = error
+        self.code = code
         super().__init__(f"Error in reply from {endpoint}: {method} returned {error}\n")
 
 
@@ -27,3 +28,27 @@ class RequestsTimeoutError(requests.exceptions.Timeout):
 
     def __init__(self, endpoint):
         super().__init__(f"Error connecting to {endpoint}")
+
+
+class RequestsStatusError(RequestsError):
+    """
+    Wrapper for HTTP error statuses, e.g. 429 Too Many Requests or 503 Service Unavailable
+    """
+
+    def __init__(self, endpoint, status_code):
+        self.status_code = status_code
+        requests.exceptions.RequestException.__init__(
+            self, f"HTTP {status_code} from {endpoint}"
+        )
+
+
+class CircuitOpenError(RequestsError):
+    """
+    Raised without sending a request while the circuit breaker of an endpoint is open
+    """
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        requests.exceptions.RequestException.__init__(
+            self, f"Circuit open for {endpoint}"
+        )
@@ -0,0 +1,102 @@
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+_default_percentile = 95
+_default_min_delay = 0.01
+_default_delay = 1
+_default_max_workers = 20
+_default_min_samples = 20
+
+
+class HedgePolicy:
+    """
+    Hedged requests for idempotent reads
+
+    The request is sent to a primary endpoint. If no reply arrived after the
+    `percentile` latency of that endpoint, a duplicate is sent to a second
+    endpoint and the first good reply wins. The loser cannot be aborted
+    mid-flight, its reply is discarded.
+
+    Parameters
+    ----------
+    percentile: :obj:`int`, optional
+        Latency percentile of the primary endpoint to wait before hedging
+    min_delay: :obj:`float`, optional
+        Lower bound of the hedge delay in seconds
+    default_delay: :obj:`float`, optional
+        Hedge delay in seconds until `min_samples` latencies are known
+    min_samples: :obj:`int`, optional
+        Number of latency samples needed to use the percentile
+    max_workers: :obj:`int`, optional
+        Maximum number of requests in flight through the policy
+
+    Attributes
+    ----------
+    issued: :obj:`int`
+        Duplicate requests sent
+    won: :obj:`int`
+        Duplicate requests that replied first
+    """
+
+    def __init__(
+        self,
+        percentile=_default_percentile,
+        min_delay=_default_min_delay,
+        default_delay=_default_delay,
+        min_samples=_default_min_samples,
+        max_workers=_default_max_workers,
+    ):
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.default_delay = default_delay
+        self.min_samples = min_samples
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.issued = 0
+        self.won = 0
+
+    def delay(self, balancer, endpoint) -> float:
+        """
+        Seconds to wait on `endpoint` before sending the hedge
+        """
+        state = balancer.states.get(endpoint)
+        if state is None or len(state.samples) < self.min_samples:
+            return self.default_delay
+        return max(self.min_delay, balancer.percentile(endpoint, self.percentile))
+
+    def call(self, fn, primary, secondary, delay):
+        """
+        Return fn(primary), or fn(secondary) if that replies first once hedged
+
+        Raises the error of the primary request if both fail.
+        """
+        with self._lock:
+            self.requests += 1
+        first = self._executor.submit(fn, primary)
+        done, _ = wait([first], timeout=delay)
+        if done:
+            return first.result()
+
+        with self._lock:
+            self.issued += 1
+        hedge = self._executor.submit(fn, secondary)
+        pending = {first, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            self.won += 1
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+        return first.result()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(requests=self.requests, issued=self.issued, won=self.won)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,369 @@
+import re
+
+from . import codec
+from .exceptions import RPCError
+from .request import (
+    _default_endpoint,
+    _default_timeout,
+    _error_code,
+    base_request,
+)
+
+_ws = re.compile(rb"[ \t\n\r]*")
+_string = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+# a whole string or one bracket, strings are matched as one token so brackets
+# inside them are never counted
+_token = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]|"')
+_pair = re.compile(rb"\[\]|{}")
+_scalar_end = re.compile(rb"[,\]}\s]")
+_not_brackets = bytes(c for c in range(256) if c not in b"[]{}")
+
+_quote, _colon = ord('"'), ord(":")
+_open_obj, _close_obj, _open_arr, _close_arr = map(ord, "{}[]")
+
+_default_scan_chunk = 1 << 16
+
+_missing = object()
+
+
+class Incomplete(ValueError):
+    """
+    Raised by the scanner when the buffer ends inside a value
+    """
+
+
+def skip_ws(buf, pos) -> int:
+    return _ws.match(buf, pos).end()
+
+
+def _scan_tokens(buf, pos, depth) -> int:
+    # end of the container once `depth` open brackets from `pos` are closed
+    for m in _token.finditer(buf, pos):
+        c = buf[m.start()]
+        if c == _open_obj or c == _open_arr:
+            depth += 1
+        elif c == _quote:
+            if m.end() - m.start() == 1:
+                # unterminated string
+                raise Incomplete(pos)
+        else:
+            depth -= 1
+            if depth == 0:
+                return m.end()
+    raise Incomplete(pos)
+
+
+def _skip_container(buf, pos, chunk=_default_scan_chunk) -> int:
+    # Brackets are counted a chunk at a time with C level operations only:
+    # escapes are masked, strings dropped by splitting on quotes, everything
+    # but brackets deleted and matched pairs cancelled, which leaves the
+    # closes and opens the chunk nets out to. Only the chunk in which the
+    # container ends is scanned token by token.
+    if len(buf) - pos <= chunk:
+        return _scan_tokens(buf, pos, 0)
+    depth = 1
+    i = pos + 1
+    n = len(buf)
+    while i < n:
+        seg = buf[i : i + chunk]
+        if b"\\" in seg:
+            # same length, so offsets are kept
+            seg = seg.replace(b"\\\\", b"__").replace(b'\\"', b"__")
+        parts = seg.split(b'"')
+        if len(parts) % 2 == 0:
+            # the chunk ends inside a string, stop before it
+            cut = len(seg) - len(parts[-1]) - 1
+            if cut == 0:
+                # a string longer than the chunk
+                m = _string.match(buf, i)
+                if m is None:
+                    raise Incomplete(pos)
+                i = m.end()
+                continue
+            del parts[-1]
+        else:
+            cut = len(seg)
+        brackets = b"".join(parts[::2]).translate(None, _not_brackets)
+        while True:
+            reduced = _pair.sub(b"", brackets)
+            if len(reduced) == len(brackets):
+                break
+            brackets = reduced
+        closes = len(brackets) - len(brackets.lstrip(b"]}"))
+        if closes >= depth:
+            return _scan_tokens(buf, i, depth)
+        depth += len(brackets) - 2 * closes
+        i += cut
+    raise Incomplete(pos)
+
+
+def skip_value(buf, pos, final=True) -> int:
+    """
+    End offset of the JSON value starting at `pos` in `buf`, without decoding it
+
+    Nothing is built while skipping: strings are matched by a regular
+    expression, numbers and literals end at the next delimiter and objects
+    and arrays at the bracket closing them.
+
+    Parameters
+    ----------
+    buf: :obj:`bytes`
+        Raw JSON
+    pos: :obj:`int`
+        Offset of the value, leading whitespace is skipped
+    final: :obj:`bool`, optional
+        False if more data may follow `buf`, a number at the very end of the
+        buffer is then reported as Incomplete
+
+    Raises
+    ------
+    Incomplete
+        If the value does not end within `buf`
+    """
+    pos = skip_ws(buf, pos)
+    if pos >= len(buf):
+        raise Incomplete(pos)
+    c = buf[pos]
+    if c == _quote:
+        m = _string.match(buf, pos)
+        if m is None:
+            raise Incomplete(pos)
+        return m.end()
+    if c == _open_obj or c == _open_arr:
+        return _skip_container(buf, pos)
+    m = _scalar_end.search(buf, pos)
+    if m is not None:
+        return m.start()
+    if not final:
+        raise Incomplete(pos)
+    return len(buf)
+
+
+def _expect(buf, pos, char) -> int:
+    if pos >= len(buf) or buf[pos] != char:
+        raise ValueError(f"Expected {chr(char)!r} at offset {pos}")
+    return skip_ws(buf, pos + 1)
+
+
+def members(buf, pos, skip=skip_value):
+    """
+    Yield (key, value offset) for every member of the object at `pos`,
+    values are passed over with `skip`
+    """
+    pos = _expect(buf, skip_ws(buf, pos), _open_obj)
+    if buf[pos : pos + 1] == b"}":
+        return
+    while True:
+        m = _string.match(buf, pos)
+        if m is None:
+            raise ValueError(f"Expected a key at offset {pos}")
+        key = m.group()
+        key = key[1:-1].decode() if b"\\" not in key else codec.loads(key)
+        pos = _expect(buf, skip_ws(buf, m.end()), _colon)
+        yield key, pos
+        pos = skip_ws(buf, skip(buf, pos))
+        if buf[pos : pos + 1] != b",":
+            _expect(buf, pos, _close_obj)
+            return
+        pos = skip_ws(buf, pos + 1)
+
+
+def elements(buf, pos, skip=skip_value):
+    """
+    Yield the offset of every element of the array at `pos`, elements are
+    passed over with `skip`
+    """
+    pos = _expect(buf, skip_ws(buf, pos), _open_arr)
+    if buf[pos : pos + 1] == b"]":
+        return
+    while True:
+        yield pos
+        pos = skip_ws(buf, skip(buf, pos))
+        if buf[pos : pos + 1] != b",":
+            _expect(buf, pos, _close_arr)
+            return
+        pos = skip_ws(buf, pos + 1)
+
+
+def split_pointer(pointer: str) -> list:
+    """
+    Reference tokens of a JSON pointer (RFC 6901), e.g. /result/0/objectId
+    """
+    if not pointer:
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer {pointer}")
+    return [t.replace("~1", "/").replace("~0", "~") for t in pointer[1:].split("/")]
+
+
+def locate(buf, tokens, pos=0, skip=skip_value) -> int:
+    """
+    Offset of the value at `tokens` below the value at `pos`
+
+    Raises
+    ------
+    KeyError
+        If the path does not exist
+    """
+    for token in tokens:
+        pos = skip_ws(buf, pos)
+        c = buf[pos] if pos < len(buf) else None
+        found = None
+        if c == _open_obj:
+            found = next((p for k, p in members(buf, pos, skip) if k == token), None)
+        elif c == _open_arr and token.isdigit():
+            index = int(token)
+            found = next(
+                (p for i, p in enumerate(elements(buf, pos, skip)) if i == index),
+                None,
+            )
+        if found is None:
+            raise KeyError(token)
+        pos = found
+    return skip_ws(buf, pos)
+
+
+class LazyResponse:
+    """
+    RPC response decoded on demand
+
+    Holds the raw response bytes and only decodes the values asked for,
+    located with JSON pointers (RFC 6901) by a scanner that skips over
+    everything else, e.g. `resp.get("/result/effects/status/status")`.
+    Skipped values are never built (see skip_value), so memory stays at
+    the size of the raw response plus the values returned, and the cost is
+    one pass up to the requested field and nothing after it.
+
+    If the response has no `result`, looking up a path below it raises the
+    RPCError the node replied with.
+
+    Parameters
+    ----------
+    raw: :obj:`bytes`
+        Raw JSON-RPC response
+    method: :obj:`str`, optional
+        RPC method, for error reporting
+    endpoint: :obj:`str`, optional
+        Endpoint that replied, for error reporting
+    """
+
+    def __init__(self, raw, method=None, endpoint=None):
+        self.raw = raw if isinstance(raw, bytes) else raw.encode()
+        self.method = method
+        self.endpoint = endpoint
+        self._decoded = _missing
+
+    def _value(self, start):
+        return codec.loads(self.raw[start : skip_value(self.raw, start)])
+
+    def _locate(self, pointer) -> int:
+        tokens = split_pointer(pointer)
+        try:
+            return locate(self.raw, tokens, 0)
+        except KeyError:
+            if tokens and tokens[0] == "result":
+                self._raise_error()
+            raise
+        except ValueError as err:
+            raise RPCError(self.method, self.endpoint, self.raw) from err
+
+    def _raise_error(self):
+        try:
+            error = self._value(locate(self.raw, ["error"], 0))
+        except (KeyError, ValueError):
+            pos = skip_ws(self.raw, 0)
+            if self.raw[pos : pos + 1] != b"{":
+                # not a JSON-RPC reply, e.g. an HTML error page
+                raise RPCError(self.method, self.endpoint, self.raw)
+            return
+        raise RPCError(self.method, self.endpoint, str(error), _error_code(error))
+
+    def raw_value(self, pointer: str) -> bytes:
+        """
+        Undecoded JSON of the value at `pointer`
+        """
+        start = self._locate(pointer)
+        return self.raw[start : skip_value(self.raw, start)]
+
+    def get(self, pointer: str, default=_missing):
+        """
+        Decoded value at `pointer`, `default` if given and the path does not exist
+
+        Raises
+        ------
+        KeyError
+            If the path does not exist and no default is given
+        RPCError
+            If the response is an error or not JSON
+        """
+        try:
+            start = self._locate(pointer)
+        except KeyError:
+            if default is _missing:
+                raise
+            return default
+        try:
+            return self._value(start)
+        except ValueError as err:
+            raise RPCError(self.method, self.endpoint, self.raw) from err
+
+    def select(self, *pointers) -> dict:
+        """
+        {pointer: value} for every pointer, None for paths that do not exist
+        """
+        return {p: self.get(p, None) for p in pointers}
+
+    def each(self, pointer="/result", field="", default=None):
+        """
+        Yield the value at `field` of every element of the array at `pointer`
+
+        e.g. `resp.each("/result", "/objectId")` for get_objects_owned_by_address,
+        elements without `field` yield `default`. The array is decoded in one
+        go, which is faster than scanning every element.
+        """
+        tokens = split_pointer(field)
+        for value in self.get(pointer):
+            for token in tokens:
+                if isinstance(value, list) and token.isdigit():
+                    value = value[int(token)] if int(token) < len(value) else _missing
+                elif isinstance(value, dict):
+                    value = value.get(token, _missing)
+                else:
+                    value = _missing
+                if value is _missing:
+                    break
+            yield default if value is _missing else value
+
+    def decode(self) -> dict:
+        """
+        The whole response, decoded once
+        """
+        if self._decoded is _missing:
+            self._decoded = codec.loads(self.raw)
+        return self._decoded
+
+
+def lazy_rpc_request(
+    method,
+    params=None,
+    endpoint=_default_endpoint,
+    timeout=_default_timeout,
+    pool=None,
+) -> LazyResponse:
+    """
+    RPC request whose response is decoded on demand
+
+    Takes the same parameters as rpc_request
+
+    Returns
+    -------
+    LazyResponse
+        Raw response, RPC errors are raised when `result` is accessed
+
+    See Also
+    --------
+    rpc_request
+    """
+    return LazyResponse(
+        base_request(method, params, endpoint, timeout, pool), method, endpoint
+    )
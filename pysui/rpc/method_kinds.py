@@ -0,0 +1,49 @@
+# Classification of SUI RPC methods by how their results may be reused
+
+# Keyed by a transaction digest, the result never changes once finalized
+IMMUTABLE_METHODS = frozenset(
+    {
+        "sui_getEventsByTransaction",
+        "sui_getTransaction",
+    }
+)
+
+# Read a single object, the result is pinned to the returned object version
+OBJECT_METHODS = frozenset(
+    {
+        "sui_getObject",
+        "sui_getRawObject",
+    }
+)
+
+# Build transaction bytes, the referenced objects change once executed
+BUILD_METHODS = frozenset(
+    {
+        "sui_batchTransaction",
+        "sui_mergeCoins",
+        "sui_moveCall",
+        "sui_publish",
+        "sui_splitCoin",
+        "sui_transferObject",
+        "sui_transferSui",
+    }
+)
+
+# Submit signed transactions to the chain
+EXECUTE_METHODS = frozenset(
+    {
+        "sui_executeTransaction",
+    }
+)
+
+# Change state on the node / chain, pinned to the write endpoint of an EndpointPool
+WRITE_METHODS = (
+    BUILD_METHODS
+    | EXECUTE_METHODS
+    | frozenset(
+        {
+            "sui_subscribeEvent",
+            "sui_syncAccountState",
+        }
+    )
+)
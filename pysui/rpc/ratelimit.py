@@ -0,0 +1,138 @@
+import asyncio
+import math
+import threading
+import time
+
+from .method_kinds import WRITE_METHODS
+
+READ = "read"
+WRITE = "write"
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second, holding at most `burst`
+
+    Tokens are reserved up front, a caller that finds the bucket empty is told
+    how long to wait for its token instead of polling. Waiters are therefore
+    served in arrival order at exactly `rate`.
+
+    Parameters
+    ----------
+    rate: :obj:`float`
+        Tokens added per second
+    burst: :obj:`int`, optional
+        Capacity of the bucket, defaults to one second worth of tokens
+    """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst or max(1, math.ceil(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def reserve(self, tokens=1) -> float:
+        """
+        Take `tokens` from the bucket, returns the seconds to wait before using them
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.waited += wait
+            return wait
+
+    def acquire(self, tokens=1) -> None:
+        """
+        Block until `tokens` are available
+        """
+        wait = self.reserve(tokens)
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens=1) -> None:
+        """
+        asyncio version of `acquire`, does not block the event loop
+        """
+        wait = self.reserve(tokens)
+        if wait:
+            await asyncio.sleep(wait)
+
+
+class RateLimiter:
+    """
+    Client side rate limits per endpoint and method class
+
+    Requests sending a state changing method (see `WRITE_METHODS`) take a
+    token from the write bucket of their endpoint, all others from the read
+    bucket. A JSON-RPC batch takes one token per HTTP request.
+
+    Parameters
+    ----------
+    read_rate: :obj:`float`, optional
+        Read requests per second to each endpoint, None for no limit
+    write_rate: :obj:`float`, optional
+        Write requests per second to each endpoint, None for no limit
+    burst: :obj:`int`, optional
+        Requests that may be sent at once after an idle period, defaults to
+        one second worth of requests
+    endpoints: :obj:`dict`, optional
+        {endpoint: (read_rate, write_rate)} overriding the rates for that endpoint
+    """
+
+    def __init__(self, read_rate=None, write_rate=None, burst=None, endpoints=None):
+        self.rates = {READ: read_rate, WRITE: write_rate}
+        self.burst = burst
+        self.endpoints = endpoints or {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, endpoint, methods) -> TokenBucket:
+        """
+        Bucket limiting requests to `endpoint` sending `methods`, None if unlimited
+        """
+        kind = WRITE if any(m in WRITE_METHODS for m in methods) else READ
+        with self._lock:
+            key = (endpoint, kind)
+            if key not in self._buckets:
+                if endpoint in self.endpoints:
+                    rate = dict(zip((READ, WRITE), self.endpoints[endpoint]))[kind]
+                else:
+                    rate = self.rates[kind]
+                self._buckets[key] = TokenBucket(rate, self.burst) if rate else None
+            return self._buckets[key]
+
+    def acquire(self, endpoint, methods, tokens=1) -> None:
+        """
+        Block until a request sending `methods` may go to `endpoint`
+        """
+        bucket = self.bucket(endpoint, methods)
+        if bucket is not None:
+            bucket.acquire(tokens)
+
+    async def acquire_async(self, endpoint, methods, tokens=1) -> None:
+        """
+        asyncio version of `acquire`
+        """
+        bucket = self.bucket(endpoint, methods)
+        if bucket is not None:
+            await bucket.acquire_async(tokens)
+
+    def stats(self) -> dict:
+        """
+        Seconds spent waiting for tokens, per endpoint and method class
+        """
+        with self._lock:
+            return {
+                f"{endpoint} {kind}": bucket.waited
+                for (endpoint, kind), bucket in self._buckets.items()
+                if bucket is not None
+            }
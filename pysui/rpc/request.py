@@ -1,17 +1,78 @@
+import itertools
 import json
 
 import requests
 
-from .exceptions import RequestsError, RequestsTimeoutError, RPCError
+from . import codec
+from .exceptions import (
+    RequestsError,
+    RequestsStatusError,
+    RequestsTimeoutError,
+    RPCError,
+)
+from .session import default_pool
 
 from pysui.includes.config import *
 
 _default_endpoint = "http://localhost:9000"
 _default_timeout = 30
+_default_batch_size = 100
+
+_request_ids = itertools.count(1)
+
+
+def next_request_id() -> int:
+    """
+    Unique, process wide JSON-RPC request id
+    """
+    return next(_request_ids)
+
+
+def _check_params(params) -> list:
+    if params is None:
+        return []
+    if not isinstance(params, list):
+        raise TypeError(f"invalid type {params.__class__}")
+    return params
+
+
+def _error_code(error):
+    return error.get("code") if isinstance(error, dict) else None
+
+
+def _open(payload, endpoint, timeout, pool, stream=False) -> requests.Response:
+    if pool is None:
+        pool = default_pool
+
+    try:
+        resp = pool.get(endpoint).post(
+            endpoint,
+            data=codec.dumps(payload),
+            timeout=timeout,
+            allow_redirects=True,
+            stream=stream,
+        )
+    except requests.exceptions.Timeout as err:
+        raise RequestsTimeoutError(endpoint) from err
+    except requests.exceptions.RequestException as err:
+        raise RequestsError(endpoint) from err
+
+    if resp.status_code == 429 or resp.status_code >= 500:
+        resp.close()
+        raise RequestsStatusError(endpoint, resp.status_code)
+    return resp
+
+
+def _post(payload, endpoint, timeout, pool) -> bytes:
+    return _open(payload, endpoint, timeout, pool).content
 
 
 def base_request(
-    method, params=None, endpoint=_default_endpoint, timeout=_default_timeout
+    method,
+    params=None,
+    endpoint=_default_endpoint,
+    timeout=_default_timeout,
+    pool=None,
 ) -> str:
     """
     Basic RPC request
@@ -26,6 +87,8 @@ def base_request(
         Endpoint to send request to
     timeout: :obj:`int`, optional
         Timeout in seconds
+    pool: :obj:`SessionPool`, optional
+        Connection pool to send the request through, defaults to the shared pool
 
     Returns
     -------
@@ -38,35 +101,27 @@ def base_request(
         If params is not a list or None
     RequestsTimeoutError
         If request timed out
+    RequestsStatusError
+        If the endpoint replied with HTTP 429 or a 5xx status
     RequestsError
         If other request error occured
     """
-    if params is None:
-        params = []
-    elif not isinstance(params, list):
-        raise TypeError(f"invalid type {params.__class__}")
-
-    try:
-        payload = {"id": "1", "jsonrpc": "2.0", "method": method, "params": params}
-        headers = {"Content-Type": "application/json"}
-
-        resp = requests.request(
-            "POST",
-            endpoint,
-            headers=headers,
-            data=json.dumps(payload),
-            timeout=timeout,
-            allow_redirects=True,
-        )
-        return resp.content
-    except requests.exceptions.Timeout as err:
-        raise RequestsTimeoutError(endpoint) from err
-    except requests.exceptions.RequestException as err:
-        raise RequestsError(endpoint) from err
+    params = _check_params(params)
+    payload = {
+        "id": next_request_id(),
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": params,
+    }
+    return _post(payload, endpoint, timeout, pool)
 
 
 def rpc_request(
-    method, params=None, endpoint=_default_endpoint, timeout=_default_timeout
+    method,
+    params=None,
+    endpoint=_default_endpoint,
+    timeout=_default_timeout,
+    pool=None,
 ) -> dict:
     """
     RPC request
@@ -81,6 +136,8 @@ def rpc_request(
         Endpoint to send request to
     timeout: :obj:`int`, optional
         Timeout in seconds
+    pool: :obj:`SessionPool`, optional
+        Connection pool to send the request through, defaults to the shared pool
 
     Returns
     -------
@@ -102,12 +159,103 @@ def rpc_request(
     --------
     base_request
     """
-    raw_resp = base_request(method, params, endpoint, timeout)
+    raw_resp = base_request(method, params, endpoint, timeout, pool)
 
     try:
-        resp = json.loads(raw_resp)
+        resp = codec.loads(raw_resp)
         if "error" in resp:
-            raise RPCError(method, endpoint, str(resp["error"]))
+            error = resp["error"]
+            raise RPCError(method, endpoint, str(error), _error_code(error))
         return resp
     except json.decoder.JSONDecodeError as err:
         raise RPCError(method, endpoint, raw_resp) from err
+
+
+def batch_request(
+    calls,
+    endpoint=_default_endpoint,
+    timeout=_default_timeout,
+    pool=None,
+    batch_size=_default_batch_size,
+) -> list:
+    """
+    JSON-RPC 2.0 batch request
+
+    Sends `calls` as JSON-RPC batch arrays of up to `batch_size` entries per
+    HTTP POST, matching each reply back to its call by id.
+
+    Parameters
+    ---------
+    calls: :obj:`list`
+        List of (method, params) pairs
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds, per HTTP POST
+    pool: :obj:`SessionPool`, optional
+        Connection pool to send the request through, defaults to the shared pool
+    batch_size: :obj:`int`, optional
+        Maximum number of calls per HTTP POST
+
+    Returns
+    -------
+    list
+        One entry per call, in input order. Each entry is either the dictionary
+        representation of the RPC response (see rpc_request) or, when that
+        call failed, an `RPCError` instance which the caller may raise.
+
+    Raises
+    ------
+    RPCError
+        If the endpoint did not reply with a batch array
+    RequestsTimeoutError
+        If request timed out
+    RequestsStatusError
+        If the endpoint replied with HTTP 429 or a 5xx status
+    RequestsError
+        If other request error occured
+
+    See Also
+    --------
+    rpc_request
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+    calls = [(method, _check_params(params)) for method, params in calls]
+    results = []
+    for i in range(0, len(calls), batch_size):
+        results.extend(_batch_chunk(calls[i : i + batch_size], endpoint, timeout, pool))
+    return results
+
+
+def _batch_chunk(calls, endpoint, timeout, pool) -> list:
+    ids = [next_request_id() for _ in calls]
+    payload = [
+        {"id": _id, "jsonrpc": "2.0", "method": method, "params": params}
+        for _id, (method, params) in zip(ids, calls)
+    ]
+    raw_resp = _post(payload, endpoint, timeout, pool)
+    batch_method = "batch" if not calls else calls[0][0]
+
+    try:
+        resp = codec.loads(raw_resp)
+    except json.decoder.JSONDecodeError as err:
+        raise RPCError(batch_method, endpoint, raw_resp) from err
+
+    if not isinstance(resp, list):
+        error = resp.get("error", resp) if isinstance(resp, dict) else resp
+        raise RPCError(batch_method, endpoint, str(error), _error_code(error))
+
+    by_id = {r.get("id"): r for r in resp if isinstance(r, dict)}
+    results = []
+    for _id, (method, _) in zip(ids, calls):
+        r = by_id.get(_id)
+        if r is None:
+            results.append(RPCError(method, endpoint, f"no reply for request id {_id}"))
+        elif "error" in r:
+            error = r["error"]
+            results.append(RPCError(method, endpoint, str(error), _error_code(error)))
+        else:
+            results.append(r)
+    return results
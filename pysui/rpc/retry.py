@@ -0,0 +1,176 @@
+import asyncio
+import random
+import time
+
+import aiohttp
+import requests
+
+from pysui.includes.config import log
+
+from .exceptions import (
+    CircuitOpenError,
+    RequestsError,
+    RequestsStatusError,
+    RequestsTimeoutError,
+    RPCError,
+)
+from .method_kinds import EXECUTE_METHODS
+
+_default_max_attempts = 4
+_default_base_delay = 0.1
+_default_max_delay = 5
+_default_deadline = 60
+_default_retry_statuses = frozenset({429, 502, 503, 504})
+# JSON-RPC "Internal error", reported by the node for transient failures
+_default_retry_rpc_codes = frozenset({-32603})
+_connection_errors = (
+    requests.exceptions.ConnectionError,
+    aiohttp.ClientConnectionError,
+)
+
+
+def attempt_timeout(timeout, remaining):
+    """
+    Timeout of one attempt, `timeout` cut to the `remaining` seconds of the
+    retry deadline (None outside of a RetryPolicy)
+    """
+    if remaining is None:
+        return timeout
+    return max(min(timeout, remaining), 0.001)
+
+
+class RetryPolicy:
+    """
+    Retry transient failures with exponential backoff and full jitter
+
+    Timeouts, connection errors, the HTTP statuses in `retry_statuses` and
+    RPC errors with a code in `retry_rpc_codes` are retried. Anything else,
+    including an open circuit breaker, is fatal and raised at once.
+    Non-idempotent methods (`EXECUTE_METHODS`) are never retried unless
+    `retry_non_idempotent` is set.
+
+    Parameters
+    ----------
+    max_attempts: :obj:`int`, optional
+        Maximum number of attempts, including the first one
+    base_delay: :obj:`float`, optional
+        Backoff in seconds before the first retry, doubled for every retry
+    max_delay: :obj:`float`, optional
+        Upper bound of the backoff in seconds
+    deadline: :obj:`float`, optional
+        Total seconds spent on all attempts and backoffs, every attempt is
+        given the time left as its timeout and no retry starts after it
+    retry_statuses: :obj:`frozenset`, optional
+        HTTP statuses to retry
+    retry_rpc_codes: :obj:`frozenset`, optional
+        JSON-RPC error codes to retry
+    retry_non_idempotent: :obj:`bool`, optional
+        Also retry methods that submit transactions
+    overrides: :obj:`dict`, optional
+        {method: RetryPolicy} used instead of this policy for those methods
+    """
+
+    def __init__(
+        self,
+        max_attempts=_default_max_attempts,
+        base_delay=_default_base_delay,
+        max_delay=_default_max_delay,
+        deadline=_default_deadline,
+        retry_statuses=_default_retry_statuses,
+        retry_rpc_codes=_default_retry_rpc_codes,
+        retry_non_idempotent=False,
+        overrides=None,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_statuses = retry_statuses
+        self.retry_rpc_codes = retry_rpc_codes
+        self.retry_non_idempotent = retry_non_idempotent
+        self.overrides = overrides or {}
+
+    def for_method(self, method: str) -> "RetryPolicy":
+        """
+        Policy that applies to `method`
+        """
+        return self.overrides.get(method, self)
+
+    def is_retryable(self, err: Exception) -> bool:
+        """
+        True if `err` is a transient failure
+        """
+        if isinstance(err, CircuitOpenError):
+            # the breaker exists to fail fast, retrying would spin on it
+            return False
+        if isinstance(err, RequestsTimeoutError):
+            return True
+        if isinstance(err, RequestsStatusError):
+            return err.status_code in self.retry_statuses
+        if isinstance(err, RequestsError):
+            return isinstance(err.__cause__, _connection_errors)
+        if isinstance(err, RPCError):
+            return err.code in self.retry_rpc_codes
+        return False
+
+    def backoff(self, retry: int) -> float:
+        """
+        Seconds to wait before retry number `retry` (starting at 0)
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+    def _next_delay(self, methods, err, attempt, st):
+        # None if err must be raised, else the backoff before the next attempt
+        if attempt + 1 >= self.max_attempts or not self.is_retryable(err):
+            return None
+        if not self.retry_non_idempotent and any(m in EXECUTE_METHODS for m in methods):
+            return None
+        delay = self.backoff(attempt)
+        if time.monotonic() - st + delay >= self.deadline:
+            return None
+        log.warning(
+            f"Retrying {', '.join(sorted(set(methods)))} in {delay:.2f}s: {err}"
+        )
+        return delay
+
+    def call(self, fn, *methods):
+        """
+        Call fn(remaining), retrying it while it fails with transient errors
+
+        Parameters
+        ----------
+        fn: :obj:`callable`
+            Makes one attempt, called with the seconds left until the deadline,
+            which bounds the timeout of its request
+        methods: str
+            RPC methods sent by `fn`, all must be idempotent to be retried
+        """
+        policy = self.for_method(methods[0]) if len(methods) == 1 else self
+        st = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return fn(policy.deadline - (time.monotonic() - st))
+            except (RequestsError, RequestsTimeoutError, RPCError) as err:
+                delay = policy._next_delay(methods, err, attempt, st)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    async def call_async(self, fn, *methods):
+        """
+        asyncio version of `call`, fn(remaining) returns an awaitable
+        """
+        policy = self.for_method(methods[0]) if len(methods) == 1 else self
+        st = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return await fn(policy.deadline - (time.monotonic() - st))
+            except (RequestsError, RequestsTimeoutError, RPCError) as err:
+                delay = policy._next_delay(methods, err, attempt, st)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -0,0 +1,120 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_default_pool_connections = 10
+_default_pool_maxsize = 10
+
+
+class SessionPool:
+    """
+    Thread safe pool of keep-alive `requests.Session` objects, one per endpoint
+
+    Each session mounts an `HTTPAdapter` backed by a urllib3 connection pool so
+    repeated calls to the same endpoint reuse open TCP/TLS connections instead
+    of handshaking on every request.
+
+    Parameters
+    ----------
+    pool_connections: :obj:`int`, optional
+        Number of host pools to cache per session
+    pool_maxsize: :obj:`int`, optional
+        Maximum number of connections kept alive per host
+    pool_block: :obj:`bool`, optional
+        Block when the pool is exhausted instead of opening throwaway connections
+    """
+
+    def __init__(
+        self,
+        pool_connections=_default_pool_connections,
+        pool_maxsize=_default_pool_maxsize,
+        pool_block=False,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=0,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(
+            {"Content-Type": "application/json", "Connection": "keep-alive"}
+        )
+        return session
+
+    def get(self, endpoint: str) -> requests.Session:
+        """
+        Return the pooled session for `endpoint`, creating it on first use
+        """
+        with self._lock:
+            session = self._sessions.get(endpoint)
+            if session is None:
+                self.misses += 1
+                session = self._sessions[endpoint] = self._new_session()
+            else:
+                self.hits += 1
+            return session
+
+    def close(self, endpoint: str = None) -> None:
+        """
+        Close the session for `endpoint`, or every session if not given
+        """
+        with self._lock:
+            if endpoint is None:
+                sessions = list(self._sessions.values())
+                self._sessions.clear()
+            else:
+                session = self._sessions.pop(endpoint, None)
+                sessions = [session] if session is not None else []
+        for session in sessions:
+            session.close()
+
+    def stats(self) -> dict:
+        """
+        Pool hit/miss counters
+
+        Returns
+        -------
+        dict
+            `session_hits` / `session_misses` count reuse of per-endpoint
+            sessions, `connection_hits` / `connection_misses` count requests
+            served over an already open connection vs. newly opened ones
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            stats = dict(session_hits=self.hits, session_misses=self.misses)
+
+        requests_sent = connections = 0
+        for session in sessions:
+            for adapter in set(session.adapters.values()):
+                for key in list(adapter.poolmanager.pools.keys()):
+                    pool = adapter.poolmanager.pools.get(key)
+                    if pool is None:
+                        continue
+                    requests_sent += pool.num_requests
+                    connections += pool.num_connections
+
+        stats["connection_hits"] = requests_sent - connections
+        stats["connection_misses"] = connections
+        return stats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+default_pool = SessionPool()
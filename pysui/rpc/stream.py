@@ -0,0 +1,278 @@
+import asyncio
+
+import aiohttp
+import requests
+
+from . import codec
+from .exceptions import (
+    RequestsError,
+    RequestsStatusError,
+    RequestsTimeoutError,
+    RPCError,
+)
+from .lazy import Incomplete, _string, skip_value, skip_ws
+from .request import (
+    _check_params,
+    _default_endpoint,
+    _default_timeout,
+    _error_code,
+    _open,
+    next_request_id,
+)
+
+_default_chunk_size = 65536
+
+_MEMBER, _FIRST_ELEMENT, _ELEMENT, _NEXT_ELEMENT, _DONE = range(5)
+
+
+class ResultStream:
+    """
+    Incremental parser yielding the elements of the `result` array of a
+    JSON-RPC reply as its bytes arrive
+
+    Feed it the body in chunks of any size. Only the unparsed tail and the
+    element being read are buffered, so memory stays flat however long the
+    array is. Elements are decoded one at a time with the selected codec.
+
+    Parameters
+    ----------
+    method: :obj:`str`, optional
+        RPC method, for error reporting
+    endpoint: :obj:`str`, optional
+        Endpoint that replied, for error reporting
+    """
+
+    def __init__(self, method=None, endpoint=None):
+        self.method = method
+        self.endpoint = endpoint
+        self._buf = b""
+        self._pos = 0
+        self._state = None
+
+    @property
+    def done(self) -> bool:
+        return self._state == _DONE
+
+    def feed(self, chunk: bytes) -> list:
+        """
+        Parse `chunk`, returns the elements it completed
+
+        Raises
+        ------
+        RPCError
+            If the reply is an error, has no `result` array or is not JSON
+        """
+        if self._state == _DONE:
+            return []
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        items = []
+        try:
+            while self._state != _DONE:
+                self._step(items)
+        except Incomplete:
+            pass
+        except ValueError as err:
+            raise RPCError(self.method, self.endpoint, str(err)) from err
+        return items
+
+    def close(self) -> None:
+        """
+        Signal the end of the body
+
+        Raises
+        ------
+        RPCError
+            If the body ended before the `result` array did
+        """
+        if self._state != _DONE:
+            raise RPCError(
+                self.method, self.endpoint, f"Truncated reply: {self._buf[-200:]}"
+            )
+
+    def _at(self, pos) -> tuple:
+        # first non whitespace byte from pos
+        pos = skip_ws(self._buf, pos)
+        if pos >= len(self._buf):
+            raise Incomplete(pos)
+        return pos, self._buf[pos]
+
+    def _step(self, items):
+        # consumes one member or element, commits self._pos only once it is complete
+        buf = self._buf
+        if self._state is None:
+            pos, c = self._at(self._pos)
+            if c != ord("{"):
+                raise ValueError(f"Not a JSON-RPC reply: {buf[:200]}")
+            self._pos, self._state = pos + 1, _MEMBER
+            return
+
+        if self._state == _MEMBER:
+            pos, c = self._at(self._pos)
+            if c == ord(","):
+                pos, c = self._at(pos + 1)
+            if c == ord("}"):
+                raise ValueError("Reply has no result")
+            m = _string.match(buf, pos)
+            if m is None:
+                if c != ord('"'):
+                    raise ValueError(f"Expected a key at offset {pos}")
+                raise Incomplete(pos)
+            key = codec.loads(m.group())
+            pos, c = self._at(m.end())
+            if c != ord(":"):
+                raise ValueError(f"Expected ':' at offset {pos}")
+            pos, c = self._at(pos + 1)
+            if key == "result":
+                if c != ord("["):
+                    raise ValueError("Result is not an array")
+                self._pos, self._state = pos + 1, _FIRST_ELEMENT
+                return
+            end = skip_value(buf, pos, final=False)
+            if key == "error":
+                error = codec.loads(buf[pos:end])
+                raise RPCError(
+                    self.method, self.endpoint, str(error), _error_code(error)
+                )
+            self._pos = end
+            return
+
+        pos, c = self._at(self._pos)
+        if self._state == _NEXT_ELEMENT:
+            if c == ord(","):
+                self._pos, self._state = pos + 1, _ELEMENT
+                return
+            if c != ord("]"):
+                raise ValueError(f"Expected ',' or ']' at offset {pos}")
+            self._state = _DONE
+            return
+        if self._state == _FIRST_ELEMENT and c == ord("]"):
+            self._state = _DONE
+            return
+        end = skip_value(buf, pos, final=False)
+        items.append(codec.loads(buf[pos:end]))
+        self._pos, self._state = end, _NEXT_ELEMENT
+
+
+def stream_result(
+    method,
+    params=None,
+    endpoint=_default_endpoint,
+    timeout=_default_timeout,
+    pool=None,
+    chunk_size=_default_chunk_size,
+):
+    """
+    RPC request yielding the elements of its `result` array as they are received
+
+    For methods returning large arrays, e.g. sui_getTransactionsInRange. The
+    body is read in chunks, so neither the whole body nor the whole decoded
+    array is ever held in memory. The request is sent when this is called,
+    the body is read while iterating.
+
+    Parameters
+    ---------
+    method: str
+        RPC Method to call
+    params: :obj:`list`, optional
+        Parameters for the RPC method
+    endpoint: :obj:`str`, optional
+        Endpoint to send request to
+    timeout: :obj:`int`, optional
+        Timeout in seconds, to connect and between chunks
+    pool: :obj:`SessionPool`, optional
+        Connection pool to send the request through, defaults to the shared pool
+    chunk_size: :obj:`int`, optional
+        Bytes read from the body at a time
+
+    Returns
+    -------
+    generator
+        Decoded elements of the result array
+
+    Raises
+    ------
+    RPCError
+        While iterating, if the reply is an error or has no result array
+    RequestsTimeoutError
+        If request timed out
+    RequestsStatusError
+        If the endpoint replied with HTTP 429 or a 5xx status
+    RequestsError
+        If other request error occured
+
+    See Also
+    --------
+    rpc_request
+    """
+    payload = {
+        "id": next_request_id(),
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": _check_params(params),
+    }
+    resp = _open(payload, endpoint, timeout, pool, stream=True)
+    return _iter_result(resp, ResultStream(method, endpoint), chunk_size)
+
+
+def _iter_result(resp, parser, chunk_size):
+    with resp:
+        try:
+            for chunk in resp.iter_content(chunk_size):
+                yield from parser.feed(chunk)
+                if parser.done:
+                    return
+        except requests.exceptions.Timeout as err:
+            raise RequestsTimeoutError(parser.endpoint) from err
+        except requests.exceptions.RequestException as err:
+            raise RequestsError(parser.endpoint) from err
+    parser.close()
+
+
+async def async_stream_result(
+    session,
+    method,
+    params=None,
+    endpoint=_default_endpoint,
+    timeout=_default_timeout,
+    chunk_size=_default_chunk_size,
+):
+    """
+    asyncio version of stream_result, an async generator of the elements of
+    the `result` array
+
+    Parameters
+    ---------
+    session: :obj:`aiohttp.ClientSession`
+        Session (and connection pool) to send the request through
+
+    See Also
+    --------
+    stream_result
+    """
+    payload = {
+        "id": next_request_id(),
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": _check_params(params),
+    }
+    parser = ResultStream(method, endpoint)
+    try:
+        async with session.post(
+            endpoint,
+            data=codec.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(sock_connect=timeout, sock_read=timeout),
+        ) as resp:
+            if resp.status == 429 or resp.status >= 500:
+                raise RequestsStatusError(endpoint, resp.status)
+            async for chunk in resp.content.iter_chunked(chunk_size):
+                for item in parser.feed(chunk):
+                    yield item
+                if parser.done:
+                    return
+    except asyncio.TimeoutError as err:
+        raise RequestsTimeoutError(endpoint) from err
+    except aiohttp.ClientError as err:
+        raise RequestsError(endpoint) from err
+    parser.close()
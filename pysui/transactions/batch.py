@@ -0,0 +1,182 @@
+from pysui.models.base import plain
+
+_default_batch_size = 50
+_default_gas_budget = 1000
+
+
+def transfer_object_params(object_id, recipient) -> dict:
+    """
+    sui_batchTransaction entry transferring `object_id` to `recipient`
+    """
+    return {
+        "transferObjectRequestParams": {"objectId": object_id, "recipient": recipient}
+    }
+
+
+def move_call_params(
+    package_object_id, module, function, type_arguments=None, arguments=None
+) -> dict:
+    """
+    sui_batchTransaction entry calling `package_object_id::module::function`
+    """
+    return {
+        "moveCallRequestParams": {
+            "packageObjectId": package_object_id,
+            "module": module,
+            "function": function,
+            "typeArguments": type_arguments or [],
+            "arguments": arguments or [],
+        }
+    }
+
+
+def chunks(operations, size) -> list:
+    """
+    `operations` split into lists of at most `size` entries
+    """
+    operations = list(operations)
+    return [operations[i : i + size] for i in range(0, len(operations), size)]
+
+
+class BulkSender:
+    """
+    Sends many transfers and move calls of one signer as sui_batchTransaction
+
+    Operations are packed `batch_size` at a time into one transaction, so
+    each batch costs one build, one signature and one execute instead of one
+    per operation. A batch executes atomically: if one operation fails, none
+    of its batch is applied. sui_transferSui has no batch form, transfer SUI
+    with `transfer_object` of whole coins or a move call instead.
+
+    Without a pipeline the batches are sent one after the other. With a
+    TransactionPipeline they are submitted to it and run in order per gas
+    coin, or per signer when the node picks the coin; with a GasPool as
+    well, every batch pays with its own coin so batches execute concurrently.
+
+    Parameters
+    ----------
+    client: :obj:`SuiClient`
+        Client to build and execute through
+    sign: :obj:`callable`, optional
+        Called as sign(address, tx_bytes), returns (flag, signature, pub_key),
+        not needed with a pipeline
+    batch_size: :obj:`int`, optional
+        Operations per transaction
+    gas_budget: :obj:`int`, optional
+        Gas budget per operation, a batch gets `gas_budget` times its size
+    pipeline: :obj:`TransactionPipeline`, optional
+        Pipeline to submit the batches to
+    gas_pool: :obj:`GasPool`, optional
+        Pool leasing the gas coin of every batch, needs `pipeline`
+    """
+
+    def __init__(
+        self,
+        client,
+        sign=None,
+        batch_size=_default_batch_size,
+        gas_budget=_default_gas_budget,
+        pipeline=None,
+        gas_pool=None,
+    ):
+        if pipeline is None and (sign is None or gas_pool is not None):
+            raise ValueError("BulkSender needs `sign`, or a pipeline to use a gas pool")
+        self.client = client
+        self.sign = sign
+        self.batch_size = batch_size
+        self.gas_budget = gas_budget
+        self.pipeline = pipeline
+        self.gas_pool = gas_pool
+
+    def send(self, signer, operations, gas=None) -> list:
+        """
+        Send `operations` in batches
+
+        Parameters
+        ----------
+        signer: :obj:`str`
+            Address owning the transferred objects and paying the gas
+        operations: :obj:`list`
+            Entries made by transfer_object_params / move_call_params
+        gas: :obj:`str`, optional
+            Gas coin of every batch, else the node (or the gas pool) picks one
+
+        Returns
+        -------
+        list
+            The execute_transaction result of every batch, or the exception
+            raised while sending it, so batches that already executed are
+            never lost. With a pipeline one Future per batch
+
+        Raises
+        ------
+        ValueError
+            If the gas pool holds the coins of another address than `signer`
+        """
+        if (
+            self.gas_pool is not None
+            and gas is None
+            and self.gas_pool.owner.lower() != signer.lower()
+        ):
+            raise ValueError(
+                f"Gas pool of {self.gas_pool.owner} cannot pay for {signer}"
+            )
+        batches = chunks(operations, self.batch_size)
+        if self.pipeline is not None:
+            return [self._submit(signer, batch, gas) for batch in batches]
+        return [self._send(signer, batch, gas) for batch in batches]
+
+    def transfer_objects(self, signer, transfers, gas=None) -> list:
+        """
+        Transfer objects given as (object_id, recipient) pairs
+
+        See Also
+        --------
+        send
+        """
+        return self.send(
+            signer, [transfer_object_params(o, r) for o, r in transfers], gas
+        )
+
+    def move_calls(self, signer, calls, gas=None) -> list:
+        """
+        Call Move functions given as (package_object_id, module, function,
+        type_arguments, arguments) tuples
+
+        See Also
+        --------
+        send
+        """
+        return self.send(signer, [move_call_params(*c) for c in calls], gas)
+
+    def _budget(self, batch):
+        return self.gas_budget * len(batch)
+
+    def _send(self, signer, batch, gas):
+        try:
+            tx = self.client.batch_transaction(signer, batch, gas, self._budget(batch))
+            tx_bytes = plain(tx)["txBytes"]
+            flag, signature, pub_key = self.sign(signer, tx_bytes)
+            return self.client.execute_transaction(tx_bytes, flag, signature, pub_key)
+        except Exception as e:
+            return e
+
+    def _submit(self, signer, batch, gas):
+        if self.gas_pool is not None and gas is None:
+            return self.gas_pool.submit(
+                self.pipeline,
+                "batch_transaction",
+                signer,
+                batch,
+                gas_budget=self._budget(batch),
+            )
+        return self.pipeline.submit(
+            "batch_transaction",
+            signer,
+            batch,
+            gas,
+            self._budget(batch),
+            # batches paying with the same coin run in order, without a coin
+            # the node may pick the same one for concurrent batches of a signer
+            key=gas if gas is not None else signer,
+        )
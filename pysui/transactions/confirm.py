@@ -0,0 +1,255 @@
+import threading
+import time
+from concurrent.futures import Future
+
+from pysui.exceptions.exceptions import TxConfirmationTimedoutError
+from pysui.includes.config import log
+from pysui.rpc.exceptions import RPCError
+
+_default_timeout = 60
+_default_min_interval = 0.2
+_default_max_interval = 5
+_default_backoff = 2
+_default_batch_size = 100
+
+
+class _Tracked:
+    __slots__ = ("digest", "deadline", "future")
+
+    def __init__(self, digest, deadline):
+        self.digest = digest
+        self.deadline = deadline
+        self.future = Future()
+
+
+class ConfirmationTracker:
+    """
+    Waits for many transactions to be confirmed by polling them together
+
+    Every round fetches all pending digests with get_transactions, i.e.
+    JSON-RPC batches of `batch_size`, so the polling cost grows with the
+    number of batches instead of the number of transactions. Rounds start
+    `min_interval` apart and back off up to `max_interval` while nothing
+    confirms; tracking a new digest or a confirmation resets the interval.
+
+    Parameters
+    ----------
+    client: :obj:`SuiClient`
+        Client to poll through
+    timeout: :obj:`float`, optional
+        Default seconds to wait for a transaction
+    min_interval: :obj:`float`, optional
+        Seconds between rounds while transactions confirm
+    max_interval: :obj:`float`, optional
+        Upper bound of the interval while nothing confirms
+    backoff: :obj:`float`, optional
+        Factor the interval grows by after a round without confirmation
+    batch_size: :obj:`int`, optional
+        Digests per JSON-RPC batch
+    """
+
+    def __init__(
+        self,
+        client,
+        timeout=_default_timeout,
+        min_interval=_default_min_interval,
+        max_interval=_default_max_interval,
+        backoff=_default_backoff,
+        batch_size=_default_batch_size,
+    ):
+        self.client = client
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.batch_size = batch_size
+        self.interval = min_interval
+        self._pending = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = None
+        self.rounds = 0
+        self.confirmed = 0
+        self.timed_out = 0
+
+    def track(self, digest, callback=None, timeout=None) -> Future:
+        """
+        Wait for the transaction `digest` in the background
+
+        Parameters
+        ----------
+        digest: :obj:`str`
+            Transaction digest
+        callback: :obj:`callable`, optional
+            Called with the future once it is resolved
+        timeout: :obj:`float`, optional
+            Override the default timeout for this transaction
+
+        Returns
+        -------
+        Future
+            Resolves to the get_transaction result, or fails with
+            TxConfirmationTimedoutError after the timeout. Tracking a digest
+            twice returns the same future
+
+        Raises
+        ------
+        RuntimeError
+            If the tracker is closed
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("ConfirmationTracker is closed")
+            tracked = self._pending.get(digest)
+            if tracked is None:
+                # poll at once unless a round is due within min_interval anyway
+                wake = not self._pending or self.interval > self.min_interval
+                if timeout is None:
+                    timeout = self.timeout
+                deadline = time.monotonic() + timeout
+                tracked = self._pending[digest] = _Tracked(digest, deadline)
+                self.interval = self.min_interval
+                self._start()
+                if wake:
+                    self._cond.notify()
+        if callback is not None:
+            tracked.future.add_done_callback(callback)
+        return tracked.future
+
+    def wait(self, digests, timeout=None) -> list:
+        """
+        Wait for all `digests`
+
+        Returns
+        -------
+        list
+            The get_transaction result or TxConfirmationTimedoutError per
+            digest, in input order
+        """
+        futures = [self.track(d, timeout=timeout) for d in digests]
+        return [f.exception() or f.result() for f in futures]
+
+    def poll(self) -> int:
+        """
+        Run one polling round
+
+        If fetching the transactions fails, overdue digests still time out
+        and the interval backs off before the error is raised
+
+        Returns
+        -------
+        int
+            Transactions confirmed in this round
+        """
+        with self._cond:
+            pending = list(self._pending.values())
+        if not pending:
+            return 0
+        failure = None
+        try:
+            results = self.client.get_transactions(
+                [t.digest for t in pending], batch_size=self.batch_size
+            )
+        except Exception as e:
+            failure = e
+            results = [e] * len(pending)
+        now = time.monotonic()
+        confirmed = timed_out = 0
+        resolved = []
+        for tracked, result in zip(pending, results):
+            if not isinstance(result, Exception):
+                resolved.append((tracked, result, None))
+                confirmed += 1
+            elif now >= tracked.deadline:
+                error = TxConfirmationTimedoutError(
+                    f"Transaction {tracked.digest} not confirmed in time"
+                )
+                resolved.append((tracked, None, error))
+                timed_out += 1
+            elif failure is None and not isinstance(result, RPCError):
+                log.warning(f"Polling transaction {tracked.digest} failed: {result}")
+        with self._cond:
+            for tracked, _, _ in resolved:
+                self._pending.pop(tracked.digest, None)
+            self.rounds += 1
+            self.confirmed += confirmed
+            self.timed_out += timed_out
+            if confirmed:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.interval * self.backoff, self.max_interval)
+        # outside the lock, callbacks may track more digests
+        for tracked, result, error in resolved:
+            if tracked.future.done():
+                # cancelled by the caller
+                continue
+            if error is None:
+                tracked.future.set_result(result)
+            else:
+                tracked.future.set_exception(error)
+        if failure is not None:
+            raise failure
+        return confirmed
+
+    def _start(self):
+        if self._thread is None and not self._closed:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+            try:
+                self.poll()
+            except Exception as e:
+                log.error(f"Polling transactions failed: {e}")
+            with self._cond:
+                if self._pending and not self._closed:
+                    # wake up in time for the earliest deadline
+                    deadline = min(t.deadline for t in self._pending.values())
+                    self._cond.wait(
+                        min(self.interval, max(deadline - time.monotonic(), 0))
+                    )
+
+    def close(self) -> None:
+        """
+        Stop polling, transactions still pending fail with
+        TxConfirmationTimedoutError
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._cond:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self.timed_out += len(pending)
+        for tracked in pending:
+            if not tracked.future.done():
+                tracked.future.set_exception(
+                    TxConfirmationTimedoutError(
+                        f"Transaction {tracked.digest} not confirmed before close"
+                    )
+                )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return dict(
+                pending=len(self._pending),
+                rounds=self.rounds,
+                confirmed=self.confirmed,
+                timed_out=self.timed_out,
+                interval=self.interval,
+            )
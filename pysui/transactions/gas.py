@@ -0,0 +1,412 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from pysui.client.object_cache import find_effects
+from pysui.includes.config import log
+from pysui.models.base import plain
+
+SUI_COIN_TYPE = "0x2::coin::Coin<0x2::sui::SUI>"
+
+_default_min_coins = 10
+_default_gas_budget = 1000
+_default_maintain_interval = 5
+_default_split_factor = 10
+
+
+class GasCoin:
+    """
+    A gas coin of the pool
+
+    Attributes
+    ----------
+    object_id: :obj:`str`
+    version: :obj:`int`
+        Latest version known from transaction effects
+    balance: :obj:`int`
+        Balance, reduced by the gas charged in observed effects
+    """
+
+    __slots__ = ("object_id", "version", "balance", "leased")
+
+    def __init__(self, object_id, version, balance):
+        self.object_id = object_id
+        self.version = version
+        self.balance = balance
+        self.leased = False
+
+    def __repr__(self):
+        return (
+            f"GasCoin({self.object_id}, version={self.version}, balance={self.balance})"
+        )
+
+
+def coin_balance(obj) -> int:
+    """
+    Balance of a coin from its get_object result, None if it does not exist
+    """
+    obj = plain(obj)
+    if not isinstance(obj, dict) or obj.get("status") != "Exists":
+        return None
+    return obj["details"]["data"]["fields"]["balance"]
+
+
+class GasPool:
+    """
+    Leases distinct gas coins of one owner to concurrent transactions
+
+    Two transactions using the same gas coin conflict, so every in-flight
+    transaction gets a coin of its own. Coin versions and balances follow
+    the effects of the transactions they paid for. Effects only report the
+    gas charged, so balances are reloaded by `refresh`. `maintain` keeps at
+    least `min_coins` coins of `min_balance` available by splitting coins of
+    `split_amount` off the largest coin with split_coin, and merges coins
+    below `dust_balance` into it with merge_coins while the pool is idle.
+
+    Parameters
+    ----------
+    client: :obj:`SuiClient`
+        Client to read coins and build transactions with
+    owner: :obj:`str`
+        Address owning the coins
+    sign: :obj:`callable`, optional
+        Called as sign(address, tx_bytes), returns (flag, signature, pub_key).
+        Needed to split and merge coins
+    min_coins: :obj:`int`, optional
+        Coins to keep available
+    min_balance: :obj:`int`, optional
+        Smallest balance of a coin handed out
+    split_amount: :obj:`int`, optional
+        Balance of the coins split off, defaults to 10 times `min_balance`
+    dust_balance: :obj:`int`, optional
+        Coins below this balance are merged while idle, defaults to `min_balance`
+    gas_budget: :obj:`int`, optional
+        Gas budget of split and merge transactions
+    coin_type: :obj:`str`, optional
+        Type of the gas coins
+    """
+
+    def __init__(
+        self,
+        client,
+        owner,
+        sign=None,
+        min_coins=_default_min_coins,
+        min_balance=_default_gas_budget,
+        split_amount=None,
+        dust_balance=None,
+        gas_budget=_default_gas_budget,
+        coin_type=SUI_COIN_TYPE,
+    ):
+        self.client = client
+        self.owner = owner
+        self.sign = sign
+        self.min_coins = min_coins
+        self.min_balance = min_balance
+        self.split_amount = split_amount or min_balance * _default_split_factor
+        self.dust_balance = min_balance if dust_balance is None else dust_balance
+        self.gas_budget = gas_budget
+        self.coin_type = coin_type
+        self.coins = {}
+        self._cond = threading.Condition()
+        self._maintaining = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.leases = 0
+        self.waits = 0
+
+    def refresh(self) -> None:
+        """
+        Reload the coins of the owner from the node
+        """
+        infos = [plain(i) for i in self.client.get_objects_owned_by_address(self.owner)]
+        ids = [i["objectId"] for i in infos if i.get("type") == self.coin_type]
+        versions = {i["objectId"]: i["version"] for i in infos}
+        objects = self.client.get_objects(ids, bypass_cache=True)
+        with self._cond:
+            for object_id, obj in zip(ids, objects):
+                balance = coin_balance(obj)
+                coin = self.coins.get(object_id)
+                if balance is None:
+                    if coin is not None and not coin.leased:
+                        del self.coins[object_id]
+                elif coin is None:
+                    self.coins[object_id] = GasCoin(
+                        object_id, versions[object_id], balance
+                    )
+                elif not coin.leased:
+                    coin.version = max(coin.version, versions[object_id])
+                    coin.balance = balance
+            for object_id in set(self.coins) - set(ids):
+                if not self.coins[object_id].leased:
+                    del self.coins[object_id]
+            self._cond.notify_all()
+
+    def available(self) -> list:
+        """
+        Coins that are not leased and hold at least `min_balance`
+        """
+        with self._cond:
+            return self._available()
+
+    def _available(self):
+        return [
+            c
+            for c in self.coins.values()
+            if not c.leased and c.balance >= self.min_balance
+        ]
+
+    def acquire(self, timeout=None) -> GasCoin:
+        """
+        Lease the free coin with the largest balance, waiting for one if needed
+
+        Raises
+        ------
+        TimeoutError
+            If no coin became free within `timeout` seconds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                free = self._available()
+                if free:
+                    coin = max(free, key=lambda c: c.balance)
+                    coin.leased = True
+                    self.leases += 1
+                    return coin
+                self.waits += 1
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No free gas coin for {self.owner}")
+                self._cond.wait(remaining)
+
+    def release(self, coin: GasCoin, result=None) -> None:
+        """
+        Return a leased coin, updating it from the result of its transaction
+        """
+        with self._cond:
+            coin.leased = False
+            if result is not None:
+                self._observe(result)
+            self._cond.notify_all()
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """
+        Context manager leasing a coin, e.g.
+
+        with pool.lease() as coin:
+            result = execute(build(..., gas=coin.object_id))
+            pool.observe(result)
+        """
+        coin = self.acquire(timeout)
+        try:
+            yield coin
+        finally:
+            self.release(coin)
+
+    def observe(self, result) -> None:
+        """
+        Update coin versions and balances from a transaction result
+        """
+        with self._cond:
+            self._observe(result)
+
+    def _observe(self, result):
+        effects = find_effects(plain(result))
+        if effects is None:
+            return
+        for obj in effects.get("mutated", []) + [effects.get("gasObject") or {}]:
+            ref = obj.get("reference", {})
+            coin = self.coins.get(ref.get("objectId"))
+            if coin is not None:
+                coin.version = max(coin.version, ref["version"])
+                owner = (obj.get("owner") or {}).get("AddressOwner")
+                if owner is not None and owner.lower() != self.owner.lower():
+                    # transferred away, e.g. by transfer_sui without amount
+                    del self.coins[coin.object_id]
+        gas = (effects.get("gasObject") or {}).get("reference", {})
+        coin = self.coins.get(gas.get("objectId"))
+        used = effects.get("gasUsed")
+        if coin is not None and used:
+            coin.balance -= (
+                used["computationCost"] + used["storageCost"] - used["storageRebate"]
+            )
+        for ref in effects.get("deleted", []) + effects.get("wrapped", []):
+            self.coins.pop(ref["objectId"], None)
+
+    def submit(
+        self, pipeline, method, signer, *args, gas_arg="gas", timeout=None, **kwargs
+    ):
+        """
+        Submit a transaction to a TransactionPipeline paying with a leased coin
+
+        The coin is passed as the `gas_arg` argument of `method` (e.g.
+        `sui_object_id` for transfer_sui) and returned to the pool once the
+        transaction finished. Blocks while no coin is free.
+
+        Returns
+        -------
+        Future
+            See TransactionPipeline.submit
+
+        Raises
+        ------
+        ValueError
+            For transfer_sui without `amount`, which would transfer the whole
+            pooled coin
+        """
+        if method == "transfer_sui" and kwargs.get("amount") is None:
+            raise ValueError("transfer_sui from a pooled coin needs an amount")
+        coin = self.acquire(timeout)
+        try:
+            future = pipeline.submit(
+                method,
+                signer,
+                *args,
+                key=coin.object_id,
+                **{gas_arg: coin.object_id},
+                **kwargs,
+            )
+        except Exception:
+            self.release(coin)
+            raise
+
+        def done(f):
+            result = None
+            try:
+                if not f.cancelled() and f.exception() is None:
+                    result = f.result()
+            finally:
+                self.release(coin, result)
+
+        future.add_done_callback(done)
+        return future
+
+    def _execute(self, tx) -> dict:
+        tx_bytes = plain(tx)["txBytes"]
+        flag, signature, pub_key = self.sign(self.owner, tx_bytes)
+        result = self.client.execute_transaction(tx_bytes, flag, signature, pub_key)
+        self.observe(result)
+        return result
+
+    def split(self, count) -> None:
+        """
+        Split `count` coins of `split_amount` off the largest free coin
+        """
+        with self._cond:
+            free = sorted(self._available(), key=lambda c: c.balance, reverse=True)
+            if len(free) < 2:
+                raise ValueError("Splitting needs a coin to split and one to pay gas")
+            source, gas = free[0], free[-1]
+            count = min(count, int(source.balance // self.split_amount) - 1)
+            if count < 1:
+                return
+            source.leased = gas.leased = True
+        try:
+            tx = self.client.split_coin(
+                self.owner,
+                source.object_id,
+                [self.split_amount] * count,
+                gas.object_id,
+                self.gas_budget,
+            )
+            self._execute(tx)
+        finally:
+            self.release(source)
+            self.release(gas)
+        self.refresh()
+
+    def merge_dust(self) -> None:
+        """
+        Merge free coins below `dust_balance` into the largest free coin
+        """
+        tried = set()
+        while True:
+            with self._cond:
+                free = sorted(self._available(), key=lambda c: c.balance, reverse=True)
+                if not free:
+                    break
+                primary = free[0]
+                dust = [
+                    c
+                    for c in self.coins.values()
+                    if not c.leased
+                    and c.balance < self.dust_balance
+                    and c is not primary
+                    and c.object_id not in tried
+                ]
+                payers = [c for c in free[1:] if c not in dust]
+                if not dust or not payers:
+                    break
+                gas, merged = payers[-1], dust[0]
+                tried.add(merged.object_id)
+                primary.leased = gas.leased = merged.leased = True
+            try:
+                tx = self.client.merge_coins(
+                    self.owner,
+                    primary.object_id,
+                    merged.object_id,
+                    gas.object_id,
+                    self.gas_budget,
+                )
+                self._execute(tx)
+            finally:
+                for coin in (primary, gas, merged):
+                    self.release(coin)
+        if tried:
+            self.refresh()
+
+    def maintain(self) -> None:
+        """
+        Split coins when fewer than `min_coins` are available, merge dust when idle
+        """
+        if self.sign is None or not self._maintaining.acquire(blocking=False):
+            return
+        try:
+            self.refresh()
+            with self._cond:
+                missing = self.min_coins - len(self._available())
+                idle = not any(c.leased for c in self.coins.values())
+            if missing > 0:
+                self.split(missing)
+            elif idle:
+                self.merge_dust()
+        except Exception as e:
+            log.error(f"Gas pool maintenance for {self.owner} failed: {e}")
+        finally:
+            self._maintaining.release()
+
+    def start(self, interval=_default_maintain_interval) -> None:
+        """
+        Load the coins and maintain the pool every `interval` seconds in a
+        background thread
+        """
+        self.refresh()
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self, interval):
+        while not self._stop.is_set():
+            self.maintain()
+            self._stop.wait(interval)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return dict(
+                coins=len(self.coins),
+                available=len(self._available()),
+                leased=sum(1 for c in self.coins.values() if c.leased),
+                leases=self.leases,
+                waits=self.waits,
+            )
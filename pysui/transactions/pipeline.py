@@ -0,0 +1,353 @@
+import asyncio
+import queue
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future
+
+from pysui.client.metrics import Metrics
+from pysui.includes.config import log
+from pysui.models.base import plain
+
+BUILD = "build"
+SIGN = "sign"
+EXECUTE = "execute"
+
+_default_workers = 8
+_default_max_pending = 100
+_stop = object()
+
+
+class _Job:
+    def __init__(self, method, signer, args, kwargs, key, future):
+        self.method = method
+        self.signer = signer
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key
+        self.future = future
+        self.tx_bytes = None
+        self.signature = None
+
+
+class _PipelineBase:
+    # per-key ordering and stage statistics shared by both backends
+
+    def __init__(self, client, sign):
+        self.client = client
+        self.sign = sign
+        self.metrics = Metrics()
+        self._started = time.monotonic()
+        self._waiting = defaultdict(deque)
+        self._keys_lock = threading.Lock()
+
+    def _admit(self, job) -> bool:
+        # True if the job can start now, else it waits for the previous job of its key
+        if job.key is None:
+            return True
+        with self._keys_lock:
+            waiting = self._waiting[job.key]
+            waiting.append(job)
+            return len(waiting) == 1
+
+    def _next_for_key(self, job):
+        # next job of the same key, once `job` finished
+        if job.key is None:
+            return None
+        with self._keys_lock:
+            waiting = self._waiting[job.key]
+            waiting.popleft()
+            if not waiting:
+                del self._waiting[job.key]
+                return None
+            return waiting[0]
+
+    def _build(self, job):
+        return getattr(self.client, job.method)(job.signer, *job.args, **job.kwargs)
+
+    def _timed(self, stage, fn, *args):
+        st = time.perf_counter()
+        try:
+            result = fn(*args)
+        except Exception:
+            self.metrics.record(stage, time.perf_counter() - st, error=True)
+            raise
+        self.metrics.record(stage, time.perf_counter() - st)
+        return result
+
+    def stats(self) -> dict:
+        """
+        Returns
+        -------
+        dict
+            {stage: {"calls", "errors", "avg_latency", "per_second"}}, the
+            throughput is counted since the pipeline was created
+        """
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        return {
+            stage: dict(s, per_second=s["calls"] / elapsed)
+            for stage, s in self.metrics.snapshot().items()
+        }
+
+
+class TransactionPipeline(_PipelineBase):
+    """
+    Builds, signs and executes transactions concurrently on worker threads
+
+    Every stage has its own pool of workers, so the round trips of many
+    transactions overlap instead of adding up. Transactions sharing a `key`
+    (e.g. the gas coin or an object they mutate) run one after the other in
+    submission order, as each needs the object versions produced by the one
+    before. Transactions without a key run fully in parallel.
+
+    Parameters
+    ----------
+    client: :obj:`SuiClient`
+        Client to build and execute through
+    sign: :obj:`callable`
+        Called as sign(address, tx_bytes), returns (flag, signature, pub_key)
+    build_workers: :obj:`int`, optional
+        Concurrent build requests
+    sign_workers: :obj:`int`, optional
+        Concurrent sign calls
+    execute_workers: :obj:`int`, optional
+        Concurrent execute requests
+    max_pending: :obj:`int`, optional
+        Transactions in the pipeline at once, submit blocks beyond that
+    """
+
+    def __init__(
+        self,
+        client,
+        sign,
+        build_workers=_default_workers,
+        sign_workers=_default_workers,
+        execute_workers=_default_workers,
+        max_pending=_default_max_pending,
+    ):
+        super().__init__(client, sign)
+        self.max_pending = max_pending
+        self._pending = threading.BoundedSemaphore(max_pending)
+        # unbounded, so finishing a job never blocks on queuing its successor
+        self._build_q = queue.Queue()
+        self._sign_q = queue.Queue(maxsize=max_pending)
+        self._execute_q = queue.Queue(maxsize=max_pending)
+        self._threads = []
+        for n, target, q in (
+            (build_workers, self._build_worker, self._build_q),
+            (sign_workers, self._sign_worker, self._sign_q),
+            (execute_workers, self._execute_worker, self._execute_q),
+        ):
+            for _ in range(n):
+                t = threading.Thread(target=self._run, args=(target, q), daemon=True)
+                t.start()
+                self._threads.append((t, q))
+
+    def submit(self, method, signer, *args, key=None, **kwargs) -> Future:
+        """
+        Queue a transaction, e.g. `submit("transfer_sui", sender, coin, 100, recipient, 1)`
+
+        Parameters
+        ----------
+        method: :obj:`str`
+            Client method building the transaction, e.g. `transfer_object`
+            or `move_call`, called as method(signer, *args, **kwargs)
+        signer: :obj:`str`
+            Address that signs the transaction
+        key: :obj:`str`, optional
+            Transactions with the same key are executed in submission order
+
+        Returns
+        -------
+        Future
+            Resolves to the execute_transaction result, or the exception of
+            the stage that failed. Cancelling it before the transaction is
+            built skips the transaction
+        """
+        self._pending.acquire()
+        job = _Job(method, signer, args, kwargs, key, Future())
+        if self._admit(job):
+            self._build_q.put(job)
+        return job.future
+
+    def _run(self, target, q):
+        while True:
+            job = q.get()
+            if job is _stop:
+                return
+            try:
+                target(job)
+            except Exception as e:
+                self._finish(job, error=e)
+
+    def _build_worker(self, job):
+        if not job.future.set_running_or_notify_cancel():
+            # cancelled while queued, the future can no longer be cancelled after this
+            self._finish(job)
+            return
+        job.tx_bytes = plain(self._timed(BUILD, self._build, job))["txBytes"]
+        self._sign_q.put(job)
+
+    def _sign_worker(self, job):
+        job.signature = self._timed(SIGN, self.sign, job.signer, job.tx_bytes)
+        self._execute_q.put(job)
+
+    def _execute_worker(self, job):
+        result = self._timed(
+            EXECUTE, self.client.execute_transaction, job.tx_bytes, *job.signature
+        )
+        self._finish(job, result=result)
+
+    def _finish(self, job, result=None, error=None):
+        try:
+            if not job.future.done():
+                if error is None:
+                    job.future.set_result(result)
+                else:
+                    log.error(
+                        f"Transaction {job.method} from {job.signer} failed: {error}"
+                    )
+                    job.future.set_exception(error)
+        finally:
+            successor = self._next_for_key(job)
+            if successor is not None:
+                self._build_q.put(successor)
+            self._pending.release()
+
+    def close(self) -> None:
+        """
+        Wait for the queued transactions and stop the workers
+        """
+        for _ in range(self.max_pending):
+            self._pending.acquire()
+        for _, q in self._threads:
+            q.put(_stop)
+        for t, _ in self._threads:
+            t.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AsyncTransactionPipeline(_PipelineBase):
+    """
+    asyncio version of TransactionPipeline, on an AsyncSuiClient
+
+    `sign` may be a coroutine function. Takes the same parameters as
+    TransactionPipeline, workers are tasks instead of threads; create it
+    inside the running event loop.
+    """
+
+    def __init__(
+        self,
+        client,
+        sign,
+        build_workers=_default_workers,
+        sign_workers=_default_workers,
+        execute_workers=_default_workers,
+        max_pending=_default_max_pending,
+    ):
+        super().__init__(client, sign)
+        self.max_pending = max_pending
+        self._pending = asyncio.BoundedSemaphore(max_pending)
+        self._build_q = asyncio.Queue()
+        self._sign_q = asyncio.Queue(maxsize=max_pending)
+        self._execute_q = asyncio.Queue(maxsize=max_pending)
+        self._tasks = []
+        for n, target, q in (
+            (build_workers, self._build_worker, self._build_q),
+            (sign_workers, self._sign_worker, self._sign_q),
+            (execute_workers, self._execute_worker, self._execute_q),
+        ):
+            for _ in range(n):
+                self._tasks.append(asyncio.ensure_future(self._run(target, q)))
+
+    async def submit(self, method, signer, *args, key=None, **kwargs) -> asyncio.Future:
+        """
+        Queue a transaction, returns a future of its execute_transaction result
+
+        See Also
+        --------
+        TransactionPipeline.submit
+        """
+        await self._pending.acquire()
+        future = asyncio.get_running_loop().create_future()
+        job = _Job(method, signer, args, kwargs, key, future)
+        if self._admit(job):
+            self._build_q.put_nowait(job)
+        return future
+
+    async def _run(self, target, q):
+        while True:
+            job = await q.get()
+            try:
+                await target(job)
+            except Exception as e:
+                self._finish(job, error=e)
+
+    async def _timed_async(self, stage, fn, *args):
+        st = time.perf_counter()
+        try:
+            result = fn(*args)
+            if asyncio.iscoroutine(result):
+                result = await result
+        except Exception:
+            self.metrics.record(stage, time.perf_counter() - st, error=True)
+            raise
+        self.metrics.record(stage, time.perf_counter() - st)
+        return result
+
+    async def _build_worker(self, job):
+        if job.future.cancelled():
+            self._finish(job)
+            return
+        tx = await self._timed_async(BUILD, self._build, job)
+        job.tx_bytes = plain(tx)["txBytes"]
+        await self._sign_q.put(job)
+
+    async def _sign_worker(self, job):
+        job.signature = await self._timed_async(
+            SIGN, self.sign, job.signer, job.tx_bytes
+        )
+        await self._execute_q.put(job)
+
+    async def _execute_worker(self, job):
+        result = await self._timed_async(
+            EXECUTE, self.client.execute_transaction, job.tx_bytes, *job.signature
+        )
+        self._finish(job, result=result)
+
+    def _finish(self, job, result=None, error=None):
+        try:
+            if not job.future.done():
+                if error is None:
+                    job.future.set_result(result)
+                else:
+                    log.error(
+                        f"Transaction {job.method} from {job.signer} failed: {error}"
+                    )
+                    job.future.set_exception(error)
+        finally:
+            successor = self._next_for_key(job)
+            if successor is not None:
+                self._build_q.put_nowait(successor)
+            self._pending.release()
+
+    async def close(self) -> None:
+        """
+        Wait for the queued transactions and stop the workers
+        """
+        for _ in range(self.max_pending):
+            await self._pending.acquire()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
@@ -0,0 +1,304 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import requests
+
+from pysui.exceptions.exceptions import SignerError
+from pysui.includes.config import log
+from pysui.rpc.exceptions import (
+    RequestsError,
+    RequestsStatusError,
+    RequestsTimeoutError,
+)
+from pysui.rpc.session import SessionPool
+
+ED25519 = "ED25519"
+
+_default_max_batch = 20
+_default_max_delay = 0.01
+_default_max_in_flight = 4
+_default_timeout = 30
+
+
+class Signer(ABC):
+    """
+    Signs transaction bytes returned by the transaction building methods
+
+    A signer is a callable sign(address, tx_bytes) -> (flag, signature,
+    pub_key), the arguments following tx_bytes in execute_transaction, so it
+    can be passed as the `sign` of a TransactionPipeline or GasPool.
+    """
+
+    @abstractmethod
+    def sign(self, address, tx_bytes) -> tuple:
+        """
+        Sign `tx_bytes` (base64) as `address`
+
+        Returns
+        -------
+        tuple
+            (flag, signature, pub_key), signature and pub_key base64 encoded
+        """
+
+    async def sign_async(self, address, tx_bytes) -> tuple:
+        """
+        Coroutine version of `sign`, for AsyncTransactionPipeline
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.sign, address, tx_bytes
+        )
+
+    def __call__(self, address, tx_bytes) -> tuple:
+        return self.sign(address, tx_bytes)
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class LocalSigner(Signer):
+    """
+    Signs in process with ed25519 keys, needs PyNaCl
+
+    Parameters
+    ----------
+    keys: :obj:`dict`
+        {address: seed}, the 32 byte private key seed as bytes or base64
+    """
+
+    def __init__(self, keys=None):
+        try:
+            from nacl.signing import SigningKey
+        except ImportError as err:
+            raise ImportError("LocalSigner needs PyNaCl, pip install pynacl") from err
+        self._signing_key = SigningKey
+        self.keys = {}
+        for address, seed in (keys or {}).items():
+            self.add(address, seed)
+
+    def add(self, address, seed) -> None:
+        """
+        Add the key of `address`
+        """
+        if isinstance(seed, str):
+            seed = base64.b64decode(seed)
+        self.keys[address] = self._signing_key(seed)
+
+    def public_key(self, address) -> str:
+        """
+        Base64 public key of `address`
+        """
+        return base64.b64encode(bytes(self.keys[address].verify_key)).decode()
+
+    def sign(self, address, tx_bytes) -> tuple:
+        key = self.keys.get(address)
+        if key is None:
+            raise SignerError(f"No key for {address}")
+        signature = key.sign(base64.b64decode(tx_bytes)).signature
+        return ED25519, base64.b64encode(signature).decode(), self.public_key(address)
+
+    async def sign_async(self, address, tx_bytes) -> tuple:
+        return self.sign(address, tx_bytes)
+
+
+class _Pending:
+    __slots__ = ("address", "tx_bytes", "future", "queued")
+
+    def __init__(self, address, tx_bytes):
+        self.address = address
+        self.tx_bytes = tx_bytes
+        self.future = Future()
+        self.queued = time.monotonic()
+
+
+class BatchingSigner(Signer):
+    """
+    Signs through an external sign service, many transactions per request
+
+    Concurrent `sign` calls are queued and sent together as one
+    {"signed_txns": [{"owner_address", "tx_bytes"}, ...]} request once
+    `max_batch` are waiting or the oldest has waited `max_delay` seconds.
+    Every request goes through a pooled keep-alive session and each
+    signature in the reply is handed back to the caller of its entry.
+
+    Parameters
+    ----------
+    url: :obj:`str`
+        Sign service endpoint
+    token: :obj:`str`
+        Sent in the `token` header
+    max_batch: :obj:`int`, optional
+        Transactions per request
+    max_delay: :obj:`float`, optional
+        Seconds a transaction waits for others to join its request
+    max_in_flight: :obj:`int`, optional
+        Requests sent to the service at once
+    timeout: :obj:`int`, optional
+        Timeout in seconds of a request
+    scheme: :obj:`str`, optional
+        Signature flag used when the service does not return one
+    pool: :obj:`SessionPool`, optional
+        Connection pool, a private one by default
+    """
+
+    def __init__(
+        self,
+        url,
+        token,
+        max_batch=_default_max_batch,
+        max_delay=_default_max_delay,
+        max_in_flight=_default_max_in_flight,
+        timeout=_default_timeout,
+        scheme=ED25519,
+        pool=None,
+    ):
+        self.url = url
+        self.token = token
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.scheme = scheme
+        self.pool = pool or SessionPool()
+        self._owns_pool = pool is None
+        self._queue = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._senders = ThreadPoolExecutor(max_in_flight)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.requests = 0
+        self.signed = 0
+
+    def submit(self, address, tx_bytes) -> Future:
+        """
+        Queue `tx_bytes` for signing
+
+        Returns
+        -------
+        Future
+            Resolves to (flag, signature, pub_key)
+        """
+        pending = _Pending(address, tx_bytes)
+        with self._cond:
+            if self._closed:
+                raise SignerError("Signer is closed")
+            self._queue.append(pending)
+            self._cond.notify()
+        return pending.future
+
+    def sign(self, address, tx_bytes) -> tuple:
+        return self.submit(address, tx_bytes).result()
+
+    async def sign_async(self, address, tx_bytes) -> tuple:
+        return await asyncio.wrap_future(self.submit(address, tx_bytes))
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._queue and (
+                        len(self._queue) >= self.max_batch
+                        or self._closed
+                        or time.monotonic() - self._queue[0].queued >= self.max_delay
+                    ):
+                        break
+                    if self._closed:
+                        return
+                    timeout = (
+                        self._queue[0].queued + self.max_delay - time.monotonic()
+                        if self._queue
+                        else None
+                    )
+                    self._cond.wait(timeout)
+                batch = self._queue[: self.max_batch]
+                del self._queue[: self.max_batch]
+            self._senders.submit(self._flush, batch)
+
+    def _flush(self, batch):
+        # futures cancelled by their caller, e.g. through sign_async, are skipped
+        batch = [p for p in batch if p.future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        try:
+            signed = self._request(batch)
+        except Exception as e:
+            log.error(f"Signing {len(batch)} transactions failed: {e}")
+            for pending in batch:
+                pending.future.set_exception(e)
+            return
+        for pending, entry in zip(batch, signed):
+            try:
+                pending.future.set_result(self._signature(pending, entry))
+            except SignerError as e:
+                pending.future.set_exception(e)
+
+    def _request(self, batch) -> list:
+        payload = {
+            "signed_txns": [
+                {"owner_address": p.address, "tx_bytes": p.tx_bytes} for p in batch
+            ]
+        }
+        try:
+            resp = self.pool.get(self.url).post(
+                self.url,
+                params=json.dumps(payload),
+                headers={"token": self.token},
+                timeout=self.timeout,
+            )
+        except requests.exceptions.Timeout as err:
+            raise RequestsTimeoutError(self.url) from err
+        except requests.exceptions.RequestException as err:
+            raise RequestsError(self.url) from err
+        if resp.status_code >= 400:
+            raise RequestsStatusError(self.url, resp.status_code)
+        with self._cond:
+            self.requests += 1
+        try:
+            signed = resp.json()
+        except ValueError as err:
+            raise SignerError(f"Invalid reply from {self.url}: {resp.text}") from err
+        if isinstance(signed, dict):
+            signed = signed.get("signed_txns")
+        if not isinstance(signed, list) or len(signed) != len(batch):
+            raise SignerError(
+                f"Expected {len(batch)} signatures from {self.url}, got {signed}"
+            )
+        return signed
+
+    def _signature(self, pending, entry) -> tuple:
+        if not isinstance(entry, dict) or not entry.get("signed_txn"):
+            raise SignerError(f"No signature for {pending.address}: {entry}")
+        if entry.get("tx_bytes", pending.tx_bytes) != pending.tx_bytes:
+            raise SignerError(f"Signature of other transaction for {pending.address}")
+        with self._cond:
+            self.signed += 1
+        return (
+            entry.get("flag", self.scheme),
+            entry["signed_txn"],
+            entry.get("pub_key"),
+        )
+
+    def close(self) -> None:
+        """
+        Sign what is queued and stop the background threads
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self._senders.shutdown()
+        if self._owns_pool:
+            self.pool.close()
+
+    def stats(self) -> dict:
+        return dict(requests=self.requests, signed=self.signed)
@@ -1,5 +1,5 @@
 import datetime
-from pysui.methods import rpc_methods
+from pysui.client.client import SuiClient
 from pysui.includes.config import *
 from pysui import rpc
 from pysui.rpc.exceptions import RPCError
@@ -20,35 +20,30 @@ _default_endpoint = envs._default_endpoint
 sui_rpc = envs.sui_rpc
 ext_sign_url = envs.ext_sign_url
 
+node = SuiClient(_default_endpoint, timeout=_default_timeout)
+gateway = SuiClient(sui_rpc, timeout=_default_timeout)
 
-def sync(wallet, endpoint=sui_rpc, timeout=_default_timeout):
+
+def sync(wallet, client=gateway):
     # # Will only work with sui_rpc atm
-    synced = rpc_methods.sync_account_state(wallet, endpoint=endpoint, timeout=timeout)
-    log.info(f"Wallet:  {wallet}  synced  at endpoint  {endpoint}\n")
+    synced = client.sync_account_state(wallet)
+    log.info(f"Wallet:  {wallet}  synced  at endpoint  {client.endpoint}\n")
 
 
 def do_count(num=10):
-    count = rpc_methods.get_recent_transactions(
-        num, endpoint=_default_endpoint, timeout=_default_timeout
-    )
+    count = node.get_recent_transactions(num)
     log.info(f"Count  ::  {count}\n")
     return count
 
 
 def do_get_tx(tx):
-    get_tx = rpc_methods.get_transaction(
-        tx,
-        endpoint=_default_endpoint,
-        timeout=_default_timeout,
-    )
+    get_tx = node.get_transaction(tx)
     log.info(f"GET TX  ::  {get_tx}\n")
     return tx
 
 
-def get_owned(wallet, _default_endpoint=_default_endpoint):
-    owned = rpc_methods.get_objects_owned_by_address(
-        wallet, endpoint=_default_endpoint, timeout=_default_timeout
-    )
+def get_owned(wallet, client=node):
+    owned = client.get_objects_owned_by_address(wallet)
     log.info(f"Owned  ::  {owned}\n")
     return owned
 
@@ -73,8 +68,7 @@ def get_signed(address: str, tx: str):
 def sign_and_execute(
     tx: list,
     signer: str,
-    endpoint: str = sui_rpc,
-    timeout: str = _default_timeout,
+    client: SuiClient = gateway,
 ) -> int:
     # # 2, Sign the transaction using the Sui signtool#
     # f"sui keytool sign --address {signer} --data {tx['txBytes']}"
@@ -87,13 +81,11 @@ def sign_and_execute(
     sent = 0
 
     for x in signed_txns:
-        res = rpc_methods.execute_transaction(
+        res = client.execute_transaction(
             tx_bytes,
             # '1',
             x.get("signed_txn"),
             x.get("pub_key"),
-            endpoint=endpoint,
-            timeout=timeout,
         )
         log.info(f"Sent Response  ::  {res}\n")
         try:
@@ -111,21 +103,19 @@ def send_sui_tx(
     sui_object_id: str,
     gas_budget: int,
     amount: int,
-    _default_endpoint=sui_rpc,
+    client: SuiClient = gateway,
 ) -> bool:
     # 1, Create a transaction to transfer a Sui coin from one address to another:#
 
-    tx = rpc_methods.transfer_sui(
+    tx = client.transfer_sui(
         signer,
         sui_object_id,
         gas_budget,
         recipient,
         amount,
-        endpoint=_default_endpoint,
-        timeout=_default_timeout,
     )
     log.info(f"TX response  ::  {tx}\n")
-    return sign_and_execute(tx, signer)
+    return sign_and_execute(tx, signer, client=client)
 
 
 def send_sui(txns_per_run, wallet, wallet1, amount, sui_object_id, _gas_budget=100):
@@ -156,22 +146,20 @@ def send_obj_tx(
     _object_id: str,
     _gas_object_id: str,
     _gas_budget: int,
-    _default_endpoint=sui_rpc,
+    client: SuiClient = gateway,
 ) -> bool:
     # 1, Create a transaction to transfer an object from one address to another:#
 
-    tx = rpc_methods.transfer_object(
+    tx = client.transfer_object(
         _from,
         _object_id,
         _gas_object_id,
         _gas_budget,
         _to,
-        endpoint=_default_endpoint,
-        timeout=_default_timeout,
     )
     log.info(f"TX response  ::  {tx}\n")
 
-    return sign_and_execute(tx, _from)
+    return sign_and_execute(tx, _from, client=client)
 
 
 def send_obj(
@@ -194,36 +182,26 @@ def send_obj(
 
 
 def get_from_to(wallet):
-    _from = rpc_methods.get_transactions_from_address(
-        wallet2, endpoint=_default_endpoint, timeout=_default_timeout
-    )
+    _from = node.get_transactions_from_address(wallet2)
     log.info(f"Data FROM [{wallet}]\n{_from}\n")
 
-    _to = rpc_methods.get_transactions_to_address(
-        wallet2, endpoint=_default_endpoint, timeout=_default_timeout
-    )
+    _to = node.get_transactions_to_address(wallet2)
     log.info(f"Data TO [{wallet}]\n{_to}\n")
 
 
 def do_get_object(obj):
-    res = rpc_methods.get_object(
-        obj, endpoint=_default_endpoint, timeout=_default_timeout
-    )
+    res = node.get_object(obj)
     log.info(f"Data for Object  ::  {obj}\n{res}\n")
 
 
 def get_total_tx():
-    total = rpc_methods.get_total_transaction_number(
-        endpoint=_default_endpoint, timeout=_default_timeout
-    )
+    total = node.get_total_transaction_number()
     log.info(f"total tx count = {total}\n")
     return total
 
 
 def get_owned_by_object(obj):
-    res = rpc_methods.get_objects_owned_by_object(
-        obj, endpoint=_default_endpoint, timeout=_default_timeout
-    )
+    res = node.get_objects_owned_by_object(obj)
     log.info(f"Data owned by Object  ::  {obj}\n{res}\n")
 
 
@@ -231,23 +209,17 @@ def get_tx_in_range(
     start,
     end,
 ):
-    res = rpc_methods.get_transactions_in_range(
-        start, end, endpoint=_default_endpoint, timeout=_default_timeout
-    )
+    res = node.get_transactions_in_range(start, end)
     log.info(f"Range {start} - {end}\n{res}\n")
 
 
 def tx_by_input(obj):
-    res = rpc_methods.get_transactions_by_input_object(
-        obj, endpoint=_default_endpoint, timeout=_default_timeout
-    )
+    res = node.get_transactions_by_input_object(obj)
     log.info(f"TX by Input for Object  ::  {obj}\n{res}\n")
 
 
 def tx_by_mutated(obj):
-    res = rpc_methods.get_transactions_by_mutated_object(
-        obj, endpoint=_default_endpoint, timeout=_default_timeout
-    )
+    res = node.get_transactions_by_mutated_object(obj)
     log.info(f"TX by mutated Object  ::  {obj}\n{res}\n")
 
 
@@ -284,7 +256,7 @@ if __name__ == "__main__":
 
         if do_send_coins_and_objects:
             # Only via Devnet for now..
-            owned = get_owned(wallet, _default_endpoint=sui_rpc)
+            owned = get_owned(wallet, client=gateway)
             obj = owned[0]["objectId"]
             gas_obj = owned[1]["objectId"]
 
@@ -0,0 +1,9 @@
+import os
+import tempfile
+
+# importing pysui creates data/IN/... and logs/ under the working directory,
+# run the tests from a scratch directory holding the parents it expects
+_workdir = tempfile.mkdtemp(prefix="pysui-tests-")
+for _parent in ("IN", "OUT"):
+    os.makedirs(os.path.join(_workdir, "data", _parent))
+os.chdir(_workdir)
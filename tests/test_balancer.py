@@ -0,0 +1,135 @@
+import pytest
+
+from pysui.rpc import balancer
+from pysui.rpc.balancer import LEAST_IN_FLIGHT, EndpointPool
+from pysui.rpc.exceptions import RequestsError, RequestsTimeoutError, RPCError
+
+
+def test_requires_endpoints_and_known_strategy():
+    with pytest.raises(ValueError):
+        EndpointPool([])
+    with pytest.raises(ValueError):
+        EndpointPool(["a"], strategy="round_robin")
+
+
+def test_writes_go_to_write_endpoint():
+    pool = EndpointPool(["a", "b"], write_endpoint="w")
+    assert pool.select(write=True) == "w"
+    assert pool.select() in ("a", "b")
+
+
+def test_selects_least_latency():
+    pool = EndpointPool(["a", "b"])
+    pool.record("a", 0.5)
+    pool.record("b", 0.1)
+    assert pool.select() == "b"
+    assert pool.select(exclude=("b",)) == "a"
+    # every endpoint excluded falls back to all of them
+    assert pool.select(exclude=("a", "b")) == "b"
+
+
+def test_selects_least_in_flight():
+    pool = EndpointPool(["a", "b"], strategy=LEAST_IN_FLIGHT)
+    with pool.track("a"):
+        assert pool.select() == "b"
+    assert pool.states["a"].in_flight == 0
+
+
+def test_failure_drains_endpoint_until_success():
+    pool = EndpointPool(["a", "b"])
+    pool.record("a", 0.01)
+    pool.record("b", 0.5)
+    pool.record("a", 0.01, ok=False)
+    assert pool.select() == "b"
+    assert pool.states["a"].errors == 1
+    pool.record("a", 0.01)
+    assert pool.select() == "a"
+
+
+def test_drained_endpoint_is_tried_again_after_cooldown(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(balancer.time, "monotonic", lambda: now[0])
+    pool = EndpointPool(["a", "b"], health_interval=0, cooldown=30)
+    pool.start()
+    assert pool._thread is None
+    pool.record("a", 0.01)
+    pool.record("b", 0.5)
+    pool.record("a", 0.01, ok=False)
+    now[0] += 29
+    assert pool.select() == "b"
+    now[0] += 1
+    assert pool.select() == "a"
+    # failing again restarts the cooldown
+    pool.record("a", 0.01, ok=False)
+    assert pool.select() == "b"
+
+
+@pytest.mark.parametrize("error", [RequestsError("a"), RequestsTimeoutError("a")])
+def test_track_records_transport_errors(error):
+    pool = EndpointPool(["a"])
+    with pytest.raises(type(error)):
+        with pool.track("a"):
+            raise error
+    assert not pool.states["a"].healthy
+
+
+def test_track_keeps_endpoint_healthy_on_rpc_error():
+    pool = EndpointPool(["a"])
+    with pytest.raises(RPCError):
+        with pool.track("a"):
+            raise RPCError("m", "a", "bad params")
+    assert pool.states["a"].healthy
+    assert pool.states["a"].requests == 1
+
+
+def test_track_latency_ends_at_mark(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(balancer.time, "perf_counter", lambda: now[0])
+    pool = EndpointPool(["a"])
+    with pool.track("a") as mark:
+        now[0] = 1.0
+        mark()
+        now[0] = 5.0
+        mark()
+        now[0] = 9.0
+    assert pool.states["a"].latency == 1.0
+
+
+def test_percentile():
+    pool = EndpointPool(["a"])
+    assert pool.percentile("a", 50) is None
+    for elapsed in (0.1, 0.2, 0.3, 0.4):
+        pool.record("a", elapsed)
+    assert pool.percentile("a", 50) == 0.3
+    assert pool.percentile("a", 100) == 0.4
+
+
+@pytest.mark.parametrize(
+    "error", [RequestsError("b"), RequestsTimeoutError("b"), RPCError("m", "b", "x")]
+)
+def test_check_marks_failing_endpoints(monkeypatch, error):
+    def rpc_request(method, endpoint, **kwargs):
+        if endpoint == "b":
+            raise error
+        return {"result": 1}
+
+    monkeypatch.setattr(balancer, "rpc_request", rpc_request)
+    pool = EndpointPool(["a", "b"])
+    pool.check()
+    assert pool.states["a"].healthy
+    assert not pool.states["b"].healthy
+
+
+def test_health_thread_survives_unexpected_errors(monkeypatch):
+    calls = []
+
+    def check():
+        calls.append(1)
+        if len(calls) >= 3:
+            pool._stop.set()
+        raise RuntimeError("boom")
+
+    pool = EndpointPool(["a"], health_interval=0.001)
+    monkeypatch.setattr(pool, "check", check)
+    pool._run()
+    assert len(calls) == 3
@@ -0,0 +1,143 @@
+from concurrent.futures import Future
+
+import pytest
+
+from pysui.models.models import TransactionBytes
+from pysui.transactions.batch import (
+    BulkSender,
+    chunks,
+    move_call_params,
+    transfer_object_params,
+)
+
+
+class FakeClient:
+    """
+    Builds batches in memory, the batch holding object `fail` is refused
+    """
+
+    def __init__(self, fail=None):
+        self.fail = fail
+        self.built = []
+        self.executed = []
+
+    def batch_transaction(self, signer, params, gas, gas_budget):
+        self.built.append((signer, params, gas, gas_budget))
+        if any(
+            p.get("transferObjectRequestParams", {}).get("objectId") == self.fail
+            for p in params
+        ):
+            raise ValueError(f"cannot build {self.fail}")
+        return {"txBytes": f"tx{len(self.built)}"}
+
+    def execute_transaction(self, tx_bytes, flag, signature, pub_key):
+        self.executed.append(tx_bytes)
+        return {"digest": tx_bytes}
+
+
+class FakePipeline:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, method, signer, *args, key=None, **kwargs):
+        self.submitted.append((method, signer, args, key))
+        return Future()
+
+
+class FakeGasPool:
+    owner = "0xA"
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, pipeline, method, signer, *args, **kwargs):
+        self.submitted.append((method, signer, args, kwargs))
+        return Future()
+
+
+def sign(address, tx_bytes):
+    return "ED25519", "sig", "pk"
+
+
+def transfers(n):
+    return [(f"o{i}", "0xb") for i in range(n)]
+
+
+def test_chunks():
+    assert chunks(range(5), 2) == [[0, 1], [2, 3], [4]]
+    assert chunks([], 2) == []
+
+
+def test_params():
+    assert transfer_object_params("o1", "0xb") == {
+        "transferObjectRequestParams": {"objectId": "o1", "recipient": "0xb"}
+    }
+    assert move_call_params("0x2", "m", "f")["moveCallRequestParams"] == {
+        "packageObjectId": "0x2",
+        "module": "m",
+        "function": "f",
+        "typeArguments": [],
+        "arguments": [],
+    }
+
+
+def test_needs_sign_or_pipeline():
+    with pytest.raises(ValueError):
+        BulkSender(FakeClient())
+    with pytest.raises(ValueError):
+        BulkSender(FakeClient(), sign=sign, gas_pool=FakeGasPool())
+
+
+def test_batches_and_gas_budget():
+    client = FakeClient()
+    sender = BulkSender(client, sign=sign, batch_size=3, gas_budget=100)
+    results = sender.transfer_objects("0xa", transfers(7), gas="g")
+    assert results == [{"digest": "tx1"}, {"digest": "tx2"}, {"digest": "tx3"}]
+    assert [(len(p), gas, budget) for _, p, gas, budget in client.built] == [
+        (3, "g", 300),
+        (3, "g", 300),
+        (1, "g", 100),
+    ]
+
+
+def test_build_result_may_be_a_model():
+    class ModelClient(FakeClient):
+        def batch_transaction(self, *args):
+            return TransactionBytes.from_dict(super().batch_transaction(*args))
+
+    client = ModelClient()
+    sender = BulkSender(client, sign=sign, batch_size=3)
+    assert sender.transfer_objects("0xa", transfers(4)) == [
+        {"digest": "tx1"},
+        {"digest": "tx2"},
+    ]
+
+
+def test_failed_batch_keeps_the_others():
+    client = FakeClient(fail="o3")
+    sender = BulkSender(client, sign=sign, batch_size=2)
+    results = sender.transfer_objects("0xa", transfers(6))
+    assert results[0] == {"digest": "tx1"}
+    assert isinstance(results[1], ValueError)
+    assert results[2] == {"digest": "tx3"}
+    assert client.executed == ["tx1", "tx3"]
+
+
+def test_pipeline_key_is_gas_or_signer():
+    pipeline = FakePipeline()
+    sender = BulkSender(FakeClient(), batch_size=2, pipeline=pipeline)
+    sender.transfer_objects("0xa", transfers(3), gas="g")
+    sender.move_calls("0xa", [("0x2", "m", "f", [], [1])])
+    assert [key for *_, key in pipeline.submitted] == ["g", "g", "0xa"]
+    assert pipeline.submitted[0][2][1:] == ("g", 2000)
+
+
+def test_gas_pool_pays_for_its_owner_only():
+    pool = FakeGasPool()
+    sender = BulkSender(
+        FakeClient(), batch_size=2, pipeline=FakePipeline(), gas_pool=pool
+    )
+    sender.transfer_objects("0xa", transfers(3))
+    assert [kwargs["gas_budget"] for *_, kwargs in pool.submitted] == [2000, 1000]
+    with pytest.raises(ValueError):
+        sender.transfer_objects("0xb", transfers(1))
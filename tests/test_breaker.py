@@ -0,0 +1,138 @@
+import pytest
+
+from pysui.client.client import SuiClient
+from pysui.rpc import breaker
+from pysui.rpc.breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakers,
+)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(breaker.time, "monotonic", lambda: now[0])
+    return now
+
+
+def fail(cb, n):
+    for _ in range(n):
+        assert cb.allow()
+        cb.record(0.01, ok=False)
+
+
+def test_opens_at_failure_rate(clock):
+    cb = CircuitBreaker("e", failure_rate=0.5, min_calls=4, open_timeout=10)
+    cb.record(0.01)
+    cb.record(0.01)
+    fail(cb, 1)
+    assert cb.state == CLOSED
+    fail(cb, 1)
+    assert cb.state == OPEN
+    assert not cb.allow()
+
+
+def test_needs_min_calls(clock):
+    cb = CircuitBreaker("e", min_calls=5)
+    fail(cb, 4)
+    assert cb.state == CLOSED
+
+
+def test_opens_on_slow_calls(clock):
+    cb = CircuitBreaker("e", slow_call_threshold=1.0, slow_call_rate=0.5, min_calls=2)
+    cb.record(0.5)
+    cb.record(2.0)
+    assert cb.state == OPEN
+
+
+def test_half_open_trial_closes(clock):
+    cb = CircuitBreaker("e", min_calls=1, open_timeout=10)
+    fail(cb, 1)
+    clock[0] += 10
+    assert cb.state == HALF_OPEN
+    assert cb.allow()
+    # only half_open_calls trials are let through
+    assert not cb.allow()
+    cb.record(0.01)
+    assert cb.state == CLOSED
+    assert cb.allow()
+
+
+def test_half_open_failure_reopens(clock):
+    cb = CircuitBreaker("e", min_calls=1, open_timeout=10)
+    fail(cb, 1)
+    clock[0] += 10
+    assert cb.allow()
+    cb.record(0.01, ok=False)
+    assert cb.state == OPEN
+    clock[0] += 5
+    assert not cb.allow()
+
+
+def test_state_change_hook(clock):
+    changes = []
+    cb = CircuitBreaker(
+        "e",
+        min_calls=1,
+        open_timeout=10,
+        on_state_change=lambda *change: changes.append(change),
+    )
+    fail(cb, 1)
+    clock[0] += 10
+    cb.allow()
+    cb.record(0.01)
+    assert changes == [
+        ("e", CLOSED, OPEN),
+        ("e", OPEN, HALF_OPEN),
+        ("e", HALF_OPEN, CLOSED),
+    ]
+
+
+def test_breakers_per_endpoint(clock):
+    breakers = CircuitBreakers(min_calls=1, open_timeout=10)
+    assert breakers.get("a") is breakers.get("a")
+    fail(breakers.get("a"), 1)
+    breakers.get("b").record(0.01)
+    assert breakers.open_endpoints() == ["a"]
+    assert breakers.stats() == {"a": OPEN, "b": CLOSED}
+    clock[0] += 10
+    assert breakers.open_endpoints() == []
+
+
+class InterruptedLimiter:
+    # the first wait for a token is interrupted
+    def __init__(self):
+        self.calls = 0
+
+    def acquire(self, endpoint, methods, tokens=1):
+        self.calls += 1
+        if self.calls == 1:
+            raise KeyboardInterrupt
+
+
+def test_interrupted_rate_limit_does_not_take_the_trial(clock):
+    breakers = CircuitBreakers(min_calls=1, open_timeout=10)
+    client = SuiClient(breaker=breakers, rate_limit=InterruptedLimiter())
+    fail(breakers.get("e"), 1)
+    clock[0] += 10
+    with pytest.raises(KeyboardInterrupt):
+        client._guarded("e", ["sui_getObject"], lambda: 1)
+    assert client._guarded("e", ["sui_getObject"], lambda: 2) == 2
+    assert breakers.get("e").state == CLOSED
+
+
+def test_interrupted_rate_limit_does_not_take_the_stream_trial(clock):
+    breakers = CircuitBreakers(min_calls=1, open_timeout=10)
+    client = SuiClient(breaker=breakers, rate_limit=InterruptedLimiter())
+    fail(breakers.get("e"), 1)
+    clock[0] += 10
+    with pytest.raises(KeyboardInterrupt):
+        next(client._guarded_iter("e", ["sui_getObject"], lambda: iter([1])))
+    assert list(client._guarded_iter("e", ["sui_getObject"], lambda: iter([1]))) == [
+        None,
+        1,
+    ]
+    assert breakers.get("e").state == CLOSED
@@ -0,0 +1,105 @@
+import time
+
+import pytest
+
+from pysui.client.cache import LRUCache, make_key
+from pysui.client.object_cache import ObjectCache
+
+
+def test_make_key_ignores_dict_order():
+    assert make_key("m", [{"a": 1, "b": 2}]) == make_key("m", [{"b": 2, "a": 1}])
+    assert make_key("m", [1]) != make_key("n", [1])
+
+
+def test_get_missing_returns_default_and_counts_miss():
+    cache = LRUCache()
+    assert cache.get("k") is None
+    assert cache.get("k", 5) == 5
+    assert cache.stats()["misses"] == 2
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    cache = LRUCache(ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=None)
+    now[0] += 11
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_values_are_copied_in_and_out():
+    cache = LRUCache()
+    value = {"result": {"fields": [1]}}
+    cache.set("k", value)
+    value["result"]["fields"].append(2)
+    got = cache.get("k")
+    got["result"]["fields"].append(3)
+    assert cache.get("k") == {"result": {"fields": [1]}}
+
+
+def test_object_cache_returns_copies():
+    cache = ObjectCache()
+    resp = {
+        "result": {
+            "status": "Exists",
+            "details": {"reference": {"objectId": "o", "version": 1}},
+        }
+    }
+    cache.put("sui_getObject", "o", resp)
+    cache.get("sui_getObject", "o")["result"]["status"] = "Deleted"
+    assert cache.get("sui_getObject", "o") == resp
+
+
+def test_stats_hit_ratio():
+    cache = LRUCache()
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (2, 1, 1)
+    assert stats["hit_ratio"] == pytest.approx(2 / 3)
+
+
+def test_pop_and_clear():
+    cache = LRUCache()
+    cache.set("a", 1)
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "gone") == "gone"
+    cache.set("b", 2)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_save_and_load_skip_expired(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    fn = str(tmp_path / "cache")
+    cache = LRUCache(ttl=10, fn=fn)
+    cache.set("short", 1, ttl=1)
+    cache.set("long", {"x": [1, 2]})
+    cache.save()
+    now[0] += 5
+    loaded = LRUCache(ttl=10, fn=fn)
+    assert loaded.get("short") is None
+    assert loaded.get("long") == {"x": [1, 2]}
+
+
+def test_save_without_file_fails():
+    with pytest.raises(ValueError):
+        LRUCache().save()
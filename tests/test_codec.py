@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+from pysui.rpc import codec
+from pysui.rpc.codec import get_codec, set_codec
+
+BACKENDS = ("orjson", "msgspec", "ujson", "json")
+U128_MAX = 2**128 - 1
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    pytest.importorskip(request.param)
+    return get_codec(request.param)
+
+
+def test_round_trip(backend):
+    obj = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "sui_getObject",
+        "params": ["0x5", None, True, 1.5, [1, 2], {"näme": "ü"}],
+    }
+    data = backend.dumps(obj)
+    assert isinstance(data, bytes)
+    assert backend.loads(data) == obj
+    assert backend.loads(data.decode()) == obj
+
+
+def test_long_integers_stay_exact(backend):
+    for value in (2**63 - 1, 2**64 - 1, 10**19, U128_MAX):
+        data = b'{"balance": %d}' % value
+        result = backend.loads(data)
+        assert result["balance"] == value
+        assert isinstance(result["balance"], int)
+        assert backend.loads(data.decode())["balance"] == value
+
+
+def test_long_integers_are_encoded(backend):
+    assert json.loads(backend.dumps({"balance": U128_MAX})) == {"balance": U128_MAX}
+
+
+def test_digits_in_strings_take_the_fallback_and_decode_alike(backend):
+    data = b'{"digest": "12345678901234567890123", "n": 1}'
+    assert backend.loads(data) == {"digest": "12345678901234567890123", "n": 1}
+
+
+def test_invalid_json_raises_decode_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        backend.loads(b'{"result":')
+
+
+def test_unserializable_raises_type_error(backend):
+    with pytest.raises(TypeError):
+        backend.dumps({"x": object()})
+
+
+def test_has_long_int():
+    assert codec._has_long_int(b"[1234567890123456789]")
+    assert codec._has_long_int("[1234567890123456789]")
+    assert not codec._has_long_int(b"[123456789012345678]")
+
+
+def test_orjson_decodes_long_integers_with_stdlib(monkeypatch):
+    orjson = pytest.importorskip("orjson")
+    backend = get_codec("orjson")
+    calls = []
+    stdlib_loads = json.loads
+
+    def loads(data):
+        calls.append(data)
+        return stdlib_loads(data)
+
+    monkeypatch.setattr(codec.json, "loads", loads)
+    assert backend.loads(b"[1]") == [1]
+    assert calls == []
+    assert backend.loads(b"[%d]" % U128_MAX) == [U128_MAX]
+    assert calls == [b"[%d]" % U128_MAX]
+    assert orjson.loads(b"[%d]" % U128_MAX) != [U128_MAX]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_codec("pickle")
+
+
+def test_missing_backend_raises_import_error(monkeypatch):
+    without_fast_backends(monkeypatch)
+    with pytest.raises(ImportError):
+        get_codec("orjson")
+
+
+def without_fast_backends(monkeypatch):
+    import_module = codec.importlib.import_module
+
+    def fake_import(name):
+        if name in ("orjson", "msgspec", "ujson"):
+            raise ImportError(name)
+        return import_module(name)
+
+    monkeypatch.setattr(codec.importlib, "import_module", fake_import)
+
+
+def test_falls_back_to_stdlib_without_orjson(monkeypatch):
+    without_fast_backends(monkeypatch)
+    backend = get_codec()
+    assert backend.name == "json"
+    assert backend.loads(backend.dumps({"balance": U128_MAX})) == {"balance": U128_MAX}
+
+
+def test_set_codec_selects_the_process_codec(monkeypatch):
+    monkeypatch.setattr(codec, "_codec", codec._codec)
+    assert set_codec("json").name == "json"
+    assert codec.dumps([1]) == b"[1]"
+    assert codec.loads(b"[1]") == [1]
+    without_fast_backends(monkeypatch)
+    assert set_codec().name == "json"
@@ -0,0 +1,151 @@
+import threading
+import time
+
+import pytest
+
+from pysui.exceptions.exceptions import TxConfirmationTimedoutError
+from pysui.rpc.exceptions import RequestsTimeoutError, RPCError
+from pysui.transactions.confirm import ConfirmationTracker, _Tracked
+
+
+class FakeClient:
+    """
+    get_transactions confirming the digests in `confirmed`
+    """
+
+    def __init__(self):
+        self.confirmed = set()
+        self.error = None
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_transactions(self, digests, batch_size=None):
+        with self.lock:
+            self.calls.append(list(digests))
+        if self.error is not None:
+            raise self.error
+        return [
+            (
+                {"certificate": {"transactionDigest": d}}
+                if d in self.confirmed
+                else RPCError("sui_getTransaction", "e", f"{d} not found")
+            )
+            for d in digests
+        ]
+
+
+def pending(tracker, *digests, deadline=None):
+    # tracked without starting the polling thread
+    deadline = time.monotonic() + 60 if deadline is None else deadline
+    for digest in digests:
+        tracker._pending[digest] = _Tracked(digest, deadline)
+    return [tracker._pending[d].future for d in digests]
+
+
+def test_poll_resolves_confirmed_digests():
+    client = FakeClient()
+    tracker = ConfirmationTracker(client, min_interval=0.1, max_interval=1)
+    first, second = pending(tracker, "a", "b")
+    client.confirmed.add("a")
+    assert tracker.poll() == 1
+    assert first.result(0)["certificate"]["transactionDigest"] == "a"
+    assert not second.done()
+    assert client.calls == [["a", "b"]]
+    assert tracker.stats()["pending"] == 1
+
+
+def test_interval_backs_off_and_resets():
+    client = FakeClient()
+    tracker = ConfirmationTracker(client, min_interval=0.1, max_interval=0.3)
+    pending(tracker, "a")
+    tracker.poll()
+    assert tracker.interval == pytest.approx(0.2)
+    tracker.poll()
+    tracker.poll()
+    assert tracker.interval == pytest.approx(0.3)
+    client.confirmed.add("a")
+    tracker.poll()
+    assert tracker.interval == pytest.approx(0.1)
+
+
+def test_poll_times_out_overdue_digests():
+    tracker = ConfirmationTracker(FakeClient())
+    (future,) = pending(tracker, "a", deadline=time.monotonic() - 1)
+    tracker.poll()
+    assert isinstance(future.exception(0), TxConfirmationTimedoutError)
+    assert tracker.stats()["timed_out"] == 1
+
+
+def test_failed_round_expires_and_backs_off():
+    client = FakeClient()
+    client.error = RequestsTimeoutError("e")
+    tracker = ConfirmationTracker(client, min_interval=0.1, max_interval=1)
+    overdue, waiting = pending(tracker, "a", "b")
+    tracker._pending["a"].deadline = time.monotonic() - 1
+    with pytest.raises(RequestsTimeoutError):
+        tracker.poll()
+    assert isinstance(overdue.exception(0), TxConfirmationTimedoutError)
+    assert not waiting.done()
+    stats = tracker.stats()
+    assert (stats["rounds"], stats["pending"]) == (1, 1)
+    assert stats["interval"] == pytest.approx(0.2)
+
+
+def test_track_confirms_in_background():
+    client = FakeClient()
+    client.confirmed.update(["a", "b"])
+    with ConfirmationTracker(client, min_interval=0.01) as tracker:
+        results = tracker.wait(["a", "b"])
+        assert [r["certificate"]["transactionDigest"] for r in results] == ["a", "b"]
+        assert tracker.track("c") is tracker.track("c")
+
+
+def test_track_callback_and_timeout():
+    done = threading.Event()
+    with ConfirmationTracker(FakeClient(), min_interval=0.01) as tracker:
+        future = tracker.track("a", callback=lambda f: done.set(), timeout=0.05)
+        assert isinstance(future.exception(5), TxConfirmationTimedoutError)
+        assert done.wait(5)
+
+
+def test_background_polling_survives_failures():
+    client = FakeClient()
+    client.error = RequestsTimeoutError("e")
+    with ConfirmationTracker(client, min_interval=0.01, max_interval=0.02) as tracker:
+        future = tracker.track("a", timeout=0.1)
+        assert isinstance(future.exception(5), TxConfirmationTimedoutError)
+        assert len(client.calls) > 1
+
+
+def test_close_fails_pending_futures():
+    tracker = ConfirmationTracker(FakeClient(), min_interval=0.01)
+    future = tracker.track("a")
+    tracker.close()
+    assert isinstance(future.exception(0), TxConfirmationTimedoutError)
+    assert tracker.wait([]) == []
+    with pytest.raises(RuntimeError):
+        tracker.track("b")
+
+
+def test_zero_timeout_is_not_the_default():
+    with ConfirmationTracker(FakeClient(), min_interval=0.01) as tracker:
+        future = tracker.track("a", timeout=0)
+        assert isinstance(future.exception(1), TxConfirmationTimedoutError)
+
+
+def test_timeout_fires_before_the_next_round():
+    with ConfirmationTracker(FakeClient(), min_interval=5, max_interval=5) as tracker:
+        st = time.monotonic()
+        future = tracker.track("a", timeout=0.1)
+        assert isinstance(future.exception(2), TxConfirmationTimedoutError)
+        assert time.monotonic() - st < 1
+
+
+def test_cancelled_future_is_skipped():
+    client = FakeClient()
+    client.confirmed.add("a")
+    tracker = ConfirmationTracker(client)
+    (future,) = pending(tracker, "a")
+    assert future.cancel()
+    assert tracker.poll() == 1
+    assert future.cancelled()
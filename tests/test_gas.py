@@ -0,0 +1,231 @@
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from pysui.models.models import TransactionBytes
+from pysui.transactions.gas import SUI_COIN_TYPE, GasCoin, GasPool
+
+
+class FakeClient:
+    """
+    Coins of one owner, {object_id: [version, balance]}, build methods record
+    their calls and execute returns no effects
+    """
+
+    def __init__(self, coins):
+        self.coins = coins
+        self.built = []
+
+    def get_objects_owned_by_address(self, owner):
+        infos = [
+            {"objectId": object_id, "version": version, "type": SUI_COIN_TYPE}
+            for object_id, (version, _) in self.coins.items()
+        ]
+        return infos + [{"objectId": "nft", "version": 1, "type": "0x2::nft::NFT"}]
+
+    def get_objects(self, ids, bypass_cache=False):
+        return [
+            {
+                "status": "Exists",
+                "details": {"data": {"fields": {"balance": self.coins[i][1]}}},
+            }
+            for i in ids
+        ]
+
+    def split_coin(self, signer, coin, amounts, gas, gas_budget):
+        self.built.append(("split", coin, amounts, gas))
+        return {"txBytes": "split"}
+
+    def merge_coins(self, signer, primary, merged, gas, gas_budget):
+        self.built.append(("merge", primary, merged, gas))
+        return {"txBytes": "merge"}
+
+    def execute_transaction(self, tx_bytes, flag, signature, pub_key):
+        return {}
+
+
+def sign(address, tx_bytes):
+    return "ED25519", "sig", "pk"
+
+
+def effects(**kwargs):
+    return {"EffectResponse": {"effects": dict(status={"status": "success"}, **kwargs)}}
+
+
+def ref(object_id, version, owner="0xa"):
+    return {
+        "owner": {"AddressOwner": owner},
+        "reference": {"objectId": object_id, "version": version},
+    }
+
+
+class FakePipeline:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, method, signer, *args, key=None, **kwargs):
+        future = Future()
+        self.submitted.append((method, signer, args, key, kwargs, future))
+        return future
+
+
+def pool_with(*coins, **kwargs):
+    pool = GasPool(None, "0xa", **kwargs)
+    for object_id, balance in coins:
+        pool.coins[object_id] = GasCoin(object_id, 1, balance)
+    return pool
+
+
+def test_submit_releases_coin_of_cancelled_future():
+    pool = pool_with(("c1", 5000))
+    pipeline = FakePipeline()
+    future = pool.submit(
+        pipeline, "transfer_object", "0xa", "o1", "0xb", gas_budget=100
+    )
+    assert pool.coins["c1"].leased
+    assert future.cancel()
+    assert not pool.coins["c1"].leased
+
+
+def test_acquire_leases_largest_free_coin():
+    pool = pool_with(("c1", 5000), ("c2", 9000), ("dust", 10))
+    coin = pool.acquire()
+    assert coin.object_id == "c2" and coin.leased
+    assert pool.acquire().object_id == "c1"
+    # coins below min_balance are never handed out
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.01)
+    pool.release(coin)
+    assert pool.acquire(timeout=0).object_id == "c2"
+    assert pool.stats()["leases"] == 3
+
+
+def test_acquire_waits_for_release():
+    pool = pool_with(("c1", 5000))
+    coin = pool.acquire()
+    threading.Timer(0.05, pool.release, args=(coin,)).start()
+    assert pool.acquire(timeout=5) is coin
+    assert pool.stats()["waits"] >= 1
+
+
+def test_lease_context_releases():
+    pool = pool_with(("c1", 5000))
+    with pytest.raises(RuntimeError):
+        with pool.lease() as coin:
+            raise RuntimeError()
+    assert not coin.leased
+
+
+def test_observe_updates_versions_and_balances():
+    pool = pool_with(("c1", 5000), ("c2", 5000))
+    pool.observe(
+        effects(
+            mutated=[ref("c1", 7), ref("c2", 7)],
+            gasObject=ref("c1", 7),
+            gasUsed={"computationCost": 100, "storageCost": 50, "storageRebate": 30},
+        )
+    )
+    assert (pool.coins["c1"].version, pool.coins["c1"].balance) == (7, 4880)
+    assert (pool.coins["c2"].version, pool.coins["c2"].balance) == (7, 5000)
+
+
+def test_observe_drops_deleted_and_transferred_coins():
+    pool = pool_with(("c1", 5000), ("c2", 5000), ("c3", 5000), ("c4", 5000))
+    pool.observe(
+        effects(
+            mutated=[ref("c1", 2, owner="0xb")],
+            deleted=[{"objectId": "c2"}],
+            wrapped=[{"objectId": "c3"}],
+            gasObject=ref("c4", 2, owner="0xA"),
+        )
+    )
+    assert list(pool.coins) == ["c4"]
+
+
+def test_submit_passes_the_leased_coin():
+    pool = pool_with(("c1", 5000))
+    pipeline = FakePipeline()
+    future = pool.submit(
+        pipeline,
+        "transfer_sui",
+        "0xa",
+        gas_arg="sui_object_id",
+        gas_budget=100,
+        recipient="0xb",
+        amount=1,
+    )
+    method, signer, args, key, kwargs, _ = pipeline.submitted[0]
+    assert (method, key, kwargs["sui_object_id"]) == ("transfer_sui", "c1", "c1")
+    future.set_result(effects(mutated=[ref("c1", 3)]))
+    assert not pool.coins["c1"].leased
+    assert pool.coins["c1"].version == 3
+
+
+def test_submit_refuses_transfer_sui_without_amount():
+    pool = pool_with(("c1", 5000))
+    with pytest.raises(ValueError):
+        pool.submit(FakePipeline(), "transfer_sui", "0xa", recipient="0xb")
+    assert not pool.coins["c1"].leased
+
+
+def test_refresh_keeps_leased_coins():
+    client = FakeClient({"c1": [5, 8000], "c2": [5, 3000]})
+    pool = GasPool(client, "0xa")
+    pool.refresh()
+    assert {c: pool.coins[c].balance for c in pool.coins} == {"c1": 8000, "c2": 3000}
+    coin = pool.acquire()
+    coin.balance = 7000
+    del client.coins["c1"]
+    client.coins["c2"][1] = 2000
+    pool.refresh()
+    assert pool.coins["c1"] is coin and coin.balance == 7000
+    assert pool.coins["c2"].balance == 2000
+    pool.release(coin)
+    pool.refresh()
+    assert list(pool.coins) == ["c2"]
+
+
+def test_split_largest_coin_paid_by_smallest():
+    client = FakeClient({"big": [1, 100000], "mid": [1, 20000], "small": [1, 2000]})
+    pool = GasPool(client, "0xa", sign=sign, min_balance=1000)
+    pool.refresh()
+    pool.split(3)
+    assert client.built == [("split", "big", [10000] * 3, "small")]
+    assert not any(c.leased for c in pool.coins.values())
+
+
+def test_split_needs_two_coins():
+    client = FakeClient({"big": [1, 100000]})
+    pool = GasPool(client, "0xa", sign=sign)
+    pool.refresh()
+    with pytest.raises(ValueError):
+        pool.split(1)
+
+
+def test_merge_dust_into_largest_coin():
+    client = FakeClient(
+        {"big": [1, 100000], "pay": [1, 5000], "d1": [1, 10], "d2": [1, 20]}
+    )
+    pool = GasPool(client, "0xa", sign=sign, min_balance=1000)
+    pool.refresh()
+    pool.merge_dust()
+    assert [b[:2] for b in client.built] == [("merge", "big"), ("merge", "big")]
+    assert {b[2] for b in client.built} == {"d1", "d2"}
+    assert {b[3] for b in client.built} == {"pay"}
+
+
+def test_build_result_may_be_a_model():
+    class ModelClient(FakeClient):
+        def split_coin(self, *args):
+            return TransactionBytes.from_dict(super().split_coin(*args))
+
+        def execute_transaction(self, tx_bytes, flag, signature, pub_key):
+            self.executed = tx_bytes
+            return {}
+
+    client = ModelClient({"big": [1, 100000], "small": [1, 2000]})
+    pool = GasPool(client, "0xa", sign=sign, min_balance=1000)
+    pool.refresh()
+    pool.split(2)
+    assert client.executed == "split"
@@ -0,0 +1,147 @@
+import json
+import random
+
+import pytest
+
+from pysui.rpc.exceptions import RPCError
+from pysui.rpc.lazy import (
+    Incomplete,
+    LazyResponse,
+    _skip_container,
+    skip_value,
+    split_pointer,
+)
+
+REPLY = json.dumps(
+    {
+        "jsonrpc": "2.0",
+        "result": {
+            "effects": {"status": {"status": "success"}, "gasUsed": 10},
+            "objects": [
+                {"objectId": "0x1", "owner": {"AddressOwner": "0xa"}},
+                {"objectId": "0x2", "note": 'brackets ]}[{ and "quotes" \\'},
+                {"other": None},
+            ],
+            "a/b": 1,
+            "m~n": 2,
+        },
+        "id": 1,
+    }
+).encode()
+
+
+def random_value(rng, depth=0):
+    kind = rng.randrange(7 if depth < 4 else 4)
+    if kind == 0:
+        return rng.randint(-(10**20), 10**20)
+    if kind == 1:
+        return rng.choice([None, True, False, 1.5e-3])
+    if kind in (2, 3):
+        return "".join(rng.choice('ab"\\]}[{ \né') for _ in range(rng.randrange(8)))
+    if kind in (4, 5):
+        return [random_value(rng, depth + 1) for _ in range(rng.randrange(5))]
+    return {
+        random_value(rng, 4): random_value(rng, depth + 1)
+        for _ in range(rng.randrange(5))
+    }
+
+
+@pytest.mark.parametrize("chunk", [1, 2, 3, 7, 64, 1 << 16])
+def test_skip_container_matches_json(chunk):
+    rng = random.Random(chunk)
+    for _ in range(200):
+        value = [random_value(rng) for _ in range(3)]
+        raw = json.dumps(value, indent=rng.choice([None, 1])).encode()
+        padded = b"  " + raw + b", 1]"
+        assert _skip_container(padded, 2, chunk) == 2 + len(raw)
+
+
+@pytest.mark.parametrize("chunk", [1, 3, 1 << 16])
+def test_skip_container_truncated(chunk):
+    raw = json.dumps({"a": ['x"]}', [1, {"b": "\\"}]]}).encode()
+    for end in range(1, len(raw)):
+        with pytest.raises(Incomplete):
+            _skip_container(raw[:end], 0, chunk)
+
+
+@pytest.mark.parametrize(
+    "raw, end",
+    [
+        (b'"a\\"b" ,', 6),
+        (b"123,", 3),
+        (b"  true]", 6),
+        (b"null", 4),
+        (b'{"a": [1, "]"]} ', 15),
+    ],
+)
+def test_skip_value(raw, end):
+    assert skip_value(raw, 0) == end
+
+
+def test_skip_value_not_final():
+    assert skip_value(b"12", 0) == 2
+    with pytest.raises(Incomplete):
+        skip_value(b"12", 0, final=False)
+    with pytest.raises(Incomplete):
+        skip_value(b'"abc', 0)
+
+
+def test_split_pointer():
+    assert split_pointer("") == []
+    assert split_pointer("/a~1b/m~0n/0") == ["a/b", "m~n", "0"]
+    with pytest.raises(ValueError):
+        split_pointer("result")
+
+
+def test_get():
+    resp = LazyResponse(REPLY)
+    assert resp.get("/result/effects/status/status") == "success"
+    assert resp.get("/result/objects/1/note") == 'brackets ]}[{ and "quotes" \\'
+    assert resp.get("/result/a~1b") == 1
+    assert resp.get("/result/m~0n") == 2
+    assert resp.get("/result/objects/2/other") is None
+    assert resp.get("") == json.loads(REPLY)
+
+
+def test_missing_path():
+    resp = LazyResponse(REPLY)
+    with pytest.raises(KeyError):
+        resp.get("/result/objects/3")
+    with pytest.raises(KeyError):
+        resp.get("/result/effects/nope")
+    assert resp.get("/result/nope", "default") == "default"
+
+
+def test_raw_value_select_each_decode():
+    resp = LazyResponse(REPLY.decode())
+    assert json.loads(resp.raw_value("/result/effects")) == {
+        "status": {"status": "success"},
+        "gasUsed": 10,
+    }
+    assert resp.select("/result/effects/gasUsed", "/result/x") == {
+        "/result/effects/gasUsed": 10,
+        "/result/x": None,
+    }
+    assert list(resp.each("/result/objects", "/owner/AddressOwner", "-")) == [
+        "0xa",
+        "-",
+        "-",
+    ]
+    assert resp.decode() is resp.decode()
+
+
+def test_error_reply_raises_rpc_error():
+    resp = LazyResponse(
+        b'{"jsonrpc": "2.0", "error": {"code": -32602, "message": "bad"}, "id": 1}'
+    )
+    with pytest.raises(RPCError) as info:
+        resp.get("/result/effects")
+    assert info.value.code == -32602
+
+
+@pytest.mark.parametrize(
+    "raw", [b"<html>502 Bad Gateway</html>", REPLY[: len(REPLY) // 2]]
+)
+def test_invalid_reply_raises_rpc_error(raw):
+    with pytest.raises(RPCError):
+        LazyResponse(raw).get("/result/objects/2/other")
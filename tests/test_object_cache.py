@@ -0,0 +1,179 @@
+import pytest
+
+from pysui.client import cache
+from pysui.client.client import SuiClient
+from pysui.client.object_cache import ObjectCache, find_effects, object_reference
+
+GET = "sui_getObject"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "time", lambda: now[0])
+    return now
+
+
+def response(object_id, version, value=None):
+    return {
+        "result": {
+            "status": "Exists",
+            "details": {
+                "reference": {"objectId": object_id, "version": version},
+                "data": {"value": value},
+            },
+        }
+    }
+
+
+def ref(object_id, version):
+    return {"objectId": object_id, "version": version}
+
+
+def owned(object_id, version):
+    return {"owner": {"AddressOwner": "0xa"}, "reference": ref(object_id, version)}
+
+
+def executed(**effects):
+    return {"EffectResponse": {"effects": effects}}
+
+
+def test_object_reference():
+    assert object_reference(response("o", 3)) == ref("o", 3)
+    assert object_reference({"result": {"status": "Deleted"}}) is None
+    assert object_reference({"error": {}}) is None
+
+
+def test_find_effects():
+    assert find_effects(executed(status="ok")) == {"status": "ok"}
+    assert find_effects({"effects": {"status": "ok"}}) == {"status": "ok"}
+    assert find_effects({"txBytes": "x"}) is None
+    assert find_effects(None) is None
+
+
+def test_serves_the_latest_known_version(clock):
+    objects = ObjectCache()
+    assert objects.get(GET, "o") is None
+    objects.put(GET, "o", response("o", 1))
+    assert objects.get(GET, "o") == response("o", 1)
+    assert objects.get("sui_getRawObject", "o") is None
+    assert objects.stats()["hits"] == 1
+    assert objects.stats()["misses"] == 2
+
+
+def test_versions_are_separate_entries(clock):
+    objects = ObjectCache()
+    objects.put(GET, "o", response("o", 1, "old"))
+    objects.put(GET, "o", response("o", 2, "new"))
+    assert objects.get(GET, "o") == response("o", 2, "new")
+    assert objects.stats()["size"] == 2
+
+
+def test_stale_read_is_not_cached(clock):
+    objects = ObjectCache()
+    objects.put(GET, "o", response("o", 2))
+    objects.put(GET, "o", response("o", 1))
+    assert objects.get(GET, "o") == response("o", 2)
+    assert objects.stats()["size"] == 1
+
+
+def test_missing_object_invalidates(clock):
+    objects = ObjectCache()
+    objects.put(GET, "o", response("o", 1))
+    objects.put(GET, "o", {"result": {"status": "Deleted"}})
+    assert objects.get(GET, "o") is None
+
+
+def test_latest_version_expires_after_latest_ttl(clock):
+    objects = ObjectCache(latest_ttl=10)
+    objects.put(GET, "o", response("o", 1))
+    clock[0] += 9
+    assert objects.get(GET, "o") is not None
+    clock[0] += 2
+    assert objects.get(GET, "o") is None
+
+
+def test_created_and_mutated_move_the_version_forward(clock):
+    objects = ObjectCache()
+    objects.put(GET, "a", response("a", 1))
+    objects.put(GET, "b", response("b", 1))
+    objects.observe(executed(created=[owned("c", 1)], mutated=[owned("a", 2)]))
+    assert objects.get(GET, "a") is None
+    assert objects.get(GET, "b") == response("b", 1)
+    objects.put(GET, "a", response("a", 2))
+    objects.put(GET, "c", response("c", 1))
+    assert objects.get(GET, "a") == response("a", 2)
+    assert objects.get(GET, "c") == response("c", 1)
+
+
+def test_gas_object_moves_forward(clock):
+    objects = ObjectCache()
+    objects.put(GET, "gas", response("gas", 4))
+    objects.observe(executed(gasObject=owned("gas", 5)))
+    assert objects.get(GET, "gas") is None
+
+
+def test_observe_never_moves_a_version_back(clock):
+    objects = ObjectCache()
+    objects.put(GET, "o", response("o", 5))
+    objects.observe(executed(mutated=[owned("o", 3)]))
+    assert objects.get(GET, "o") == response("o", 5)
+
+
+def test_deleted_and_wrapped_invalidate(clock):
+    objects = ObjectCache()
+    objects.put(GET, "d", response("d", 1))
+    objects.put(GET, "w", response("w", 1))
+    objects.observe(executed(deleted=[ref("d", 2)], wrapped=[ref("w", 2)]))
+    assert objects.get(GET, "d") is None
+    assert objects.get(GET, "w") is None
+
+
+def test_transaction_bytes_invalidate_gas_and_inputs(clock):
+    objects = ObjectCache()
+    for object_id in ("gas", "in1", "in2", "other"):
+        objects.put(GET, object_id, response(object_id, 1))
+    objects.observe(
+        {
+            "txBytes": "x",
+            "gas": ref("gas", 1),
+            "inputObjects": [
+                {"ImmOrOwnedMoveObject": ref("in1", 1)},
+                {"MovePackage": "in2"},
+                {"SharedMoveObject": ref("in2", 1)},
+            ],
+        }
+    )
+    assert objects.get(GET, "gas") is None
+    assert objects.get(GET, "in1") is None
+    assert objects.get(GET, "in2") is None
+    assert objects.get(GET, "other") == response("other", 1)
+
+
+def test_observe_ignores_results_without_effects(clock):
+    objects = ObjectCache()
+    objects.put(GET, "o", response("o", 1))
+    objects.observe(None)
+    objects.observe("digest")
+    assert objects.get(GET, "o") == response("o", 1)
+
+
+def test_client_reads_through_and_observes_builds(clock):
+    client = SuiClient(cache_size=0)
+    versions = {"gas": 1}
+    sent = []
+
+    def request(method, params, endpoint, timeout):
+        sent.append(method)
+        if method == GET:
+            return response(params[0], versions[params[0]])
+        return {"result": {"txBytes": "x", "gas": ref("gas", 1)}}
+
+    client._request = request
+    client.rpc_request(GET, ["gas"])
+    assert client.rpc_request(GET, ["gas"]) == response("gas", 1)
+    assert sent == [GET]
+    client.rpc_request("sui_splitCoin", ["0xa", "c", [1], "gas", 100])
+    versions["gas"] = 2
+    assert client.rpc_request(GET, ["gas"]) == response("gas", 2)
+    assert sent == [GET, "sui_splitCoin", GET]
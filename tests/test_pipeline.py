@@ -0,0 +1,198 @@
+import asyncio
+import random
+import threading
+import time
+
+import pytest
+
+from pysui.models.models import TransactionBytes
+from pysui.transactions.pipeline import (
+    BUILD,
+    EXECUTE,
+    SIGN,
+    AsyncTransactionPipeline,
+    TransactionPipeline,
+)
+
+
+class FakeClient:
+    """
+    Builds and executes transactions in memory, `gate` holds back builds
+    """
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.gate.set()
+        self.lock = threading.Lock()
+        self.executed = []
+
+    def transfer_object(self, signer, object_id, recipient, fail=False, delay=0):
+        self.gate.wait()
+        time.sleep(delay)
+        if fail:
+            raise ValueError(f"cannot build {object_id}")
+        return {"txBytes": f"{signer}:{object_id}:{recipient}"}
+
+    def execute_transaction(self, tx_bytes, flag, signature, pub_key):
+        with self.lock:
+            self.executed.append(tx_bytes)
+        return {"digest": tx_bytes, "signature": signature}
+
+
+def sign(address, tx_bytes):
+    return "ED25519", f"sig({tx_bytes})", "pk"
+
+
+def test_cancelled_job_does_not_stop_its_key():
+    client = FakeClient()
+    client.gate.clear()
+    with TransactionPipeline(client, sign, max_pending=4) as pipeline:
+        first = pipeline.submit("transfer_object", "0xa", "o1", "0xb", key="k")
+        second = pipeline.submit("transfer_object", "0xa", "o2", "0xb", key="k")
+        third = pipeline.submit("transfer_object", "0xa", "o3", "0xb", key="k")
+        assert second.cancel()
+        client.gate.set()
+        assert third.result(timeout=5)["digest"] == "0xa:o3:0xb"
+        assert first.result(timeout=5)["digest"] == "0xa:o1:0xb"
+        assert second.cancelled()
+    assert client.executed == ["0xa:o1:0xb", "0xa:o3:0xb"]
+
+
+def test_same_key_runs_in_submission_order():
+    client = FakeClient()
+    rng = random.Random(1)
+    with TransactionPipeline(client, sign) as pipeline:
+        futures = [
+            pipeline.submit(
+                "transfer_object",
+                "0xa",
+                f"{key}{i}",
+                "0xb",
+                delay=rng.random() / 100,
+                key=key,
+            )
+            for i in range(10)
+            for key in "xy"
+        ]
+        for future in futures:
+            future.result(timeout=5)
+    for key in "xy":
+        executed = [t for t in client.executed if t.startswith(f"0xa:{key}")]
+        assert executed == [f"0xa:{key}{i}:0xb" for i in range(10)]
+
+
+def test_unkeyed_transactions_overlap():
+    client = FakeClient()
+    with TransactionPipeline(client, sign, build_workers=4) as pipeline:
+        st = time.monotonic()
+        futures = [
+            pipeline.submit("transfer_object", "0xa", f"o{i}", "0xb", delay=0.1)
+            for i in range(4)
+        ]
+        for future in futures:
+            future.result(timeout=5)
+        assert time.monotonic() - st < 0.3
+
+
+def test_failure_reaches_the_future_and_the_key_moves_on():
+    client = FakeClient()
+    with TransactionPipeline(client, sign) as pipeline:
+        failed = pipeline.submit(
+            "transfer_object", "0xa", "o1", "0xb", fail=True, key="k"
+        )
+        after = pipeline.submit("transfer_object", "0xa", "o2", "0xb", key="k")
+        with pytest.raises(ValueError):
+            failed.result(timeout=5)
+        assert after.result(timeout=5)["signature"] == "sig(0xa:o2:0xb)"
+    stats = pipeline.stats()
+    assert stats[BUILD]["calls"] == 2
+    assert stats[BUILD]["errors"] == 1
+    assert stats[SIGN]["calls"] == stats[EXECUTE]["calls"] == 1
+    assert stats[EXECUTE]["per_second"] > 0
+
+
+def test_build_result_may_be_a_model():
+    class ModelClient(FakeClient):
+        def transfer_object(self, *args, **kwargs):
+            tx = super().transfer_object(*args, **kwargs)
+            return TransactionBytes.from_dict(tx)
+
+    client = ModelClient()
+    with TransactionPipeline(client, sign) as pipeline:
+        future = pipeline.submit("transfer_object", "0xa", "o1", "0xb")
+        assert future.result(timeout=5)["digest"] == "0xa:o1:0xb"
+
+
+def test_sign_failure():
+    def refuse(address, tx_bytes):
+        raise PermissionError(address)
+
+    with TransactionPipeline(FakeClient(), refuse) as pipeline:
+        future = pipeline.submit("transfer_object", "0xa", "o1", "0xb")
+        with pytest.raises(PermissionError):
+            future.result(timeout=5)
+    assert pipeline.stats()[SIGN]["errors"] == 1
+
+
+def test_submit_blocks_at_max_pending():
+    client = FakeClient()
+    client.gate.clear()
+    pipeline = TransactionPipeline(client, sign, max_pending=2)
+    pipeline.submit("transfer_object", "0xa", "o1", "0xb")
+    pipeline.submit("transfer_object", "0xa", "o2", "0xb")
+    submitted = threading.Event()
+
+    def third():
+        pipeline.submit("transfer_object", "0xa", "o3", "0xb")
+        submitted.set()
+
+    threading.Thread(target=third, daemon=True).start()
+    assert not submitted.wait(0.1)
+    client.gate.set()
+    assert submitted.wait(5)
+    pipeline.close()
+    assert len(client.executed) == 3
+
+
+class AsyncFakeClient:
+    def __init__(self):
+        self.executed = []
+
+    async def transfer_object(self, signer, object_id, recipient, fail=False):
+        await asyncio.sleep(random.random() / 1000)
+        if fail:
+            raise ValueError(f"cannot build {object_id}")
+        return {"txBytes": f"{signer}:{object_id}:{recipient}"}
+
+    async def execute_transaction(self, tx_bytes, flag, signature, pub_key):
+        self.executed.append(tx_bytes)
+        return {"digest": tx_bytes, "signature": signature}
+
+
+async def sign_async(address, tx_bytes):
+    return "ED25519", f"sig({tx_bytes})", "pk"
+
+
+def test_async_pipeline():
+    async def main():
+        client = AsyncFakeClient()
+        async with AsyncTransactionPipeline(client, sign_async) as pipeline:
+            futures = [
+                await pipeline.submit("transfer_object", "0xa", f"o{i}", "0xb", key="k")
+                for i in range(10)
+            ]
+            failed = await pipeline.submit(
+                "transfer_object", "0xa", "bad", "0xb", fail=True, key="k"
+            )
+            cancelled = await pipeline.submit(
+                "transfer_object", "0xa", "gone", "0xb", key="k"
+            )
+            cancelled.cancel()
+            results = await asyncio.gather(*futures)
+            with pytest.raises(ValueError):
+                await failed
+        assert [r["digest"] for r in results] == [f"0xa:o{i}:0xb" for i in range(10)]
+        assert client.executed == [f"0xa:o{i}:0xb" for i in range(10)]
+        assert pipeline.stats()[BUILD]["errors"] == 1
+
+    asyncio.run(main())
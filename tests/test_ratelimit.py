@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from pysui.rpc import ratelimit
+from pysui.rpc.ratelimit import RateLimiter, TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Patched monotonic clock, sleeping records the wait and moves the clock
+    """
+    now = [100.0]
+    slept = []
+
+    def sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    async def sleep_async(seconds):
+        sleep(seconds)
+
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(ratelimit.time, "sleep", sleep)
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", sleep_async)
+    return now, slept
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_burst_defaults_to_one_second_of_tokens(clock):
+    assert TokenBucket(2.5).burst == 3
+    assert TokenBucket(0.5).burst == 1
+    assert TokenBucket(10, burst=4).burst == 4
+
+
+def test_reserve_beyond_burst_waits_in_arrival_order(clock):
+    bucket = TokenBucket(10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+    assert bucket.waited == pytest.approx(0.3)
+
+
+def test_refill_is_capped_at_burst(clock):
+    now, _ = clock
+    bucket = TokenBucket(10, burst=2)
+    bucket.reserve(2)
+    now[0] += 0.05
+    assert bucket.reserve() == pytest.approx(0.05)
+    now[0] += 60
+    assert bucket.reserve(2) == 0
+    assert bucket.reserve() == pytest.approx(0.1)
+
+
+def test_acquire_sleeps_only_when_empty(clock):
+    _, slept = clock
+    bucket = TokenBucket(4, burst=1)
+    bucket.acquire()
+    assert slept == []
+    bucket.acquire()
+    bucket.acquire()
+    assert slept == pytest.approx([0.25, 0.25])
+
+
+def test_acquire_async(clock):
+    _, slept = clock
+    bucket = TokenBucket(2, burst=1)
+
+    async def main():
+        await bucket.acquire_async()
+        await bucket.acquire_async()
+
+    asyncio.run(main())
+    assert slept == pytest.approx([0.5])
+
+
+def test_reads_and_writes_use_separate_buckets(clock):
+    _, slept = clock
+    limiter = RateLimiter(read_rate=1, write_rate=1)
+    limiter.acquire("e", ["sui_getObject"])
+    limiter.acquire("e", ["sui_executeTransaction"])
+    assert slept == []
+    limiter.acquire("e", ["sui_getObject", "sui_executeTransaction"])
+    assert slept == pytest.approx([1.0])
+    assert limiter.stats() == {"e read": 0.0, "e write": pytest.approx(1.0)}
+
+
+def test_buckets_are_per_endpoint(clock):
+    limiter = RateLimiter(read_rate=1)
+    read = limiter.bucket("a", ["sui_getObject"])
+    assert read is limiter.bucket("a", ["sui_getEvents"])
+    assert read is not limiter.bucket("b", ["sui_getObject"])
+
+
+def test_unlimited_kind_has_no_bucket(clock):
+    _, slept = clock
+    limiter = RateLimiter(read_rate=1)
+    assert limiter.bucket("e", ["sui_executeTransaction"]) is None
+    for _ in range(5):
+        limiter.acquire("e", ["sui_executeTransaction"])
+    assert slept == []
+
+
+def test_endpoint_overrides(clock):
+    limiter = RateLimiter(read_rate=1, write_rate=1, endpoints={"fast": (50, None)})
+    assert limiter.bucket("fast", ["sui_getObject"]).rate == 50
+    assert limiter.bucket("fast", ["sui_executeTransaction"]) is None
+    assert limiter.bucket("slow", ["sui_getObject"]).rate == 1
+
+
+def test_limiter_acquire_async(clock):
+    _, slept = clock
+    limiter = RateLimiter(write_rate=4, burst=1)
+
+    async def main():
+        for _ in range(3):
+            await limiter.acquire_async("e", ["sui_executeTransaction"])
+        await limiter.acquire_async("e", ["sui_getObject"])
+
+    asyncio.run(main())
+    assert slept == pytest.approx([0.25, 0.25])
@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+import requests
+
+from pysui.rpc import retry
+from pysui.rpc.exceptions import (
+    CircuitOpenError,
+    RequestsError,
+    RequestsStatusError,
+    RequestsTimeoutError,
+    RPCError,
+)
+from pysui.rpc.retry import RetryPolicy, attempt_timeout
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    slept = []
+    monkeypatch.setattr(retry.time, "sleep", slept.append)
+    return slept
+
+
+def connection_error():
+    try:
+        raise requests.exceptions.ConnectionError()
+    except requests.exceptions.ConnectionError as err:
+        try:
+            raise RequestsError("e") from err
+        except RequestsError as wrapped:
+            return wrapped
+
+
+def failing(errors, result="ok"):
+    errors = list(errors)
+    calls = []
+
+    def fn(remaining):
+        calls.append(remaining)
+        if errors:
+            raise errors.pop(0)
+        return result
+
+    return fn, calls
+
+
+@pytest.mark.parametrize(
+    "error, retryable",
+    [
+        (RequestsTimeoutError("e"), True),
+        (RequestsStatusError("e", 503), True),
+        (RequestsStatusError("e", 400), False),
+        (connection_error(), True),
+        (RequestsError("e"), False),
+        (RPCError("m", "e", "internal", -32603), True),
+        (RPCError("m", "e", "invalid params", -32602), False),
+        (CircuitOpenError("e"), False),
+        (ValueError(), False),
+    ],
+)
+def test_is_retryable(error, retryable):
+    assert RetryPolicy().is_retryable(error) is retryable
+
+
+def test_retries_until_success(no_sleep):
+    fn, calls = failing([RequestsTimeoutError("e")] * 2)
+    assert RetryPolicy(max_attempts=3).call(fn, "sui_getObject") == "ok"
+    assert len(calls) == 3
+    assert len(no_sleep) == 2
+
+
+def test_gives_up_after_max_attempts():
+    fn, calls = failing([RequestsTimeoutError("e")] * 5)
+    with pytest.raises(RequestsTimeoutError):
+        RetryPolicy(max_attempts=3).call(fn, "sui_getObject")
+    assert len(calls) == 3
+
+
+def test_open_circuit_is_not_retried():
+    fn, calls = failing([CircuitOpenError("e")])
+    with pytest.raises(CircuitOpenError):
+        RetryPolicy().call(fn, "sui_getObject")
+    assert len(calls) == 1
+
+
+def test_execute_not_retried_unless_allowed():
+    fn, calls = failing([RequestsTimeoutError("e")])
+    with pytest.raises(RequestsTimeoutError):
+        RetryPolicy().call(fn, "sui_executeTransaction")
+    assert len(calls) == 1
+    fn, calls = failing([RequestsTimeoutError("e")])
+    policy = RetryPolicy(retry_non_idempotent=True)
+    assert policy.call(fn, "sui_executeTransaction") == "ok"
+
+
+def test_deadline_stops_retries():
+    fn, calls = failing([RequestsTimeoutError("e")] * 2)
+    with pytest.raises(RequestsTimeoutError):
+        RetryPolicy(base_delay=10, max_delay=10, deadline=0).call(fn, "m")
+    assert len(calls) == 1
+
+
+def test_backoff_is_bounded():
+    policy = RetryPolicy(base_delay=0.1, max_delay=1)
+    for attempt in range(10):
+        assert 0 <= policy.backoff(attempt) <= min(1, 0.1 * 2**attempt)
+
+
+def test_method_overrides():
+    strict = RetryPolicy(max_attempts=1)
+    policy = RetryPolicy(overrides={"sui_getObject": strict})
+    assert policy.for_method("sui_getObject") is strict
+    assert policy.for_method("sui_getEvents") is policy
+    fn, calls = failing([RequestsTimeoutError("e")])
+    with pytest.raises(RequestsTimeoutError):
+        policy.call(fn, "sui_getObject")
+    assert len(calls) == 1
+
+
+def test_call_async(monkeypatch):
+    async def sleep(delay):
+        pass
+
+    monkeypatch.setattr(retry.asyncio, "sleep", sleep)
+    errors = [RequestsTimeoutError("e")]
+
+    async def fn(remaining):
+        if errors:
+            raise errors.pop()
+        return "ok"
+
+    assert asyncio.run(RetryPolicy().call_async(fn, "m")) == "ok"
+
+
+def test_attempts_get_the_time_left(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(retry.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(retry.time, "sleep", lambda delay: None)
+    monkeypatch.setattr(RetryPolicy, "backoff", lambda self, attempt: 1.0)
+    calls = []
+
+    def fn(remaining):
+        calls.append(remaining)
+        # the attempt runs into its timeout
+        now[0] += remaining if len(calls) > 1 else 3.0
+        raise RequestsTimeoutError("e")
+
+    with pytest.raises(RequestsTimeoutError):
+        RetryPolicy(max_attempts=5, deadline=10).call(fn, "m")
+    assert calls == [10.0, 7.0]
+
+
+def test_attempt_timeout():
+    assert attempt_timeout(30, None) == 30
+    assert attempt_timeout(30, 5.5) == 5.5
+    assert attempt_timeout(30, 60) == 30
+    assert attempt_timeout(30, -1) > 0
@@ -0,0 +1,197 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pysui.exceptions.exceptions import SignerError
+from pysui.transactions.signer import ED25519, BatchingSigner, LocalSigner, Signer
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self.body = body
+        self.status_code = status_code
+        self.text = json.dumps(body)
+
+    def json(self):
+        return self.body
+
+
+class FakeService:
+    """
+    Sign service and SessionPool in one, signs every entry as sig(tx_bytes)
+    """
+
+    def __init__(self, reply=None):
+        self.reply = reply
+        self.gate = threading.Event()
+        self.gate.set()
+        self.entered = threading.Event()
+        self.batches = []
+        self.headers = []
+
+    def get(self, endpoint):
+        return self
+
+    def close(self, endpoint=None):
+        pass
+
+    def post(self, url, params, headers, timeout):
+        self.entered.set()
+        self.gate.wait()
+        entries = json.loads(params)["signed_txns"]
+        self.batches.append([e["tx_bytes"] for e in entries])
+        self.headers.append(headers)
+        if self.reply is not None:
+            return FakeResponse(self.reply(entries))
+        return FakeResponse(
+            {
+                "signed_txns": [
+                    {"tx_bytes": e["tx_bytes"], "signed_txn": f"sig({e['tx_bytes']})"}
+                    for e in entries
+                ]
+            }
+        )
+
+
+def test_cancelled_entry_does_not_block_its_batch():
+    service = FakeService()
+    service.gate.clear()
+    signer = BatchingSigner(
+        "http://sign", "t", max_batch=2, max_in_flight=1, pool=service
+    )
+    try:
+        # the first request holds the only sender, the next batch waits behind it
+        blocker = signer.submit("0xa", "t0")
+        assert service.entered.wait(5)
+        first = signer.submit("0xa", "t1")
+        second = signer.submit("0xa", "t2")
+        assert first.cancel()
+        service.gate.set()
+        assert blocker.result(timeout=5)[1] == "sig(t0)"
+        assert second.result(timeout=5)[1] == "sig(t2)"
+        assert first.cancelled()
+        assert service.batches == [["t0"], ["t2"]]
+    finally:
+        signer.close()
+
+
+def test_batches_on_size():
+    service = FakeService()
+    service.gate.clear()
+    signer = BatchingSigner(
+        "http://sign", "t", max_batch=3, max_delay=10, max_in_flight=1, pool=service
+    )
+    try:
+        futures = [signer.submit("0xa", f"t{i}") for i in range(6)]
+        service.gate.set()
+        assert [f.result(timeout=5)[1] for f in futures] == [
+            f"sig(t{i})" for i in range(6)
+        ]
+    finally:
+        signer.close()
+    assert service.batches == [["t0", "t1", "t2"], ["t3", "t4", "t5"]]
+    assert service.headers[0] == {"token": "t"}
+    assert signer.stats() == {"requests": 2, "signed": 6}
+
+
+def test_batches_on_delay():
+    service = FakeService()
+    with BatchingSigner(
+        "http://sign", "t", max_batch=100, max_delay=0.05, pool=service
+    ) as signer:
+        st = time.monotonic()
+        first = signer.submit("0xa", "t0")
+        second = signer.submit("0xb", "t1")
+        assert first.result(timeout=5) == ("ED25519", "sig(t0)", None)
+        assert time.monotonic() - st >= 0.05
+        assert second.result(timeout=5)[1] == "sig(t1)"
+    assert service.batches == [["t0", "t1"]]
+
+
+def test_replies_reach_their_callers():
+    def reply(entries):
+        return [
+            {"tx_bytes": e["tx_bytes"], "signed_txn": e["owner_address"], "flag": "X"}
+            for e in entries
+        ]
+
+    service = FakeService(reply)
+    with BatchingSigner("http://sign", "t", max_batch=4, pool=service) as signer:
+        with ThreadPoolExecutor(4) as callers:
+            results = list(
+                callers.map(lambda i: signer.sign(f"0x{i}", f"t{i}"), range(4))
+            )
+    assert results == [("X", f"0x{i}", None) for i in range(4)]
+
+
+def test_length_mismatch_fails_the_batch():
+    service = FakeService(lambda entries: {"signed_txns": []})
+    with BatchingSigner("http://sign", "t", max_batch=2, pool=service) as signer:
+        futures = [signer.submit("0xa", "t0"), signer.submit("0xa", "t1")]
+        for future in futures:
+            with pytest.raises(SignerError):
+                future.result(timeout=5)
+
+
+def test_missing_signature_fails_only_its_entry():
+    def reply(entries):
+        return [{"tx_bytes": "t0", "signed_txn": "s0"}, {"tx_bytes": "t1"}]
+
+    service = FakeService(reply)
+    with BatchingSigner("http://sign", "t", max_batch=2, pool=service) as signer:
+        good, bad = signer.submit("0xa", "t0"), signer.submit("0xa", "t1")
+        assert good.result(timeout=5)[1] == "s0"
+        with pytest.raises(SignerError):
+            bad.result(timeout=5)
+
+
+def test_signature_of_other_transaction_is_refused():
+    service = FakeService(lambda entries: [{"tx_bytes": "x", "signed_txn": "s"}])
+    with BatchingSigner("http://sign", "t", max_batch=1, pool=service) as signer:
+        with pytest.raises(SignerError):
+            signer.sign("0xa", "t0")
+
+
+def test_closed_signer_refuses_entries():
+    signer = BatchingSigner("http://sign", "t", pool=FakeService())
+    signer.close()
+    with pytest.raises(SignerError):
+        signer.submit("0xa", "t0")
+
+
+def test_sign_async():
+    async def main(signer):
+        return await asyncio.gather(
+            signer.sign_async("0xa", "t0"), signer.sign_async("0xa", "t1")
+        )
+
+    service = FakeService()
+    with BatchingSigner("http://sign", "t", max_batch=2, pool=service) as signer:
+        results = asyncio.run(main(signer))
+    assert [r[1] for r in results] == ["sig(t0)", "sig(t1)"]
+    assert service.batches == [["t0", "t1"]]
+
+
+def test_local_signer_signature_verifies():
+    nacl = pytest.importorskip("nacl.signing")
+    seed = bytes(range(32))
+    signer = LocalSigner({"0xa": base64.b64encode(seed).decode()})
+    tx_bytes = base64.b64encode(b"transaction").decode()
+    flag, signature, pub_key = signer("0xa", tx_bytes)
+    assert flag == ED25519
+    assert pub_key == signer.public_key("0xa")
+    verify_key = nacl.VerifyKey(base64.b64decode(pub_key))
+    verify_key.verify(b"transaction", base64.b64decode(signature))
+    assert asyncio.run(signer.sign_async("0xa", tx_bytes)) == (flag, signature, pub_key)
+    with pytest.raises(SignerError):
+        signer.sign("0xb", tx_bytes)
+
+
+def test_signer_is_abstract():
+    with pytest.raises(TypeError):
+        Signer()
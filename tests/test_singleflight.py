@@ -0,0 +1,147 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pysui.client.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def run_concurrently(flight, n, fn, key="k"):
+    """
+    Call flight.do(key, fn) from `n` threads, returns the results or exceptions
+    """
+    results = [None] * n
+
+    def call(i):
+        try:
+            results[i] = flight.do(key, fn)
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    return threads, results
+
+
+def wait_for_waiters(flight, n):
+    deadline = time.monotonic() + 5
+    while flight.stats()["shared"] < n:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_concurrent_calls_share_one_request():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return {"result": 1}
+
+    threads, results = run_concurrently(flight, 5, fn)
+    wait_for_waiters(flight, 4)
+    release.set()
+    for t in threads:
+        t.join(5)
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert flight.stats() == dict(calls=5, shared=4)
+
+
+def test_error_reaches_every_waiter():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fn():
+        release.wait(5)
+        raise ConnectionError("down")
+
+    threads, results = run_concurrently(flight, 3, fn)
+    wait_for_waiters(flight, 2)
+    release.set()
+    for t in threads:
+        t.join(5)
+    assert all(isinstance(r, ConnectionError) for r in results)
+
+
+def test_key_is_freed_after_the_call():
+    flight = SingleFlight()
+    with pytest.raises(ValueError):
+        flight.do("k", lambda: int("x"))
+    assert flight.do("k", lambda: 1) == 1
+    assert flight.do("k", lambda: 2) == 2
+    assert flight.stats() == dict(calls=3, shared=0)
+
+
+def test_different_keys_do_not_share():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+
+
+def test_async_concurrent_calls_share_one_request():
+    async def main():
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await release.wait()
+            return {"result": 1}
+
+        tasks = [asyncio.ensure_future(flight.do("k", fn)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+        assert flight.stats() == dict(calls=5, shared=4)
+        assert await flight.do("k", fn) == {"result": 1}
+        assert len(calls) == 2
+
+    asyncio.run(main())
+
+
+def test_async_error_reaches_every_waiter():
+    async def main():
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def fn():
+            await release.wait()
+            raise ConnectionError("down")
+
+        tasks = [asyncio.ensure_future(flight.do("k", fn)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert flight._calls == {}
+
+    asyncio.run(main())
+
+
+def test_async_cancelling_one_caller_keeps_the_request():
+    async def main():
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def fn():
+            await release.wait()
+            return 1
+
+        first = asyncio.ensure_future(flight.do("k", fn))
+        second = asyncio.ensure_future(flight.do("k", fn))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        assert await second == 1
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(main())
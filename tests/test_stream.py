@@ -0,0 +1,92 @@
+import json
+import random
+
+import pytest
+
+from pysui.client.client import SuiClient
+from pysui.rpc.exceptions import CircuitOpenError, RequestsError, RPCError
+from pysui.rpc.stream import ResultStream
+
+
+def feed_in_chunks(raw, rng, stream=None):
+    stream = stream or ResultStream("m", "e")
+    items = []
+    pos = 0
+    while pos < len(raw):
+        size = rng.randint(1, 7)
+        items += stream.feed(raw[pos : pos + size])
+        pos += size
+    stream.close()
+    return items
+
+
+def test_yields_elements_across_chunks():
+    rng = random.Random(1)
+    result = [1, 'a]"}', {"x": [1, {"y": "}"}]}, [], None, -350.0, "ü", 10**30]
+    for doc in (
+        {"jsonrpc": "2.0", "id": 1, "result": result},
+        {"result": result, "id": "s", "jsonrpc": "2.0"},
+    ):
+        for indent in (None, 2):
+            raw = json.dumps(doc, indent=indent, ensure_ascii=False).encode()
+            assert feed_in_chunks(raw, rng) == result
+
+
+def test_empty_result():
+    assert feed_in_chunks(b'{"result": []}', random.Random(2)) == []
+
+
+def test_ignores_data_after_result():
+    stream = ResultStream()
+    assert stream.feed(b'{"result": [1, 2]') == [1, 2]
+    assert stream.done
+    assert stream.feed(b', "id": 1}') == []
+
+
+def test_error_reply():
+    stream = ResultStream()
+    with pytest.raises(RPCError) as info:
+        stream.feed(b'{"jsonrpc":"2.0","error":{"code":-32000,"message":"x"},"id":1}')
+    assert info.value.code == -32000
+
+
+@pytest.mark.parametrize("raw", [b"busy", b'{"result": 5}', b'{"id": 1}'])
+def test_invalid_reply(raw):
+    with pytest.raises(RPCError):
+        feed_in_chunks(raw, random.Random(3))
+
+
+def test_truncated_reply():
+    stream = ResultStream()
+    assert stream.feed(b'{"result": [1, 2') == [1]
+    with pytest.raises(RPCError):
+        stream.close()
+
+
+def test_iter_result_failure_reaches_breaker():
+    # a connection lost while reading the body counts against the endpoint
+    client = SuiClient("http://node", breaker=True)
+    client.breakers.kwargs.update(min_calls=2, failure_rate=0.5)
+
+    def broken_stream():
+        yield 1
+        raise RequestsError("http://node")
+
+    for _ in range(2):
+        items = client._guarded_iter("http://node", ["m"], broken_stream)
+        next(items)
+        with pytest.raises(RequestsError):
+            list(items)
+    with pytest.raises(CircuitOpenError):
+        next(client._guarded_iter("http://node", ["m"], broken_stream))
+
+
+def test_iter_result_closed_early_is_a_success():
+    client = SuiClient(endpoints=["http://node"], health_interval=0)
+    items = client._guarded_iter("http://node", ["m"], lambda: iter([1, 2, 3]))
+    next(items)
+    assert next(items) == 1
+    assert client.balancer.states["http://node"].in_flight == 1
+    items.close()
+    state = client.balancer.states["http://node"]
+    assert (state.in_flight, state.requests, state.errors) == (0, 1, 0)
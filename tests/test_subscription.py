@@ -0,0 +1,185 @@
+import asyncio
+import json
+
+import pytest
+import websockets
+from websockets.asyncio.server import serve
+
+from pysui.client.subscription import AsyncSubscriptionManager
+
+
+class FakeNode:
+    """
+    WebSocket node answering sui_subscribeEvent with increasing ids
+    """
+
+    def __init__(self):
+        self.connections = []
+        self.subscribed = []
+        self.next_id = 0
+
+    async def handler(self, ws):
+        self.connections.append(ws)
+        async for message in ws:
+            msg = json.loads(message)
+            if msg["method"] == "sui_subscribeEvent":
+                self.next_id += 1
+                self.subscribed.append((self.next_id, msg["params"][0]))
+                result = self.next_id
+            else:
+                result = True
+            await ws.send(
+                json.dumps({"jsonrpc": "2.0", "id": msg["id"], "result": result})
+            )
+
+    async def emit(self, sub_id, event, ws=None):
+        ws = ws or self.connections[-1]
+        await ws.send(
+            json.dumps(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "sui_subscribeEvent",
+                    "params": {"subscription": sub_id, "result": event},
+                }
+            )
+        )
+
+
+def run(test):
+    async def main():
+        node = FakeNode()
+        async with serve(node.handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            await test(node, f"ws://127.0.0.1:{port}")
+
+    asyncio.run(asyncio.wait_for(main(), 10))
+
+
+async def until(condition):
+    while not condition():
+        await asyncio.sleep(0.005)
+
+
+def test_events_reach_their_subscription():
+    async def test(node, url):
+        async with AsyncSubscriptionManager(url) as manager:
+            a = await manager.subscribe({"All": []})
+            b = await manager.subscribe({"Sender": "0xa"})
+            await node.emit(b.id, {"n": 1, "timestamp": 5})
+            await node.emit(a.id, {"n": 2})
+            assert await anext(aiter(a)) == {"n": 2}
+            assert await anext(aiter(b)) == {"n": 1, "timestamp": 5}
+            assert b.last_timestamp == 5
+            await manager.unsubscribe(a)
+            assert manager.subscriptions == [b]
+
+    run(test)
+
+
+def test_reconnect_subscribes_again():
+    async def test(node, url):
+        reconnected = []
+        async with AsyncSubscriptionManager(
+            url, reconnect_delay=0.01, on_reconnect=reconnected.append
+        ) as manager:
+            sub = await manager.subscribe({"All": []})
+            first_id = sub.id
+            await node.connections[0].close()
+            await until(lambda: reconnected)
+            assert reconnected == [sub]
+            assert sub.id != first_id
+            assert node.subscribed == [(1, {"All": []}), (2, {"All": []})]
+            await node.emit(sub.id, {"n": 1})
+            assert await anext(aiter(sub)) == {"n": 1}
+
+    run(test)
+
+
+def test_failing_reconnect_hook_does_not_stop_the_manager():
+    async def test(node, url):
+        calls = []
+
+        def hook(sub):
+            calls.append(sub)
+            if len(calls) == 1:
+                raise RuntimeError("hook failed")
+
+        async with AsyncSubscriptionManager(
+            url, reconnect_delay=0.01, on_reconnect=hook
+        ) as manager:
+            sub = await manager.subscribe({"All": []})
+            await node.connections[0].close()
+            await until(lambda: len(calls) == 2)
+            await manager.connect()
+            await node.emit(sub.id, {"n": 1})
+            assert await anext(aiter(sub)) == {"n": 1}
+
+    run(test)
+
+
+def test_invalid_message_is_skipped():
+    async def test(node, url):
+        async with AsyncSubscriptionManager(url) as manager:
+            sub = await manager.subscribe({"All": []})
+            await node.connections[0].send("not json")
+            await node.emit(sub.id, {"n": 1})
+            assert await anext(aiter(sub)) == {"n": 1}
+            assert len(node.connections) == 1
+
+    run(test)
+
+
+@pytest.mark.parametrize("drop_oldest, kept", [(False, [0, 1]), (True, [3, 4])])
+def test_full_queue_drops(drop_oldest, kept):
+    async def test(node, url):
+        async with AsyncSubscriptionManager(url, queue_size=2) as manager:
+            sub = await manager.subscribe({"All": []}, drop_oldest=drop_oldest)
+            other = await manager.subscribe({"Sender": "0xa"})
+            for n in range(5):
+                await node.emit(sub.id, n)
+            await node.emit(other.id, "other")
+            # the full queue does not hold back the other subscription
+            assert await anext(aiter(other)) == "other"
+            assert sub.dropped == 3
+            assert [sub.queue.get_nowait() for _ in range(2)] == kept
+
+    run(test)
+
+
+def test_max_wait_holds_the_connection_instead_of_dropping():
+    async def test(node, url):
+        async with AsyncSubscriptionManager(
+            url, queue_size=1, max_wait=None
+        ) as manager:
+            sub = await manager.subscribe({"All": []})
+            for n in range(5):
+                await node.emit(sub.id, n)
+            received = []
+            for _ in range(5):
+                received.append(await anext(aiter(sub)))
+                await asyncio.sleep(0.01)
+            assert received == list(range(5))
+            assert sub.dropped == 0
+
+    run(test)
+
+
+def test_bounded_wait_drops_after_timeout():
+    async def test(node, url):
+        async with AsyncSubscriptionManager(url, queue_size=1) as manager:
+            sub = await manager.subscribe({"All": []}, max_wait=0.01)
+            for n in range(3):
+                await node.emit(sub.id, n)
+            await until(lambda: sub.dropped == 2)
+            assert sub.queue.get_nowait() == 0
+
+    run(test)
+
+
+def test_call_while_disconnected():
+    async def test(node, url):
+        manager = AsyncSubscriptionManager(url)
+        with pytest.raises(websockets.exceptions.ConnectionClosed):
+            await manager._call("sui_subscribeEvent", [{"All": []}])
+
+    run(test)